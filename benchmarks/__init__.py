@@ -0,0 +1 @@
+"""Benchmarks of MondayClient against a local mock GraphQL server."""
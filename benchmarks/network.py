@@ -0,0 +1,359 @@
+"""Serve a MockMondayServer over real sockets, with HTTP/1.1 or HTTP/2.
+
+The mock server alone is an in-process transport, which hides the cost of
+connections. NetworkServer puts it behind a TCP listener on localhost, in a
+process of its own, so that HTTP/1.1 and HTTP/2 can be compared:
+
+    with NetworkServer(MockMondayServer()) as network:
+        client = MondayClient("key", transport=network.transport(http2=True))
+
+HTTP/2 is spoken over cleartext with prior knowledge, since there is no TLS to
+negotiate it with ALPN as against api.monday.com. It requires the h2 package.
+"""
+
+import asyncio
+import multiprocessing
+from multiprocessing.connection import Connection
+from types import TracebackType
+
+import h11
+import httpx
+
+from .server import MockMondayServer
+
+READ_SIZE = 64 * 1024
+# Large enough for bursts of new connections not to be dropped and retried.
+BACKLOG = 4_096
+HTTP2_PREFACE = b"PRI * HTTP/2.0"
+
+
+class NetworkServer:
+    """Serve a MockMondayServer on a port of localhost, from another process.
+
+    The server gets its own process, rather than a thread, so that it doesn't
+    compete with the client for the GIL: handing each request and response over
+    between threads would otherwise dominate the timings.
+
+    Attributes:
+        app (MockMondayServer): The server answering the requests. Its stats are
+            updated when the server stops.
+        port (int): The port listened on, once started.
+        connections (int): The number of TCP connections accepted, once stopped.
+    """
+
+    def __init__(self: "NetworkServer", app: MockMondayServer) -> None:
+        """Initialize a new instance of NetworkServer.
+
+        Args:
+            app (MockMondayServer): The server answering the requests.
+        """
+        self.app = app
+        self.port = 0
+        self.connections = 0
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._pipe: Connection | None = None
+
+    def start(self: "NetworkServer") -> None:
+        """Start listening."""
+        context = multiprocessing.get_context("spawn")
+        self._pipe, pipe = context.Pipe()
+        self._process = context.Process(
+            target=_listen,
+            args=(self.app, pipe),
+            daemon=True,
+        )
+        self._process.start()
+        self.port = self._pipe.recv()
+
+    def stop(self: "NetworkServer") -> None:
+        """Stop listening, and collect the counters of the server."""
+        if self._process is None:
+            return
+        self._pipe.send(None)
+        self.connections, self.app.stats = self._pipe.recv()
+        self._process.join()
+        self._process = self._pipe = None
+
+    def transport(
+        self: "NetworkServer",
+        *,
+        http2: bool = False,
+    ) -> httpx.AsyncBaseTransport:
+        """Return a transport sending the requests of a client to this server.
+
+        As with `MondayClient(http2=True)`, file uploads keep using HTTP/1.1.
+
+        Args:
+            http2 (bool, optional): Whether to speak HTTP/2 rather than HTTP/1.1.
+
+        Returns:
+            httpx.AsyncBaseTransport: Pools with the client's default limits.
+        """
+        from src.monday.graphql.client import DEFAULT_LIMITS
+
+        http1 = httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS)
+        if not http2:
+            return _LocalTransport(self.port, http1, http1)
+        return _LocalTransport(
+            self.port,
+            httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS, http1=False, http2=True),
+            http1,
+        )
+
+    def __enter__(self: "NetworkServer") -> "NetworkServer":  # noqa: D105
+        self.start()
+        return self
+
+    def __exit__(  # noqa: D105
+        self: "NetworkServer",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+def _listen(app: MockMondayServer, pipe: Connection) -> None:
+    """Serve until the pipe says to stop, then send the counters back."""
+    listener = _Listener(app)
+    asyncio.run(listener.run(pipe))
+    pipe.send((listener.connections, app.stats))
+
+
+class _Listener:
+    """Speak HTTP/1.1 or HTTP/2 on each connection, as the client starts it."""
+
+    def __init__(self: "_Listener", app: MockMondayServer) -> None:
+        self.app = app
+        self.port = 0
+        self.connections = 0
+
+    async def run(self: "_Listener", pipe: Connection) -> None:
+        server = await asyncio.start_server(
+            self._serve,
+            "127.0.0.1",
+            0,
+            backlog=BACKLOG,
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        pipe.send(self.port)
+        await asyncio.to_thread(pipe.recv)
+        server.close()
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _serve(
+        self: "_Listener",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.connections += 1
+        try:
+            data = await reader.read(READ_SIZE)
+            if data.startswith(HTTP2_PREFACE):
+                await self._serve_http2(reader, writer, data)
+            else:
+                await self._serve_http1(reader, writer, data)
+        except (ConnectionError, h11.ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def _answer(
+        self: "_Listener",
+        method: str,
+        path: str,
+        headers: list[tuple[str, str]],
+        body: bytes,
+    ) -> tuple[httpx.Response, bytes]:
+        """Return the response of the app and its body, still compressed."""
+        request = httpx.Request(
+            method,
+            f"http://127.0.0.1:{self.port}{path}",
+            headers=headers,
+            content=body,
+        )
+        response = await self.app.handle_async_request(request)
+        return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+    async def _serve_http1(
+        self: "_Listener",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        data: bytes,
+    ) -> None:
+        connection = h11.Connection(h11.SERVER)
+        connection.receive_data(data)
+        request: h11.Request | None = None
+        body: list[bytes] = []
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(READ_SIZE))
+            elif isinstance(event, h11.Request):
+                request, body = event, []
+            elif isinstance(event, h11.Data):
+                body.append(event.data)
+            elif isinstance(event, h11.EndOfMessage):
+                headers = request.headers
+                response, content = await self._answer(
+                    request.method.decode(),
+                    request.target.decode(),
+                    [(name.decode(), value.decode()) for name, value in headers],
+                    b"".join(body),
+                )
+                head = h11.Response(
+                    status_code=response.status_code,
+                    headers=response.headers.multi_items(),
+                )
+                writer.write(
+                    connection.send(head)
+                    + connection.send(h11.Data(data=content))
+                    + connection.send(h11.EndOfMessage()),
+                )
+                await writer.drain()
+                connection.start_next_cycle()
+            else:
+                return
+
+    async def _serve_http2(
+        self: "_Listener",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        data: bytes,
+    ) -> None:
+        connection = _HTTP2Connection(self, writer)
+        while data:
+            if not await connection.receive(data):
+                return
+            await writer.drain()
+            data = await reader.read(READ_SIZE)
+
+
+class _HTTP2Connection:
+    """Answer the streams of an HTTP/2 connection, each in a task of its own."""
+
+    def __init__(
+        self: "_HTTP2Connection",
+        listener: _Listener,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        import h2.config
+        import h2.connection
+
+        self.listener = listener
+        self.writer = writer
+        self.connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8"),
+        )
+        self.connection.initiate_connection()
+        self.window = asyncio.Condition()
+        self.streams: dict[int, tuple[list[tuple[str, str]], list[bytes]]] = {}
+        self.tasks: set[asyncio.Task] = set()
+
+    async def receive(self: "_HTTP2Connection", data: bytes) -> bool:
+        """Handle the frames received, and return whether the connection is open."""
+        import h2.events
+
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.streams[event.stream_id] = (event.headers, [])
+            elif isinstance(event, h2.events.DataReceived):
+                self.streams[event.stream_id][1].append(event.data)
+                self.connection.acknowledge_received_data(
+                    event.flow_controlled_length,
+                    event.stream_id,
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                task = asyncio.create_task(
+                    self.respond(event.stream_id, *self.streams.pop(event.stream_id)),
+                )
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            elif isinstance(event, h2.events.WindowUpdated):
+                async with self.window:
+                    self.window.notify_all()
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                return False
+        self.writer.write(self.connection.data_to_send())
+        return True
+
+    async def respond(
+        self: "_HTTP2Connection",
+        stream_id: int,
+        headers: list[tuple[str, str]],
+        body: list[bytes],
+    ) -> None:
+        fields = dict(headers)
+        response, content = await self.listener._answer(
+            fields[":method"],
+            fields[":path"],
+            [(name, value) for name, value in headers if name[0] != ":"],
+            b"".join(body),
+        )
+        self.connection.send_headers(
+            stream_id,
+            [
+                (":status", str(response.status_code)),
+                *(
+                    (name.lower(), value)
+                    for name, value in response.headers.multi_items()
+                ),
+            ],
+        )
+        await self.send_body(stream_id, memoryview(content))
+        self.connection.end_stream(stream_id)
+        self.writer.write(self.connection.data_to_send())
+
+    async def send_body(
+        self: "_HTTP2Connection",
+        stream_id: int,
+        content: memoryview,
+    ) -> None:
+        """Send a body in frames, waiting whenever the flow control window is full."""
+        while content:
+            size = min(
+                self.connection.local_flow_control_window(stream_id),
+                self.connection.max_outbound_frame_size,
+            )
+            if size <= 0:
+                async with self.window:
+                    await self.window.wait()
+                continue
+            self.connection.send_data(stream_id, content[:size].tobytes())
+            content = content[size:]
+            self.writer.write(self.connection.data_to_send())
+
+
+class _LocalTransport(httpx.AsyncBaseTransport):
+    """Send the requests for any host to a port of localhost."""
+
+    def __init__(
+        self: "_LocalTransport",
+        port: int,
+        transport: httpx.AsyncBaseTransport,
+        upload_transport: httpx.AsyncBaseTransport,
+    ) -> None:
+        self._port = port
+        self._transport = transport
+        self._upload_transport = upload_transport
+
+    async def handle_async_request(  # noqa: D102
+        self: "_LocalTransport",
+        request: httpx.Request,
+    ) -> httpx.Response:
+        request.url = request.url.copy_with(
+            scheme="http",
+            host="127.0.0.1",
+            port=self._port,
+        )
+        if request.url.path.endswith("/file"):
+            return await self._upload_transport.handle_async_request(request)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self: "_LocalTransport") -> None:  # noqa: D102
+        await self._transport.aclose()
+        if self._upload_transport is not self._transport:
+            await self._upload_transport.aclose()
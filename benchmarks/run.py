@@ -0,0 +1,315 @@
+"""Benchmark the main code paths of MondayClient against a local mock server.
+
+Each scenario runs in a fresh interpreter, so that its peak RSS is its own. It
+is run once for the timings, then once more under tracemalloc to measure the
+peak of allocated memory without slowing down the timed run.
+
+The mock server is reached in process by default. With `--protocol http1` or
+`--protocol http2`, it is served over sockets instead, to compare protocols.
+Responses are gzipped unless `--encoding identity`.
+
+    python -m benchmarks.run
+    python -m benchmarks.run pagination uploads --latency 0.02 --json results.json
+    python -m benchmarks.run mutation-burst --protocol http2
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from src.monday.client import MondayClient
+from src.monday.graphql.events import REQUEST_END, Event
+from src.monday.graphql.retry import RetryPolicy
+from src.monday.resources.files import ColumnTarget
+
+from .network import NetworkServer
+from .server import MockMondayServer, ServerStats
+from .startup import measure as measure_startup
+
+ROOT = Path(__file__).resolve().parent.parent
+PROTOCOLS = ("mock", "http1", "http2")
+ENCODINGS = ("gzip", "identity")
+
+
+@dataclass
+class Options:
+    """The size of the workload and the behaviour of the server."""
+
+    items: int = 20_000
+    boards: int = 8
+    mutations: int = 2_000
+    files: int = 200
+    file_size: int = 256 * 1024
+    latency: float = 0.005
+    error_rate: float = 0.0
+    runs: int = 10
+    protocol: str = "mock"
+    encoding: str = "gzip"
+
+
+@dataclass
+class Result:
+    """The measurements of one scenario."""
+
+    scenario: str
+    operations: int
+    seconds: float
+    requests: int
+    p50_ms: float | None
+    p99_ms: float | None
+    peak_allocated_mb: float
+    peak_rss_mb: float
+    connections: int = 0
+    response_mb: float = 0.0
+    response_encoded_mb: float = 0.0
+
+    @property
+    def throughput(self: "Result") -> float:
+        """Return the number of operations per second."""
+        return self.operations / self.seconds if self.seconds else 0.0
+
+
+Scenario = Callable[[MondayClient, Options], Awaitable[int]]
+
+
+async def pagination(client: MondayClient, options: Options) -> int:
+    """Iterate over every item of a board, page by page."""
+    return sum([1 async for _ in client.items.iter_items("1", limit=500)])
+
+
+async def pagination_stream(client: MondayClient, options: Options) -> int:
+    """Iterate over every item of a board, decoding pages while they arrive."""
+    return sum([1 async for _ in client.items.iter_items("1", stream=True)])
+
+
+async def pagination_boards(client: MondayClient, options: Options) -> int:
+    """Iterate over the items of several boards concurrently."""
+    board_ids = [str(index + 1) for index in range(options.boards)]
+    items = client.items.iter_boards_items(board_ids, limit=500)
+    return sum([1 async for _ in items])
+
+
+async def mutation_burst(client: MondayClient, options: Options) -> int:
+    """Send many independent mutations at once."""
+    await asyncio.gather(
+        *(
+            client.columns.change_column_value("1", "text_0", "x", str(index))
+            for index in range(options.mutations)
+        ),
+    )
+    return options.mutations
+
+
+async def mutation_bulk(client: MondayClient, options: Options) -> int:
+    """Send many mutations, batched into aliased documents."""
+    results = await client.columns.change_multiple_column_values_bulk(
+        "1",
+        ((str(index), {"text_0": "x"}) for index in range(options.mutations)),
+    )
+    return len(results)
+
+
+async def uploads(client: MondayClient, options: Options) -> int:
+    """Upload many files concurrently."""
+    content = b"%PDF" + bytes(options.file_size - 4)
+    results = await client.files.upload_files(
+        (ColumnTarget(str(index), "files"), content)
+        for index in range(options.files)
+    )
+    return len(results)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "pagination": pagination,
+    "pagination-stream": pagination_stream,
+    "pagination-boards": pagination_boards,
+    "mutation-burst": mutation_burst,
+    "mutation-bulk": mutation_bulk,
+    "uploads": uploads,
+}
+
+
+def run_scenario(name: str, options: Options) -> Result:
+    """Run a scenario in this process and measure it."""
+    latencies: list[float] = []
+
+    def record(event: Event) -> None:
+        if event.kind == REQUEST_END:
+            latencies.append(event.latency)
+
+    async def run(*, traced: bool) -> tuple[int, float, int, ServerStats]:
+        server = MockMondayServer(
+            boards=options.boards,
+            items_per_board=options.items,
+            latency=options.latency,
+            rate_limit_rate=options.error_rate / 2,
+            complexity_error_rate=options.error_rate / 2,
+            encoding=options.encoding,
+        )
+        network = None
+        transport: httpx.AsyncBaseTransport = server
+        if options.protocol != "mock":
+            network = NetworkServer(server)
+            network.start()
+            transport = network.transport(http2=options.protocol == "http2")
+        try:
+            async with MondayClient(
+                "key",
+                transport=transport,
+                hooks=[] if traced else [record],
+                retry=RetryPolicy(backoff_base=0.001, retry_mutations=True),
+            ) as client:
+                start = time.perf_counter()
+                operations = await SCENARIOS[name](client, options)
+                seconds = time.perf_counter() - start
+        finally:
+            if network is not None:
+                network.stop()
+        connections = network.connections if network else 0
+        return operations, seconds, connections, server.stats
+
+    operations, seconds, connections, stats = asyncio.run(run(traced=False))
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    asyncio.run(run(traced=True))
+    peak_allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    p50, p99 = _percentiles(latencies)
+    return Result(
+        scenario=name,
+        operations=operations,
+        seconds=seconds,
+        requests=stats.requests,
+        p50_ms=p50,
+        p99_ms=p99,
+        peak_allocated_mb=peak_allocated / 1e6,
+        # Kilobytes on Linux, bytes on macOS.
+        peak_rss_mb=peak_rss / (1e6 if sys.platform == "darwin" else 1e3),
+        connections=connections,
+        response_mb=stats.response_bytes / 1e6,
+        response_encoded_mb=stats.response_encoded_bytes / 1e6,
+    )
+
+
+def run_cold_start(options: Options) -> Result:
+    """Measure import, construction and first resource access."""
+    timings = measure_startup(options.runs)
+    totals = [sum(run) for run in zip(*timings.values(), strict=True)]
+    p50, p99 = _percentiles([total / 1_000 for total in totals])
+    return Result(
+        scenario="cold-start",
+        operations=options.runs,
+        seconds=sum(totals) / 1_000,
+        requests=0,
+        p50_ms=p50,
+        p99_ms=p99,
+        peak_allocated_mb=0.0,
+        peak_rss_mb=0.0,
+    )
+
+
+def _percentiles(seconds: list[float]) -> tuple[float | None, float | None]:
+    if not seconds:
+        return None, None
+    if len(seconds) == 1:
+        return seconds[0] * 1_000, seconds[0] * 1_000
+    quantiles = statistics.quantiles(seconds, n=100, method="inclusive")
+    return quantiles[49] * 1_000, quantiles[98] * 1_000
+
+
+def _flag(name: str) -> str:
+    return f"--{name.replace("_", "-")}"
+
+
+def _format(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main() -> int:
+    """Run the selected scenarios, each in its own interpreter, and report.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    names = [*SCENARIOS, "cold-start"]
+    parser.add_argument("scenarios", nargs="*", help=f"Any of {", ".join(names)}.")
+    defaults = Options()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(_flag(name), type=type(value), help=f"Default: {value}.")
+    parser.add_argument("--json", type=Path, help="Also write the results here.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+    unknown = set(arguments.scenarios) - set(names)
+    if unknown:
+        parser.error(f"unknown scenarios: {", ".join(sorted(unknown))}")
+    if arguments.protocol not in (None, *PROTOCOLS):
+        parser.error(f"--protocol must be one of {", ".join(PROTOCOLS)}")
+    if arguments.encoding not in (None, *ENCODINGS):
+        parser.error(f"--encoding must be one of {", ".join(ENCODINGS)}")
+    options = Options(
+        **{
+            name: getattr(arguments, name)
+            for name in asdict(defaults)
+            if getattr(arguments, name) is not None
+        },
+    )
+
+    if arguments.child:
+        print(json.dumps(asdict(run_scenario(arguments.child, options))))
+        return 0
+
+    results = []
+    for name in arguments.scenarios or names:
+        if name == "cold-start":
+            results.append(run_cold_start(options))
+            continue
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.run",
+                "--child",
+                name,
+                *(f"{_flag(key)}={value}" for key, value in asdict(options).items()),
+            ],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        results.append(Result(**json.loads(output)))
+
+    columns = ("ops", "seconds", "ops/s", "requests", "p50 ms", "p99 ms")
+    columns += ("alloc MB", "RSS MB", "conns", "body MB", "wire MB")
+    print(f"{"scenario":<20}" + "".join(f"{column:>10}" for column in columns))
+    for result in results:
+        print(
+            f"{result.scenario:<20}{result.operations:>10}{result.seconds:>10.3f}"
+            f"{result.throughput:>10.0f}{result.requests:>10}"
+            f"{_format(result.p50_ms):>10}{_format(result.p99_ms):>10}"
+            f"{result.peak_allocated_mb:>10.1f}{result.peak_rss_mb:>10.1f}"
+            f"{result.connections:>10}{result.response_mb:>10.1f}"
+            f"{result.response_encoded_mb:>10.1f}",
+        )
+    if arguments.json:
+        arguments.json.write_text(
+            json.dumps([asdict(result) for result in results], indent=2),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
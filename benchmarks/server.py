@@ -0,0 +1,278 @@
+"""A local stand-in for the Monday.com GraphQL API.
+
+MockMondayServer is an httpx transport, so clients talk to it without sockets:
+
+    server = MockMondayServer(items_per_board=10_000, latency=0.02)
+    client = MondayClient("key", transport=server)
+
+It answers the queries sent by the library with generated payloads shaped like
+the API's, paginates items_page with cursors, accounts for a complexity budget,
+compresses responses as the client accepts, and can inject rate limits and
+complexity errors.
+"""
+
+import asyncio
+import gzip
+import json
+import random
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+import httpx
+
+from src.monday.graphql.events import operation_name
+
+ALIAS_PATTERN = re.compile(r"\b(\w+)\s*:\s*(\w+)\s*\(")
+CURSOR_PATTERN = re.compile(r"^(\d+):(\d+)$")
+# The compression level of the responses, a usual one for web servers.
+GZIP_LEVEL = 6
+CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class ServerStats:
+    """Counters of the requests answered by a MockMondayServer."""
+
+    requests: int = 0
+    rate_limited: int = 0
+    complexity_errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    response_encoded_bytes: int = 0
+    operations: dict[str, int] = field(default_factory=dict)
+
+
+class MockMondayServer(httpx.AsyncBaseTransport):
+    """Serve realistic responses of the GraphQL and file upload endpoints.
+
+    Attributes:
+        stats (ServerStats): What the server has answered so far.
+    """
+
+    def __init__(
+        self: "MockMondayServer",
+        *,
+        boards: int = 10,
+        items_per_board: int = 1_000,
+        columns: int = 10,
+        users: int = 100,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        complexity_error_rate: float = 0.0,
+        budget: int = 10_000_000,
+        seed: int = 0,
+        encoding: str = "gzip",
+    ) -> None:
+        """Initialize a new instance of MockMondayServer.
+
+        Args:
+            boards (int, optional): The number of boards of the account.
+            items_per_board (int, optional): The number of items of each board.
+            columns (int, optional): The number of column values of each item.
+            users (int, optional): The number of users of the account.
+            latency (float, optional): The time to answer a request, in seconds.
+            jitter (float, optional): A random extra time, up to this many
+                seconds, added to the latency.
+            rate_limit_rate (float, optional): The fraction of requests rejected
+                with 429 Too Many Requests.
+            complexity_error_rate (float, optional): The fraction of requests
+                rejected for an exhausted complexity budget.
+            budget (int, optional): The complexity budget per minute.
+            seed (int, optional): The seed of the generated errors and jitter.
+            encoding (str, optional): The compression of responses, "gzip" or
+                "identity", used when the request accepts it.
+        """
+        self.boards = boards
+        self.items_per_board = items_per_board
+        self.columns = columns
+        self.users = users
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.complexity_error_rate = complexity_error_rate
+        self.budget = budget
+        self.remaining = budget
+        self.encoding = encoding
+        self.stats = ServerStats()
+        # Seeded for reproducible latencies and failures, not for security.
+        self._random = random.Random(seed)  # noqa: S311
+
+    async def handle_async_request(
+        self: "MockMondayServer",
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Answer a request after the configured latency."""
+        self.stats.requests += 1
+        if request.url.path.endswith("/file"):
+            query, size = await self._read_upload(request)
+            variables: dict = {}
+        else:
+            body = await request.aread()
+            size = len(body)
+            payload = json.loads(body)
+            query = payload["query"]
+            variables = payload.get("variables") or {}
+        self.stats.request_bytes += size
+        accepted = request.headers.get("Accept-Encoding", "")
+        gzipped = self.encoding == "gzip" and "gzip" in accepted
+
+        delay = self.latency + self._random.random() * self.jitter
+        if delay:
+            await asyncio.sleep(delay)
+
+        draw = self._random.random()
+        if draw < self.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if draw < self.rate_limit_rate + self.complexity_error_rate:
+            self.stats.complexity_errors += 1
+            return self._json({"errors": [COMPLEXITY_ERROR]}, gzipped=gzipped)
+
+        name = operation_name(query)
+        self.stats.operations[name] = self.stats.operations.get(name, 0) + 1
+        data = self._answer(query, variables)
+        cost = 10 * max(len(data), 1)
+        if self.remaining < cost:
+            self.remaining = self.budget
+        data["_complexity"] = {
+            "before": self.remaining,
+            "after": self.remaining - cost,
+            "reset_in_x_seconds": 60,
+        }
+        self.remaining -= cost
+        return self._json({"data": data}, gzipped=gzipped)
+
+    def _json(
+        self: "MockMondayServer",
+        payload: dict,
+        *,
+        gzipped: bool,
+    ) -> httpx.Response:
+        content = json.dumps(payload, separators=(",", ":")).encode()
+        self.stats.response_bytes += len(content)
+        headers = {"Content-Type": "application/json"}
+        if gzipped:
+            content = gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        self.stats.response_encoded_bytes += len(content)
+        headers["Content-Length"] = str(len(content))
+        return httpx.Response(200, headers=headers, stream=_Body(content))
+
+    async def _read_upload(
+        self: "MockMondayServer",
+        request: httpx.Request,
+    ) -> tuple[str, int]:
+        """Drain a multipart upload, keeping only the start holding the query."""
+        head = b""
+        size = 0
+        async for chunk in request.stream:
+            if len(head) < 4_096:
+                head += chunk[:4_096]
+            size += len(chunk)
+        text = head.decode("utf-8", "replace")
+        start = text.find("mutation")
+        return text[start : text.find("\r\n", start)], size
+
+    def _answer(self: "MockMondayServer", query: str, variables: dict) -> dict:
+        if query.lstrip().startswith("mutation"):
+            return self._mutation(query)
+        fields = operation_name(query).partition(" ")[2].split(",")
+        data: dict = {}
+        for name in fields:
+            if name == "boards":
+                data["boards"] = self._boards(query, variables)
+            elif name == "next_items_page":
+                data["next_items_page"] = self._page(
+                    variables["cursor"],
+                    variables.get("limit", 25),
+                )
+            elif name == "users":
+                data["users"] = [_user(index) for index in range(self.users)]
+            else:
+                data[name] = []
+        return data
+
+    def _mutation(self: "MockMondayServer", query: str) -> dict:
+        aliases = [alias for alias, _ in ALIAS_PATTERN.findall(query)]
+        if aliases:
+            return {alias: {"id": str(index)} for index, alias in enumerate(aliases)}
+        fields = operation_name(query).partition(" ")[2].split(",")
+        return {name: {"id": "1"} for name in fields}
+
+    def _boards(self: "MockMondayServer", query: str, variables: dict) -> list[dict]:
+        ids = variables.get("board_ids") or variables.get("ids")
+        if ids is None:
+            ids = [str(index + 1) for index in range(self.boards)]
+        elif isinstance(ids, str | int):
+            ids = [ids]
+        boards = []
+        for board_id in ids:
+            board = {"id": str(board_id), "name": f"Board {board_id}"}
+            if "items_page" in query:
+                board["items_page"] = self._page(
+                    f"{board_id}:0",
+                    variables.get("limit", 25),
+                )
+            boards.append(board)
+        return boards
+
+    def _page(self: "MockMondayServer", cursor: str, limit: int) -> dict:
+        match = CURSOR_PATTERN.match(cursor)
+        if match is None:
+            return {"cursor": None, "items": []}
+        board_id, start = match.group(1), int(match.group(2))
+        end = min(start + limit, self.items_per_board)
+        return {
+            "cursor": f"{board_id}:{end}" if end < self.items_per_board else None,
+            "items": [self._item(board_id, index) for index in range(start, end)],
+        }
+
+    def _item(self: "MockMondayServer", board_id: str, index: int) -> dict:
+        return {
+            "id": f"{board_id}{index:07d}",
+            "name": f"Item {index} of board {board_id}",
+            "created_at": "2024-05-01T12:00:00Z",
+            "updated_at": "2024-05-02T08:30:00Z",
+            "state": "active",
+            "group": {"id": "topics", "title": "Topics"},
+            "column_values": [
+                {
+                    "id": f"text_{column}",
+                    "type": "text",
+                    "text": f"Value {column} of item {index}",
+                    "value": json.dumps(f"Value {column} of item {index}"),
+                }
+                for column in range(self.columns)
+            ],
+        }
+
+
+class _Body(httpx.AsyncByteStream):
+    """Stream a response body in chunks, as it would arrive from the network."""
+
+    def __init__(self: "_Body", content: bytes) -> None:
+        self._content = content
+
+    async def __aiter__(self: "_Body") -> AsyncIterator[bytes]:  # noqa: D105
+        for start in range(0, len(self._content), CHUNK_SIZE):
+            yield self._content[start : start + CHUNK_SIZE]
+
+
+def _user(index: int) -> dict:
+    return {
+        "id": str(index + 1),
+        "name": f"User {index}",
+        "email": f"user{index}@example.com",
+        "enabled": True,
+        "is_admin": index == 0,
+        "created_at": "2023-01-01T00:00:00Z",
+        "time_zone_identifier": "Europe/Paris",
+    }
+
+
+COMPLEXITY_ERROR = {
+    "message": "Complexity budget exhausted, reset in 0 seconds",
+    "extensions": {"code": "COMPLEXITY_BUDGET_EXHAUSTED", "retry_in_seconds": 0},
+}
@@ -0,0 +1,82 @@
+"""Benchmark the import and startup time of MondayClient.
+
+Each run is a fresh interpreter, so nothing is cached between runs. Use the
+thresholds to fail a CI job when startup regresses:
+
+    python -m benchmarks.startup --runs 20 --max-import-ms 150 --max-startup-ms 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+from src.monday import MondayClient
+imported = time.perf_counter()
+client = MondayClient("key")
+created = time.perf_counter()
+client.items
+accessed = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "startup": created - imported,
+    "first_resource": accessed - created,
+}))
+"""
+
+
+def measure(runs: int) -> dict[str, list[float]]:
+    """Run the probe in `runs` fresh interpreters.
+
+    Returns:
+        dict: The timings of each phase in milliseconds, one per run.
+    """
+    timings: dict[str, list[float]] = {}
+    for _ in range(runs):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", PROBE],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for phase, seconds in json.loads(output).items():
+            timings.setdefault(phase, []).append(seconds * 1_000)
+    return timings
+
+
+def main() -> int:
+    """Print the median timings and check them against the thresholds.
+
+    Returns:
+        int: The exit status, 1 if a threshold is exceeded.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-startup-ms", type=float)
+    arguments = parser.parse_args()
+
+    timings = measure(arguments.runs)
+    medians = {phase: statistics.median(values) for phase, values in timings.items()}
+    for phase, median in medians.items():
+        print(f"{phase:<16}{median:8.2f} ms  (min {min(timings[phase]):.2f} ms)")
+
+    limits = {"import": arguments.max_import_ms, "startup": arguments.max_startup_ms}
+    failed = False
+    for phase, limit in limits.items():
+        if limit is not None and medians[phase] > limit:
+            print(f"{phase} took {medians[phase]:.2f} ms, over {limit:.2f} ms")
+            failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
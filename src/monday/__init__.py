@@ -1,3 +1,21 @@
-from .client import MondayClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["MondayClient"]
+if TYPE_CHECKING:
+    from .client import MondayClient
+    from .sync import SyncMondayClient
+
+__all__ = ["MondayClient", "SyncMondayClient"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the clients on first use, so that importing a submodule stays cheap."""
+    if name == "MondayClient":
+        from .client import MondayClient
+
+        return MondayClient
+    if name == "SyncMondayClient":
+        from .sync import SyncMondayClient
+
+        return SyncMondayClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,92 @@
+"""Batch the mutations of a MondayClient's resources."""
+
+import asyncio
+import functools
+import inspect
+from typing import TYPE_CHECKING, Any
+
+from .graphql.batch import DEFAULT_CHUNK_SIZE, MutationBatch
+from .resources.base import BaseResource
+
+if TYPE_CHECKING:
+    from .client import MondayClient
+
+
+class Batch(MutationBatch):
+    """MutationBatch exposing the resources of a MondayClient.
+
+    Calling a mutation method on one of the batch's resources doesn't wait for
+    the API: it returns an asyncio.Task that resolves once the chunk holding the
+    mutation has been sent.
+
+    Example:
+        async with client.batch() as batch:
+            for item_id, value in values.items():
+                batch.columns.change_column_value(board_id, "status", value, item_id)
+        failed = [result for result in batch.results if not result.ok]
+    """
+
+    def __init__(
+        self: "Batch",
+        client: "MondayClient",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_complexity: int | None = None,
+    ) -> None:
+        """Initialize a new instance of Batch.
+
+        Args:
+            client (MondayClient): The client whose resources are batched.
+            chunk_size (int, optional): The maximum number of mutations per
+                document. Defaults to DEFAULT_CHUNK_SIZE.
+            max_complexity (int, optional): The maximum complexity of a document.
+                Defaults to a tenth of the scheduler's budget.
+        """
+        super().__init__(
+            client._client,
+            chunk_size=chunk_size,
+            max_complexity=max_complexity,
+        )
+        self._monday = client
+
+    def __getattr__(self: "Batch", name: str) -> "_BatchedResource":  # noqa: D105
+        resource = getattr(self._monday, name)
+        if not isinstance(resource, BaseResource):
+            raise AttributeError(name)
+        bound = type(resource)(
+            api_key=resource.api_key,
+            api_version=resource.api_version,
+            client=self,
+            client_file_upload=resource.client_file_upload,
+        )
+        batched = _BatchedResource(bound, self)
+        self.__dict__[name] = batched
+        return batched
+
+
+class _BatchedResource:
+    """Resource whose methods are scheduled on a batch instead of awaited."""
+
+    def __init__(
+        self: "_BatchedResource",
+        resource: BaseResource,
+        batch: Batch,
+    ) -> None:
+        self._resource = resource
+        self._batch = batch
+
+    def __getattr__(self: "_BatchedResource", name: str) -> Any:  # noqa: ANN401
+        attribute = getattr(self._resource, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def schedule(*args: Any, **kwargs: Any) -> asyncio.Task:  # noqa: ANN401
+            return self._batch.schedule(attribute(*args, **kwargs))
+
+        return schedule
+
+    def __repr__(self: "_BatchedResource") -> str:  # noqa: D105
+        return f"Batched{self._resource!r}"
+
+
+__all__ = ["Batch"]
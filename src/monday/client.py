@@ -1,46 +1,238 @@
 """Client for the Monday.com API."""
 
-from .resources import (
-    BoardResource,
-    ColumnResource,
-    FolderResource,
-    GroupResource,
-    ItemResource,
-    NotificationResource,
-    TagResource,
-    TeamResource,
-    UpdateResource,
-    UserResource,
-    VersionResource,
-    WebhookResource,
-    WorkspaceResource,
-)
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from . import resources
+from .graphql.cache import QueryCache
+from .graphql.client import DEFAULT_TIMEOUT, GraphQLClient, create_http_client
+from .graphql.codec import JSONCodec
+from .graphql.events import Hook
+from .graphql.retry import RetryPolicy
+from .graphql.scheduler import ComplexityBudget, ComplexityScheduler
+from .resources.base import URLS
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .batch import Batch
+    from .resources import (
+        BoardResource,
+        ColumnResource,
+        FileResource,
+        FolderResource,
+        GroupResource,
+        ItemResource,
+        NotificationResource,
+        TagResource,
+        TeamResource,
+        UpdateResource,
+        UserResource,
+        VersionResource,
+        WebhookResource,
+        WorkspaceResource,
+    )
+
+
+class _Resource:
+    """Create a resource of the client, importing its module, on first access."""
+
+    def __init__(self: "_Resource", name: str) -> None:
+        self.name = name
+        self.attribute = ""
+
+    def __set_name__(self: "_Resource", owner: type, name: str) -> None:
+        self.attribute = name
+
+    def __get__(
+        self: "_Resource",
+        instance: "MondayClient | None",
+        owner: type | None = None,
+    ) -> Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        resource = getattr(resources, self.name)(**instance._resource_kwargs)
+        # Cached on the instance, which takes precedence over this descriptor.
+        instance.__dict__[self.attribute] = resource
+        return resource
 
 
 class MondayClient:
-    """Client for the Monday.com API."""
+    """Client for the Monday.com API.
+
+    Every resource shares a single keep-alive connection pool, which is released
+    with `aclose()` or by using the client as an async context manager, and a
+    single scheduler that paces requests against the complexity budget. Passing a
+    QueryCache enables caching of slow-changing metadata such as boards, columns,
+    users, tags and versions. JSON is handled by orjson or msgspec when one of
+    them is installed, see `get_codec`. Hooks receive an Event at each step of
+    every request, see `graphql.events` and the adapters of `graphql.telemetry`.
+    A custom httpx transport, such as the mock server of the benchmarks, can
+    replace the network. With `http2=True`, concurrent requests share a single
+    HTTP/2 connection when the h2 package is installed, see `create_http_client`;
+    file uploads keep using HTTP/1.1. Responses are compressed unless
+    `compression=False`.
+
+    Creating a client is cheap: the connection pool is only opened by the first
+    request, and each resource is imported and created the first time it is
+    accessed.
+    """
 
     def __init__(  # noqa: D107
         self: "MondayClient",
         api_key: str,
         api_version: str | None = None,
+        *,
+        limits: "httpx.Limits | None" = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        scheduler: ComplexityScheduler | None = None,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JSONCodec | None = None,
+        hooks: Iterable[Hook] | None = None,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+        http2: bool = False,
+        compression: bool = True,
     ) -> None:
-        self.boards = BoardResource(api_key=api_key, api_version=api_version)
-        self.columns = ColumnResource(api_key=api_key, api_version=api_version)
-        self.folders = FolderResource(api_key=api_key, api_version=api_version)
-        self.groups = GroupResource(api_key=api_key, api_version=api_version)
-        self.items = ItemResource(api_key=api_key, api_version=api_version)
-        self.notifications = NotificationResource(
+        self._limits = limits
+        self._transport = transport
+        self._http2 = http2
+        self._compression = compression
+        self._timeout = timeout
+        self._http_client: httpx.AsyncClient | None = None
+        self._upload_http_client: httpx.AsyncClient | None = None
+        self.scheduler = scheduler or ComplexityScheduler()
+        self.cache = cache
+        self._client = GraphQLClient(
+            endpoint=URLS["prod"],
             api_key=api_key,
             api_version=api_version,
+            http_client=self._get_http_client,
+            timeout=timeout,
+            scheduler=self.scheduler,
+            retry=retry,
+            cache=cache,
+            codec=codec,
+        )
+        self._client_file_upload = GraphQLClient(
+            endpoint=URLS["file"],
+            api_key=api_key,
+            api_version=api_version,
+            http_client=self._get_upload_http_client,
+            timeout=timeout,
+            scheduler=self.scheduler,
+            retry=retry,
+            cache=cache,
+            codec=codec,
+        )
+        # Both endpoints report to the same, mutable, list of hooks.
+        self.hooks: list[Hook] = list(hooks or ())
+        self._client.hooks = self._client_file_upload.hooks = self.hooks
+        self._resource_kwargs = {
+            "api_key": api_key,
+            "api_version": api_version,
+            "client": self._client,
+            "client_file_upload": self._client_file_upload,
+        }
+
+    boards: "BoardResource" = _Resource("BoardResource")
+    columns: "ColumnResource" = _Resource("ColumnResource")
+    files: "FileResource" = _Resource("FileResource")
+    folders: "FolderResource" = _Resource("FolderResource")
+    groups: "GroupResource" = _Resource("GroupResource")
+    items: "ItemResource" = _Resource("ItemResource")
+    notifications: "NotificationResource" = _Resource("NotificationResource")
+    tags: "TagResource" = _Resource("TagResource")
+    teams: "TeamResource" = _Resource("TeamResource")
+    updates: "UpdateResource" = _Resource("UpdateResource")
+    users: "UserResource" = _Resource("UserResource")
+    versions: "VersionResource" = _Resource("VersionResource")
+    webhooks: "WebhookResource" = _Resource("WebhookResource")
+    workspaces: "WorkspaceResource" = _Resource("WorkspaceResource")
+
+    @property
+    def http_client(self: "MondayClient") -> "httpx.AsyncClient":
+        """Return the shared connection pool, creating it on first use."""
+        return self._get_http_client()
+
+    def _get_http_client(self: "MondayClient") -> "httpx.AsyncClient":
+        if self._http_client is None:
+            self._http_client = create_http_client(
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+                http2=self._http2,
+                compression=self._compression,
+            )
+        return self._http_client
+
+    def _get_upload_http_client(self: "MondayClient") -> "httpx.AsyncClient":
+        """Return the pool of file uploads, which never use HTTP/2.
+
+        Large bodies gain nothing from multiplexing, are slowed down by HTTP/2
+        flow control, and can stall when several are sent at once over the same
+        connection by httpcore. Uploads get a pool of their own in HTTP/1.1.
+        """
+        if not self._http2 or self._transport is not None:
+            return self._get_http_client()
+        if self._upload_http_client is None:
+            self._upload_http_client = create_http_client(
+                limits=self._limits,
+                timeout=self._timeout,
+                compression=self._compression,
+            )
+        return self._upload_http_client
+
+    @property
+    def complexity_budget(self: "MondayClient") -> ComplexityBudget:
+        """Return a snapshot of the account's remaining complexity budget."""
+        return self.scheduler.budget
+
+    def batch(
+        self: "MondayClient",
+        chunk_size: int | None = None,
+        max_complexity: int | None = None,
+    ) -> "Batch":
+        """Return a batch that packs mutations into shared GraphQL documents.
+
+        Args:
+            chunk_size (int, optional): The maximum number of mutations per
+                document. Defaults to DEFAULT_CHUNK_SIZE.
+            max_complexity (int, optional): The maximum complexity of a document.
+                Defaults to a tenth of the scheduler's budget.
+
+        Returns:
+            Batch: A batch exposing this client's resources.
+        """
+        from .batch import Batch
+        from .graphql.batch import DEFAULT_CHUNK_SIZE
+
+        return Batch(
+            self,
+            chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+            max_complexity=max_complexity,
         )
-        self.tags = TagResource(api_key=api_key, api_version=api_version)
-        self.teams = TeamResource(api_key=api_key, api_version=api_version)
-        self.updates = UpdateResource(api_key=api_key, api_version=api_version)
-        self.users = UserResource(api_key=api_key, api_version=api_version)
-        self.versions = VersionResource(api_key=api_key, api_version=api_version)
-        self.webhooks = WebhookResource(api_key=api_key, api_version=api_version)
-        self.workspaces = WorkspaceResource(api_key=api_key, api_version=api_version)
+
+    async def aclose(self: "MondayClient") -> None:
+        """Close the shared connection pools."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._upload_http_client is not None:
+            await self._upload_http_client.aclose()
+            self._upload_http_client = None
+
+    async def __aenter__(self: "MondayClient") -> "MondayClient":  # noqa: D105
+        return self
+
+    async def __aexit__(  # noqa: D105
+        self: "MondayClient",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
 
     # def __repr__(self: "MondayClient") -> str:  # noqa: D105
     #     return f"MondayClient {__version__}"
@@ -26,3 +26,22 @@ class MondayQueryError(MondayError):
         self.query = query
         self.variables = variables
         super().__init__(message)
+
+
+class MondayComplexityError(MondayError):
+    """Raised when a query exceeds the account's complexity budget."""
+
+    def __init__(
+        self: "MondayComplexityError",
+        message: str,
+        retry_in_seconds: float | None = None,
+    ) -> None:
+        """Initialize a new instance of MondayComplexityError."""
+        self.retry_in_seconds = retry_in_seconds
+        super().__init__(message)
+
+
+class CassetteError(MondayError):
+    """Raised when a cassette can't be read or has no response for a request."""
+
+    pass
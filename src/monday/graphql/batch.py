@@ -0,0 +1,329 @@
+"""Combine many mutations into a few GraphQL documents using aliases."""
+
+import asyncio
+import re
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from src.monday.exceptions import MondayError
+
+from .client import GraphQLClient, is_mutation
+from .codec import JSONCodec
+
+DEFAULT_CHUNK_SIZE = 50
+MUTATION_PATTERN = re.compile(
+    r"^\s*mutation\s*(?:\w+\s*)?"
+    r"(?:\((?P<definitions>[^)]*)\))?"
+    r"\s*\{(?P<body>.*)\}\s*$",
+    re.DOTALL,
+)
+FIELD_PATTERN = re.compile(r"^\s*(\w+)")
+VARIABLE_PATTERN = re.compile(r"\$(\w+)")
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Outcome of one operation of a batch.
+
+    Attributes:
+        data (dict | None): The response of the operation, shaped like the
+            response of the same operation sent on its own.
+        error (Exception | None): The error raised for this operation, if any.
+    """
+
+    data: dict | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self: "BatchResult") -> bool:
+        """Return whether the operation succeeded."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class _Operation:
+    field: str
+    definitions: str
+    body: str
+    variables: dict | None
+    invalidates: tuple[str, ...]
+    future: asyncio.Future
+
+
+class MutationBatch:
+    """Collect mutations and send them as aliased fields of shared documents.
+
+    A MutationBatch can stand in for a GraphQLClient: every mutation passed to
+    `execute` is queued and resolved once the chunk it belongs to has been sent,
+    while queries are forwarded to the underlying client right away. Chunks are
+    sent when they fill up and when the batch is flushed or its context exits.
+
+    Example:
+        async with MutationBatch(client) as batch:
+            for query in mutations:
+                batch.add(query)
+        failed = [result for result in batch.results if not result.ok]
+    """
+
+    def __init__(
+        self: "MutationBatch",
+        client: GraphQLClient,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_complexity: int | None = None,
+    ) -> None:
+        """Initialize a new instance of MutationBatch.
+
+        Args:
+            client (GraphQLClient): The client used to send the documents.
+            chunk_size (int, optional): The maximum number of mutations per
+                document. Defaults to DEFAULT_CHUNK_SIZE.
+            max_complexity (int, optional): The maximum complexity of a document.
+                Once the cost of a chunk is known, later chunks are resized to stay
+                below it. Defaults to a tenth of the scheduler's budget.
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_complexity = max_complexity or client.scheduler.limit // 10
+        self._next_size = chunk_size
+        self._queue: list[_Operation] = []
+        # The outcome of each scheduled coroutine, and of each mutation executed
+        # outside of one, in submission order.
+        self._futures: list[asyncio.Future] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+        self._queued = asyncio.Event()
+        self._flushes: set[asyncio.Task] = set()
+
+    @property
+    def codec(self: "MutationBatch") -> JSONCodec:
+        """Return the JSON codec of the client sending the documents."""
+        return self.client.codec
+
+    @property
+    def results(self: "MutationBatch") -> list[BatchResult]:
+        """Return the result of every settled submission, in submission order.
+
+        Each scheduled coroutine has one result, its return value or the error it
+        raised, even before queuing a mutation. So has each mutation executed
+        outside of a scheduled coroutine.
+        """
+        results = []
+        for future in self._futures:
+            if not future.done() or future.cancelled():
+                continue
+            error = future.exception()
+            results.append(
+                BatchResult(error=error)
+                if error is not None
+                else BatchResult(data=future.result()),
+            )
+        return results
+
+    async def __aenter__(self: "MutationBatch") -> "MutationBatch":  # noqa: D105
+        return self
+
+    async def __aexit__(  # noqa: D105
+        self: "MutationBatch",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+        else:
+            for task in self._tasks:
+                task.cancel()
+
+    def add(
+        self: "MutationBatch",
+        query: str,
+        variables: dict | None = None,
+    ) -> asyncio.Task:
+        """Queue a mutation document without waiting for its result.
+
+        Args:
+            query (str): A mutation with a single root field.
+            variables (dict, optional): The variables of the mutation.
+
+        Returns:
+            asyncio.Task: Resolves to the mutation's response.
+        """
+        return self.schedule(self.execute(query, variables))
+
+    def schedule(self: "MutationBatch", coroutine: Any) -> asyncio.Task:  # noqa: ANN401
+        """Run a coroutine that sends its mutations through this batch.
+
+        Args:
+            coroutine (Coroutine): Typically a resource method bound to this batch.
+
+        Returns:
+            asyncio.Task: The task running the coroutine.
+        """
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        self._futures.append(task)
+        return task
+
+    async def execute(
+        self: "MutationBatch",
+        query: str,
+        variables: dict | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> dict:
+        """Queue a mutation and wait for the response of its chunk.
+
+        Queries and documents that can't be aliased are sent on their own.
+
+        Args:
+            query (str): The GraphQL document.
+            variables (dict, optional): The variables of the document.
+            **kwargs: Passed on to GraphQLClient.execute for unbatched documents.
+
+        Returns:
+            dict: The response, shaped as if the mutation had been sent alone.
+        """
+        match = MUTATION_PATTERN.match(query) if is_mutation(query) else None
+        field = FIELD_PATTERN.match(match.group("body")) if match else None
+        if match is None or field is None:
+            return await self.client.execute(query, variables, **kwargs)
+
+        future = asyncio.get_running_loop().create_future()
+        if asyncio.current_task() not in self._tasks:
+            self._futures.append(future)
+        self._queue.append(
+            _Operation(
+                field=field.group(1),
+                definitions=match.group("definitions") or "",
+                body=match.group("body").strip(),
+                variables=variables,
+                invalidates=tuple(kwargs.get("invalidates") or ()),
+                future=future,
+            ),
+        )
+        self._queued.set()
+        if len(self._queue) >= self._next_size:
+            flush = asyncio.ensure_future(self._send_ready())
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        return await future
+
+    async def flush(self: "MutationBatch") -> None:
+        """Send every queued mutation and wait for all scheduled work to settle.
+
+        Errors of the scheduled coroutines aren't raised: they are reported by
+        `results`.
+        """
+        while True:
+            # Let newly scheduled coroutines run up to the point where they queue
+            # their mutation, then send everything that is queued.
+            await asyncio.sleep(0)
+            await self._send_ready(force=True)
+            pending = {task for task in self._tasks if not task.done()}
+            pending.update(self._flushes)
+            if not pending:
+                break
+            self._queued.clear()
+            queued = asyncio.ensure_future(self._queued.wait())
+            await asyncio.wait({*pending, queued}, return_when=asyncio.FIRST_COMPLETED)
+            queued.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _send_ready(self: "MutationBatch", *, force: bool = False) -> None:
+        async with self._lock:
+            while self._queue and (force or len(self._queue) >= self._next_size):
+                chunk = self._queue[: self._next_size]
+                del self._queue[: self._next_size]
+                await self._send(chunk)
+
+    async def _send(self: "MutationBatch", chunk: list[_Operation]) -> None:
+        chunk = [operation for operation in chunk if not operation.future.done()]
+        if not chunk:
+            return
+        query, variables = _document(chunk)
+        invalidates = {tag for operation in chunk for tag in operation.invalidates}
+        try:
+            response = await self.client.execute(
+                query,
+                variables,
+                raise_errors=False,
+                invalidates=invalidates,
+            )
+        except Exception as error:  # noqa: BLE001
+            for operation in chunk:
+                if not operation.future.done():
+                    operation.future.set_exception(error)
+            return
+
+        self._resize(response, len(chunk))
+        _settle(chunk, response)
+
+    def _resize(self: "MutationBatch", response: dict, size: int) -> None:
+        complexity = (response.get("extensions") or {}).get("complexity") or {}
+        before = complexity.get("before")
+        after = complexity.get("after")
+        if before is None or after is None or before <= after:
+            return
+        cost_per_operation = (before - after) / size
+        self._next_size = max(
+            1,
+            min(self.chunk_size, int(self.max_complexity // cost_per_operation)),
+        )
+
+
+def _document(chunk: list[_Operation]) -> tuple[str, dict | None]:
+    """Return a document aliasing the operations of a chunk, and its variables."""
+    definitions = []
+    fields = []
+    variables = {}
+    for index, operation in enumerate(chunk, start=1):
+        alias = f"m{index}"
+        declared = set(VARIABLE_PATTERN.findall(operation.definitions))
+        if operation.definitions:
+            definitions.append(
+                _rename_variables(operation.definitions, declared, alias),
+            )
+        fields.append(
+            f"{alias}: {_rename_variables(operation.body, declared, alias)}",
+        )
+        for name, value in (operation.variables or {}).items():
+            variables[f"{alias}_{name}"] = value
+
+    header = f"({', '.join(definitions)})" if definitions else ""
+    return f"mutation {header} {{ {' '.join(fields)} }}", variables or None
+
+
+def _settle(chunk: list[_Operation], response: dict) -> None:
+    """Resolve each operation of a chunk with its part of the response."""
+    data = response.get("data") or {}
+    errors: dict[str, list[dict]] = {}
+    shared_errors = []
+    for error in response.get("errors") or ():
+        path = error.get("path") or ()
+        if path:
+            errors.setdefault(str(path[0]), []).append(error)
+        else:
+            shared_errors.append(error)
+
+    for index, operation in enumerate(chunk, start=1):
+        if operation.future.done():
+            continue
+        alias = f"m{index}"
+        operation_errors = errors.get(alias) or shared_errors
+        if operation_errors:
+            message = operation_errors[0].get("message", operation_errors[0])
+            operation.future.set_exception(MondayError(message))
+        else:
+            operation.future.set_result(
+                {"data": {operation.field: data.get(alias)}},
+            )
+
+
+def _rename_variables(text: str, declared: set[str], alias: str) -> str:
+    """Prefix the declared variables of an operation with its alias."""
+
+    def rename(match: re.Match) -> str:
+        name = match.group(1)
+        return f"${alias}_{name}" if name in declared else match.group(0)
+
+    return VARIABLE_PATTERN.sub(rename, text)
@@ -0,0 +1,171 @@
+"""Time-bounded LRU cache for the responses of read-only queries."""
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .query import minify
+
+DEFAULT_MAXSIZE = 1_024
+DEFAULT_TTL = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of a QueryCache.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to reach the API.
+        size (int): The number of responses currently cached.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: dict
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class QueryCache:
+    """Cache query responses by normalized query and variables.
+
+    Every entry is tagged, e.g. `columns:1234` or `boards:*` for unfiltered
+    listings. The tag namespace (the part before the colon) selects the entry's
+    time to live, and invalidating a tag drops every entry that carries it. When
+    the cache is full, the least recently used entry is evicted.
+
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self: "QueryCache",
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize a new instance of QueryCache.
+
+        Args:
+            maxsize (int, optional): The maximum number of cached responses.
+            ttl (float, optional): The default time to live in seconds.
+            ttls (dict, optional): Times to live by tag namespace, for example
+                {"versions": 3600, "columns": 300}.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    @property
+    def stats(self: "QueryCache") -> CacheStats:
+        """Return the cache's hit and miss counters."""
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries))
+
+    @staticmethod
+    def key(query: str, variables: dict | None = None) -> str:
+        """Return the cache key of a query.
+
+        Whitespace outside of string literals is collapsed, so documents that only
+        differ in formatting share the same key.
+
+        Args:
+            query (str): The GraphQL document.
+            variables (dict, optional): The variables of the document.
+
+        Returns:
+            str: The cache key.
+        """
+        normalized = minify(query)
+        if not variables:
+            return normalized
+        return f"{normalized}\n{json.dumps(variables, sort_keys=True, default=str)}"
+
+    def get(self: "QueryCache", key: str) -> dict | None:
+        """Return a cached response, or None when it is missing or expired.
+
+        Args:
+            key (str): The cache key, as returned by `key`.
+
+        Returns:
+            dict | None: The cached response.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(
+        self: "QueryCache",
+        key: str,
+        value: dict,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            key (str): The cache key, as returned by `key`.
+            value (dict): The response to cache.
+            tags ([str], optional): The tags used to expire and invalidate it.
+        """
+        tags = tuple(tags)
+        ttl = min(
+            (self.ttls.get(tag.partition(":")[0], self.ttl) for tag in tags),
+            default=self.ttl,
+        )
+        if ttl <= 0:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value, time.monotonic() + ttl, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self: "QueryCache", *tags: str) -> int:
+        """Drop every response carrying one of the tags.
+
+        Args:
+            *tags (str): The tags to invalidate, e.g. "columns:1234".
+
+        Returns:
+            int: The number of responses dropped.
+        """
+        keys = set()
+        for tag in tags:
+            keys.update(self._tags.get(tag, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self: "QueryCache") -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self: "QueryCache", key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
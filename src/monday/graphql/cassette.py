@@ -0,0 +1,363 @@
+"""Record the traffic of a client to a cassette, and replay it without network.
+
+A cassette is a gzipped file of JSON lines, one per response, keyed by a hash
+of the request. Recording a job once against the API, then replaying it, lets
+the job be profiled or benchmarked offline on production-shaped data:
+
+    recorder = RecordingTransport("job.jsonl.gz")
+    async with MondayClient(api_key, transport=recorder) as client:
+        await run_job(client)
+
+    replayer = ReplayTransport("job.jsonl.gz", speed=1.0)
+    async with MondayClient(api_key, transport=replayer) as client:
+        await run_job(client)
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, dataclass
+from typing import IO
+
+import httpx
+
+from src.monday.exceptions import ArgumentError, CassetteError
+
+CASSETTE_VERSION = 1
+REPLAY_CHUNK_SIZE = 64 * 1024
+# Headers that identify a response rather than describe it.
+SKIPPED_HEADERS = frozenset({"set-cookie", "date", "cf-ray", "x-request-id"})
+BOUNDARY_PLACEHOLDER = b"cassette-boundary"
+
+
+@dataclass(slots=True)
+class CassetteEntry:
+    """A recorded response and the request it answered.
+
+    Attributes:
+        key (str): The hash of the method, URL and body of the request.
+        method (str): The method of the request.
+        url (str): The URL of the request.
+        status (int): The status of the response.
+        headers (list[list[str]]): The headers of the response.
+        body (str): The body of the response as sent by the API, still
+            compressed if it was, in base64.
+        elapsed (float): The number of seconds between sending the request and
+            receiving the whole response.
+    """
+
+    key: str
+    method: str
+    url: str
+    status: int
+    headers: list[list[str]]
+    body: str
+    elapsed: float
+
+
+def read_cassette(path: str | os.PathLike) -> Iterator[CassetteEntry]:
+    """Read the entries of a cassette, in the order they were recorded.
+
+    A cassette whose recording was interrupted is read up to its last complete
+    entry.
+
+    Args:
+        path (str | os.PathLike): The path of the cassette.
+
+    Yields:
+        CassetteEntry: Each recorded response.
+
+    Raises:
+        CassetteError: If the file isn't a cassette of a supported version.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("version") != CASSETTE_VERSION:
+            msg = f"{os.fspath(path)} is not a version {CASSETTE_VERSION} cassette."
+            raise CassetteError(msg)
+        try:
+            for line in file:
+                if not line.endswith("\n"):
+                    # An entry cut short by the end of the recording.
+                    return
+                yield CassetteEntry(**json.loads(line))
+        except EOFError:
+            # The gzip stream of an interrupted recording isn't terminated.
+            return
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Send requests through another transport and record their responses.
+
+    Responses are still streamed to the client while they are recorded, and
+    each one is appended and flushed to the cassette once its body has been
+    read, so a job that fails halfway, or is killed, leaves a usable cassette.
+    Only the response headers are recorded, never the request's, which carry
+    the API key.
+
+    Attributes:
+        path (str | os.PathLike): The path of the cassette, overwritten.
+    """
+
+    def __init__(
+        self: "RecordingTransport",
+        path: str | os.PathLike,
+        transport: httpx.AsyncBaseTransport | None = None,
+        *,
+        limits: httpx.Limits | None = None,
+    ) -> None:
+        """Initialize a new instance of RecordingTransport.
+
+        Args:
+            path (str | os.PathLike): The path of the cassette to write.
+            transport (httpx.AsyncBaseTransport, optional): The transport sending
+                the requests. Defaults to an HTTP connection pool.
+            limits (httpx.Limits, optional): The limits of the default pool,
+                which the client's own limits don't apply to once a transport
+                is given. Defaults to DEFAULT_LIMITS.
+        """
+        from .client import DEFAULT_LIMITS
+
+        self.path = path
+        self._transport = transport or httpx.AsyncHTTPTransport(
+            limits=limits or DEFAULT_LIMITS,
+        )
+        self._file: IO[str] | None = None
+
+    async def handle_async_request(  # noqa: D102
+        self: "RecordingTransport",
+        request: httpx.Request,
+    ) -> httpx.Response:
+        key = RequestKey(request)
+        try:
+            key.update(request.content)
+        except httpx.RequestNotRead:
+            # A streamed body, such as an upload, is hashed while it is sent.
+            request.stream = _HashingStream(request.stream, key)
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(self, request, response, key, started),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self: "RecordingTransport") -> None:  # noqa: D102
+        await self._transport.aclose()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def record(self: "RecordingTransport", entry: CassetteEntry) -> None:
+        """Append an entry to the cassette, creating it on the first call."""
+        if self._file is None:
+            self._file = gzip.open(self.path, "wt", encoding="utf-8")  # noqa: SIM115
+            self._file.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        self._file.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+        # Flushed to disk, so that the entry survives the process dying.
+        self._file.flush()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests with the responses recorded in a cassette.
+
+    Requests are matched on their method, URL and body, multipart boundaries
+    aside. Identical requests get the responses recorded for them in order,
+    such as the successive states of a polled board.
+
+    Attributes:
+        speed (float | None): How fast to replay: None answers at once, 1.0
+            waits as long as the API took, 2.0 half as long.
+        repeat (bool): Whether to start over with the first response once the
+            responses recorded for a request have all been replayed.
+    """
+
+    def __init__(
+        self: "ReplayTransport",
+        path: str | os.PathLike,
+        *,
+        speed: float | None = None,
+        repeat: bool = False,
+    ) -> None:
+        """Initialize a new instance of ReplayTransport.
+
+        Args:
+            path (str | os.PathLike): The path of the cassette to replay.
+            speed (float, optional): The replay speed relative to the recording.
+                Defaults to no delay at all.
+            repeat (bool, optional): Whether to replay the responses of a request
+                again once they have all been used, rather than failing.
+
+        Raises:
+            ArgumentError: If the speed isn't positive.
+            CassetteError: If the file isn't a cassette.
+        """
+        if speed is not None and speed <= 0:
+            msg = "The replay speed must be positive."
+            raise ArgumentError(msg)
+        self.speed = speed
+        self.repeat = repeat
+        self._entries: dict[str, list[CassetteEntry]] = {}
+        for entry in read_cassette(path):
+            self._entries.setdefault(entry.key, []).append(entry)
+        self._pending = {key: deque(entries) for key, entries in self._entries.items()}
+
+    async def handle_async_request(  # noqa: D102
+        self: "ReplayTransport",
+        request: httpx.Request,
+    ) -> httpx.Response:
+        key = RequestKey(request)
+        async for chunk in request.stream:
+            key.update(chunk)
+        entry = self._next(key.hexdigest(), request)
+        if self.speed is not None:
+            await asyncio.sleep(entry.elapsed / self.speed)
+        return httpx.Response(
+            entry.status,
+            headers=entry.headers,
+            stream=_ReplayStream(base64.b64decode(entry.body)),
+        )
+
+    def _next(
+        self: "ReplayTransport",
+        key: str,
+        request: httpx.Request,
+    ) -> CassetteEntry:
+        pending = self._pending.get(key)
+        if pending is None:
+            msg = f"No response was recorded for {request.method} {request.url}."
+            raise CassetteError(msg)
+        if not pending:
+            if not self.repeat:
+                msg = (
+                    f"Every response recorded for {request.method} {request.url} "
+                    "has been replayed."
+                )
+                raise CassetteError(msg)
+            pending.extend(self._entries[key])
+        return pending.popleft()
+
+
+class RequestKey:
+    """Hash a request as its body is streamed, ignoring multipart boundaries.
+
+    The boundary of a multipart upload is random, so it is replaced by a fixed
+    placeholder for two uploads of the same file to match.
+    """
+
+    def __init__(self: "RequestKey", request: httpx.Request) -> None:
+        """Initialize a new instance of RequestKey.
+
+        Args:
+            request (httpx.Request): The request, whose body is fed separately.
+        """
+        self._hash = hashlib.sha256(f"{request.method} {request.url}\n".encode())
+        content_type = request.headers.get("Content-Type", "")
+        _, _, boundary = content_type.partition("boundary=")
+        self._boundary = boundary.encode()
+        self._carry = b""
+
+    def update(self: "RequestKey", chunk: bytes) -> None:
+        """Add the next chunk of the body to the hash."""
+        if not self._boundary:
+            self._hash.update(chunk)
+            return
+        data = self._carry + chunk
+        head, boundary, data = data.rpartition(self._boundary)
+        if boundary:
+            self._hash.update(head.replace(self._boundary, BOUNDARY_PLACEHOLDER))
+            self._hash.update(BOUNDARY_PLACEHOLDER)
+        # A boundary split between chunks starts within the last few bytes.
+        cut = max(len(data) - len(self._boundary) + 1, 0)
+        self._hash.update(data[:cut])
+        self._carry = data[cut:]
+
+    def hexdigest(self: "RequestKey") -> str:
+        """Return the hash of the request."""
+        if self._carry:
+            self._hash.update(self._carry)
+            self._carry = b""
+        return self._hash.hexdigest()
+
+
+class _HashingStream(httpx.AsyncByteStream):
+    """Hash a request body while it is being sent."""
+
+    def __init__(
+        self: "_HashingStream",
+        stream: httpx.AsyncByteStream,
+        key: RequestKey,
+    ) -> None:
+        self._stream = stream
+        self._key = key
+
+    async def __aiter__(self: "_HashingStream") -> AsyncIterator[bytes]:  # noqa: D105
+        async for chunk in self._stream:
+            self._key.update(chunk)
+            yield chunk
+
+    async def aclose(self: "_HashingStream") -> None:  # noqa: D102
+        await self._stream.aclose()
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    """Stream a response to the client, recording it once it is complete."""
+
+    def __init__(
+        self: "_RecordingStream",
+        transport: RecordingTransport,
+        request: httpx.Request,
+        response: httpx.Response,
+        key: RequestKey,
+        started: float,
+    ) -> None:
+        self._transport = transport
+        self._request = request
+        self._response = response
+        self._key = key
+        self._started = started
+        self._chunks: list[bytes] = []
+
+    async def __aiter__(self: "_RecordingStream") -> AsyncIterator[bytes]:  # noqa: D105
+        async for chunk in self._response.stream:
+            self._chunks.append(chunk)
+            yield chunk
+        headers = [
+            [name, value]
+            for name, value in self._response.headers.multi_items()
+            if name.lower() not in SKIPPED_HEADERS
+        ]
+        self._transport.record(
+            CassetteEntry(
+                key=self._key.hexdigest(),
+                method=self._request.method,
+                url=str(self._request.url),
+                status=self._response.status_code,
+                headers=headers,
+                body=base64.b64encode(b"".join(self._chunks)).decode(),
+                elapsed=time.perf_counter() - self._started,
+            ),
+        )
+        self._chunks.clear()
+
+    async def aclose(self: "_RecordingStream") -> None:  # noqa: D102
+        await self._response.aclose()
+
+
+class _ReplayStream(httpx.AsyncByteStream):
+    """Stream a recorded body in chunks, as the network would."""
+
+    def __init__(self: "_ReplayStream", body: bytes) -> None:
+        self._body = body
+
+    async def __aiter__(self: "_ReplayStream") -> AsyncIterator[bytes]:  # noqa: D105
+        view = memoryview(self._body)
+        for start in range(0, len(view), REPLAY_CHUNK_SIZE):
+            yield bytes(view[start : start + REPLAY_CHUNK_SIZE])
@@ -1,52 +1,497 @@
 """Provide a GraphQL client to connect to Monday.com's GraphQL API."""
 
+import asyncio
+import functools
+import importlib.util
 import json
+import re
+import time
+import warnings
+from collections.abc import AsyncIterator, Callable, Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 
-import httpx
-from anyio import open_file
+from src.monday.exceptions import MondayComplexityError, MondayError
 
-from src.monday.exceptions import MondayError
+from .cache import QueryCache
+from .codec import JSONCodec, get_codec
+from .events import (
+    CACHE_HIT,
+    ERROR,
+    REQUEST_END,
+    REQUEST_START,
+    RETRY,
+    THROTTLE,
+    Event,
+    Hook,
+    current_resource,
+    emit,
+    next_request_id,
+    operation_name,
+)
+from .query import operation_type
+from .retry import RetryPolicy
+from .scheduler import ComplexityBudget, ComplexityScheduler
+from .stream import PageStreamParser
+from .upload import MultipartUpload, Upload
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_TIMEOUT = 120.0
+COMPLEXITY_ALIAS = "_complexity"
+COMPLEXITY_FIELD = (
+    f"{COMPLEXITY_ALIAS}: complexity {{ before after reset_in_x_seconds }}"
+)
+COMPLEXITY_ERROR_CODES = {"COMPLEXITY_BUDGET_EXHAUSTED", "ComplexityException"}
+RESET_IN_PATTERN = re.compile(r"reset in (\d+) seconds?")
+# Waits for the scheduler shorter than this aren't reported as throttling.
+THROTTLE_THRESHOLD = 0.001
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Build DEFAULT_LIMITS on first use, so that importing httpx is deferred."""
+    if name == "DEFAULT_LIMITS":
+        return _default_limits()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@functools.cache
+def _default_limits() -> "httpx.Limits":
+    import httpx
+
+    return httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=30.0,
+    )
+
+
+@functools.cache
+def accept_encoding() -> str:
+    """Return the Accept-Encoding header, listing what httpx can decompress.
+
+    Zstandard and Brotli compress JSON better than gzip, and are offered first
+    when the zstandard and brotli (or brotlicffi) packages are installed.
+    """
+    encodings = []
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    encodings.append("gzip")
+    return ", ".join(encodings)
+
+
+def create_http_client(
+    limits: "httpx.Limits | None" = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    transport: "httpx.AsyncBaseTransport | None" = None,
+    *,
+    http2: bool = False,
+    compression: bool = True,
+) -> "httpx.AsyncClient":
+    """Create a keep-alive HTTP client to be shared between GraphQL clients.
+
+    With HTTP/2, concurrent requests are multiplexed over a single connection
+    with compressed headers, instead of each holding a connection of its own.
+    HTTP/2 is negotiated with the server, so requests fall back to HTTP/1.1
+    when it isn't offered, and when the h2 package isn't installed.
+
+    Responses are compressed with the best encoding both sides support, see
+    `accept_encoding`, and decompressed chunk by chunk as they are read.
+
+    Args:
+        limits (httpx.Limits, optional): The connection pool limits.
+            Defaults to DEFAULT_LIMITS.
+        timeout (float, optional): The request timeout in seconds.
+            Defaults to DEFAULT_TIMEOUT.
+        transport (httpx.AsyncBaseTransport, optional): The transport sending the
+            requests, for example a mock server. Defaults to httpx's pool.
+        http2 (bool, optional): Whether to offer HTTP/2 to the server, which
+            requires the h2 package (`httpx[http2]`). Defaults to False.
+        compression (bool, optional): Whether to ask for compressed responses.
+            Defaults to True.
+
+    Returns:
+        httpx.AsyncClient: The pooled HTTP client.
+    """
+    import httpx
+
+    if http2 and importlib.util.find_spec("h2") is None:
+        warnings.warn(
+            "HTTP/2 requires the h2 package, install httpx[http2]. "
+            "Falling back to HTTP/1.1.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        http2 = False
+    return httpx.AsyncClient(
+        limits=limits or _default_limits(),
+        timeout=timeout,
+        transport=transport,
+        http2=http2,
+        headers={"Accept-Encoding": accept_encoding() if compression else "identity"},
+    )
 
 
 class GraphQLClient:
-    """GraphQL Client to connect to Monday GraphQL API."""
+    """GraphQL Client to connect to Monday GraphQL API.
+
+    Responses may be shared: identical queries in flight at the same time share
+    one request, and cached queries share one response. Callers receive the
+    same dict and must treat it as read-only, copying it before modifying it.
+    """
 
     def __init__(
         self: "GraphQLClient",
         endpoint: str,
         api_key: str | None = None,
         api_version: str | None = None,
+        http_client: (
+            "httpx.AsyncClient | Callable[[], httpx.AsyncClient] | None"
+        ) = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        scheduler: ComplexityScheduler | None = None,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JSONCodec | None = None,
+        hooks: Iterable[Hook] | None = None,
     ) -> None:
-        """Initialize a new instance of GraphQLClient."""
+        """Initialize a new instance of GraphQLClient.
+
+        Args:
+            endpoint (str): The URL of the GraphQL endpoint.
+            api_key (str, optional): The API key used to authenticate requests.
+            api_version (str, optional): The API version to request.
+            http_client (httpx.AsyncClient, optional): A shared HTTP client, or a
+                function returning it, called whenever the client is needed. When
+                omitted, the GraphQLClient creates and owns its own connection pool.
+            timeout (float, optional): The request timeout in seconds.
+            scheduler (ComplexityScheduler, optional): A scheduler shared with other
+                clients of the same account. A dedicated one is created when omitted.
+            retry (RetryPolicy, optional): The policy for retrying transient
+                failures. Defaults to RetryPolicy().
+            cache (QueryCache, optional): A cache for the responses of queries
+                executed with `cache_tags`. Caching is disabled when omitted.
+            codec (JSONCodec, optional): The JSON codec of request and response
+                bodies. Defaults to the fastest one installed, see `get_codec`.
+            hooks ([Hook], optional): Functions called with an Event at each step
+                of an operation, see `events`. More can be appended to `hooks`.
+        """
         self.endpoint = endpoint
         self.api_key = api_key
         self.api_version = api_version
+        self.timeout = timeout
+        self.scheduler = scheduler or ComplexityScheduler()
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.codec = codec or get_codec()
+        self.hooks: list[Hook] = list(hooks or ())
+        self._in_flight: dict[str, asyncio.Future] = {}
+        # The number of callers waiting for each request in flight.
+        self._waiters: dict[asyncio.Future, int] = {}
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+
+    @property
+    def complexity_budget(self: "GraphQLClient") -> ComplexityBudget:
+        """Return a snapshot of the account's remaining complexity budget."""
+        return self.scheduler.budget
+
+    @property
+    def http_client(self: "GraphQLClient") -> "httpx.AsyncClient":
+        """Return the pooled HTTP client, creating it on first use."""
+        http_client = self._http_client
+        if http_client is None:
+            http_client = self._http_client = create_http_client(timeout=self.timeout)
+        elif callable(http_client):
+            http_client = http_client()
+        return http_client
+
+    async def aclose(self: "GraphQLClient") -> None:
+        """Close the connection pool if it is owned by this client."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self: "GraphQLClient") -> "GraphQLClient":  # noqa: D105
+        return self
+
+    async def __aexit__(  # noqa: D105
+        self: "GraphQLClient",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
 
     async def execute(
         self: "GraphQLClient",
         query: str,
         variables: dict | None = None,
+        *,
+        priority: int = 0,
+        raise_errors: bool = True,
+        cache_tags: Iterable[str] | None = None,
+        invalidates: Iterable[str] | None = None,
+        retry: RetryPolicy | None = None,
     ) -> dict:
         """Execute a GraphQL query.
 
         Args:
             query (str): The GraphQL query string to execute.
             variables (str | None, optional): The variables to pass to the query.
-                Defaults to None.
+                Defaults to None. A `file` variable, either an Upload or a source
+                accepted by Upload, is streamed in a multipart request instead;
+                the query then can't have other variables.
+            priority (int, optional): When the complexity budget runs low, queued
+                requests with a higher priority are sent first. Defaults to 0.
+            raise_errors (bool, optional): Raise MondayError when the response
+                contains errors. When False, the response is returned with its
+                `errors`, which allows reading partial results. Complexity errors
+                are always raised. Defaults to True.
+            cache_tags ([str], optional): Make the query cacheable, tagging its
+                response with these tags. Ignored when the client has no cache.
+            invalidates ([str], optional): Cache tags to invalidate once the
+                operation has been sent, typically by mutations.
+            retry (RetryPolicy, optional): The retry policy of this operation.
+                Defaults to the client's.
+
+        Identical queries executed while one of them is in flight share its
+        response instead of sending their own request. A shared request is only
+        cancelled once every caller waiting for it has been cancelled.
 
         Returns:
-            dict: The response from the GraphQL API.
+            dict: The response from the GraphQL API. It may be shared with other
+                callers, through single-flight or the cache, so it must not be
+                modified: use `copy.deepcopy` first where that is needed.
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries.
+            MondayError: If the API reports an error.
         """
-        return await self._execute(query, variables)
+        mutation = is_mutation(query)
+        cache_key = None
+        if self.cache is not None and cache_tags is not None and not mutation:
+            cache_key = QueryCache.key(query, variables)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.hooks:
+                    self._emit(CACHE_HIT, query)
+                return cached
 
-    async def _execute(
+        try:
+            if mutation:
+                response = await self._execute_with_retry(
+                    query,
+                    variables,
+                    mutation=mutation,
+                    priority=priority,
+                    raise_errors=raise_errors,
+                    retry=retry,
+                )
+            else:
+                response = await self._execute_once(
+                    cache_key or QueryCache.key(query, variables),
+                    query,
+                    variables,
+                    priority=priority,
+                    raise_errors=raise_errors,
+                    retry=retry,
+                )
+        finally:
+            if invalidates and self.cache is not None:
+                self.cache.invalidate(*invalidates)
+
+        if cache_key is not None and "errors" not in response:
+            self.cache.set(cache_key, response, cache_tags)
+        return response
+
+    async def _execute_once(
+        self: "GraphQLClient",
+        key: str,
+        query: str,
+        variables: dict | None = None,
+        *,
+        priority: int = 0,
+        raise_errors: bool = True,
+        retry: RetryPolicy | None = None,
+    ) -> dict:
+        """Execute a query, sharing the request of an identical one in flight."""
+        key = f"{raise_errors}\n{key}"
+        request = self._in_flight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._execute_with_retry(
+                    query,
+                    variables,
+                    mutation=False,
+                    priority=priority,
+                    raise_errors=raise_errors,
+                    retry=retry,
+                ),
+            )
+            self._in_flight[key] = request
+            request.add_done_callback(
+                functools.partial(self._landed, key),
+            )
+        # Shielded so that a cancelled caller doesn't cancel the other callers,
+        # but once every caller has given up, nobody needs the response anymore.
+        self._waiters[request] = self._waiters.get(request, 0) + 1
+        try:
+            return await asyncio.shield(request)
+        finally:
+            self._waiters[request] -= 1
+            if not self._waiters[request]:
+                del self._waiters[request]
+                if not request.done():
+                    request.cancel()
+
+    def _landed(self: "GraphQLClient", key: str, request: asyncio.Future) -> None:
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+        if not request.cancelled():
+            # Mark the error as retrieved in case every caller was cancelled.
+            request.exception()
+
+    async def _execute_with_retry(
         self: "GraphQLClient",
         query: str,
         variables: dict | None = None,
+        *,
+        mutation: bool,
+        priority: int = 0,
+        raise_errors: bool = True,
+        retry: RetryPolicy | None = None,
     ) -> dict:
-        payload = {"query": query}
+        import httpx
+
+        retry = retry or self.retry
+        attempt = 1
+        while True:
+            try:
+                return await self._execute(
+                    query,
+                    variables,
+                    priority=priority,
+                    raise_errors=raise_errors,
+                    attempt=attempt,
+                )
+            except (httpx.HTTPError, MondayError) as error:
+                if attempt >= retry.max_attempts or not retry.is_retryable(
+                    error,
+                    mutation=mutation,
+                ):
+                    raise
+                delay = retry.delay(attempt, error)
+                if self.hooks:
+                    self._emit(
+                        RETRY,
+                        query,
+                        attempt=attempt,
+                        latency=delay,
+                        error=error,
+                    )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def stream(
+        self: "GraphQLClient",
+        query: str,
+        variables: dict | None = None,
+        *,
+        parser: PageStreamParser | None = None,
+        priority: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Execute a query and yield the items of its pages as they are received.
+
+        The response body is parsed incrementally, so memory stays bounded by the
+        size of one item rather than of the whole page. Streamed queries skip the
+        cache, single-flight and retries: items already yielded can't be taken
+        back if the request fails halfway.
+
+        Example:
+            parser = PageStreamParser()
+            async for item in client.stream(query, variables, parser=parser):
+                ...
+            next_cursor = parser.cursors[0]
+
+        Args:
+            query (str): A query selecting `items_page` or `next_items_page`.
+            variables (dict, optional): The variables of the query.
+            parser (PageStreamParser, optional): The parser to feed, which keeps
+                the page cursors. A new one is used when omitted.
+            priority (int, optional): When the complexity budget runs low, queued
+                requests with a higher priority are sent first. Defaults to 0.
+
+        Yields:
+            Any: Each item, decoded.
+
+        Raises:
+            MondayError: If the response reports errors, once it is complete.
+        """
+        parser = parser or PageStreamParser(self.codec)
+        headers = self._headers()
+        headers["Content-Type"] = "application/json"
+        content = self._content(query, variables)
+        reserved, request_id = await self._acquire(query, priority, len(content))
+        started = time.perf_counter()
+        complexity = None
+        response = None
+        received = 0
+        try:
+            async with self.http_client.stream(
+                "POST",
+                self.endpoint,
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    _raise_for_complexity(response)
+                    response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+            data = parser.close()
+            _raise_for_complexity_errors(data)
+            complexity = _pop_complexity(data)
+            _raise_for_errors(data)
+        except BaseException as error:
+            # Cancellations too, so that every request_start is closed.
+            if isinstance(error, MondayComplexityError):
+                self.scheduler.exhausted(error.retry_in_seconds)
+            if self.hooks:
+                self._emit(
+                    ERROR,
+                    query,
+                    request_id=request_id,
+                    latency=time.perf_counter() - started,
+                    response_bytes=received,
+                    **_response_fields(response),
+                    error=error,
+                )
+            raise
+        finally:
+            self.scheduler.release(reserved, key=query, complexity=complexity)
+        if self.hooks:
+            self._emit(
+                REQUEST_END,
+                query,
+                request_id=request_id,
+                latency=time.perf_counter() - started,
+                request_bytes=len(content),
+                response_bytes=received,
+                complexity=_cost(complexity),
+                **_response_fields(response),
+            )
+
+    def _headers(self: "GraphQLClient") -> dict[str, str]:
         headers = {}
-        files = None
 
         if self.api_key:
             headers["Authorization"] = self.api_key
@@ -54,36 +499,247 @@ class GraphQLClient:
         if self.api_version:
             headers["API-Version"] = self.api_version
 
-        if variables is None:
-            headers.setdefault("Content-Type", "application/json")
-            payload = json.dumps({"query": query}).encode("utf-8")  # type: ignore
+        return headers
+
+    def _content(self: "GraphQLClient", query: str, variables: dict | None) -> bytes:
+        payload: dict = {"query": _with_complexity(query)}
+        if variables:
+            payload["variables"] = variables
+        return self.codec.dumps(payload)
 
-        elif variables.get("file", None) is not None:
-            headers.setdefault("content", "multipart/form-data")
-            async with await open_file(variables["file"], "rb") as var_file:
-                contents = await var_file.read()
-            files = [("variables[file]", (variables["file"], contents))]
+    async def _execute(
+        self: "GraphQLClient",
+        query: str,
+        variables: dict | None = None,
+        *,
+        priority: int = 0,
+        raise_errors: bool = True,
+        attempt: int = 1,
+    ) -> dict:
+        headers = self._headers()
+        content: bytes | MultipartUpload
+        if variables is not None and variables.get("file") is not None:
+            upload = variables["file"]
+            if not isinstance(upload, Upload):
+                upload = Upload(upload)
+            content = MultipartUpload({"query": query}, upload)
+            headers.update(content.headers)
+        else:
+            headers["Content-Type"] = "application/json"
+            content = self._content(query, variables)
 
+        request_bytes = (
+            len(content)
+            if isinstance(content, bytes)
+            else _int_or_none(content.headers.get("Content-Length"))
+        )
+        reserved, request_id = await self._acquire(
+            query,
+            priority,
+            request_bytes,
+            attempt=attempt,
+        )
+        started = time.perf_counter()
+        complexity = None
+        response = None
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url=self.endpoint,
-                    headers=headers,
-                    data=payload,
-                    files=files,
-                    timeout=120,
-                )
-                response.raise_for_status()
-                data = response.json()
-            if "errors" in data:
-                json_errors = data["errors"][0]
-                raise (
-                    MondayError(json_errors["message"])
-                    if "message" in json_errors
-                    else MondayError(json_errors)
+            response = await self.http_client.post(
+                url=self.endpoint,
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+            if response.is_error:
+                _raise_for_complexity(response)
+            response.raise_for_status()
+            data = self.codec.loads(response.content)
+            _raise_for_complexity_errors(data)
+            complexity = _pop_complexity(data)
+            if raise_errors:
+                _raise_for_errors(data)
+        except BaseException as error:
+            # Cancellations too, so that every request_start is closed.
+            if isinstance(error, MondayComplexityError):
+                self.scheduler.exhausted(error.retry_in_seconds)
+            if self.hooks:
+                self._emit(
+                    ERROR,
+                    query,
+                    request_id=request_id,
+                    attempt=attempt,
+                    latency=time.perf_counter() - started,
+                    request_bytes=request_bytes,
+                    response_bytes=len(response.content) if response else None,
+                    **_response_fields(response),
+                    error=error,
                 )
-            if "error_message" in data:
-                raise MondayError(data["error_message"])
-            return data
-        except (httpx.HTTPError, json.JSONDecodeError, MondayError) as error:
-            raise error
+            raise
+        finally:
+            self.scheduler.release(reserved, key=query, complexity=complexity)
+        if self.hooks:
+            self._emit(
+                REQUEST_END,
+                query,
+                request_id=request_id,
+                attempt=attempt,
+                latency=time.perf_counter() - started,
+                request_bytes=request_bytes,
+                response_bytes=len(response.content),
+                complexity=_cost(complexity),
+                **_response_fields(response),
+            )
+        return data
+
+    async def _acquire(
+        self: "GraphQLClient",
+        query: str,
+        priority: int,
+        request_bytes: int | None,
+        *,
+        attempt: int = 1,
+    ) -> tuple[int, int]:
+        """Reserve the complexity of a request, then report that it starts.
+
+        Returns:
+            tuple[int, int]: The reserved cost and the identifier of the request.
+        """
+        waiting = time.perf_counter()
+        reserved = await self.scheduler.acquire(
+            self.scheduler.estimate(query),
+            priority=priority,
+        )
+        if not self.hooks:
+            return reserved, 0
+        request_id = next_request_id()
+        waited = time.perf_counter() - waiting
+        if waited >= THROTTLE_THRESHOLD:
+            self._emit(
+                THROTTLE,
+                query,
+                request_id=request_id,
+                attempt=attempt,
+                latency=waited,
+            )
+        self._emit(
+            REQUEST_START,
+            query,
+            request_id=request_id,
+            attempt=attempt,
+            request_bytes=request_bytes,
+        )
+        return reserved, request_id
+
+    def _emit(
+        self: "GraphQLClient",
+        kind: str,
+        query: str,
+        **fields: Any,  # noqa: ANN401
+    ) -> None:
+        emit(
+            self.hooks,
+            Event(
+                kind,
+                operation_name(query),
+                current_resource.get(),
+                **fields,
+            ),
+        )
+
+
+def is_mutation(query: str) -> bool:
+    """Return whether the operation of a GraphQL document is a mutation."""
+    return operation_type(query)[0] == "mutation"
+
+
+def _with_complexity(query: str) -> str:
+    """Add the complexity field to the root selection set of an operation."""
+    index = operation_type(query)[1]
+    if index == -1:
+        return query
+    return f"{query[: index + 1]} {COMPLEXITY_FIELD}{query[index + 1 :]}"
+
+
+def _cost(complexity: dict | None) -> int | None:
+    """Return the points spent by a request, from its complexity field."""
+    if not complexity:
+        return None
+    try:
+        return int(complexity["before"]) - int(complexity["after"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _response_fields(response: "httpx.Response | None") -> dict[str, Any]:
+    """Return the fields of an Event describing a response, if there is one."""
+    if response is None:
+        return {}
+    return {
+        "status_code": response.status_code,
+        "http_version": response.http_version,
+        "response_encoded_bytes": response.num_bytes_downloaded,
+        "content_encoding": response.headers.get("Content-Encoding"),
+    }
+
+
+def _int_or_none(value: str | None) -> int | None:
+    return int(value) if value is not None else None
+
+
+def _pop_complexity(data: dict) -> dict | None:
+    """Move the complexity field out of the data, into the extensions."""
+    if not isinstance(data.get("data"), dict):
+        return None
+    complexity = data["data"].pop(COMPLEXITY_ALIAS, None)
+    if complexity is not None:
+        data.setdefault("extensions", {})["complexity"] = complexity
+    return complexity
+
+
+def _raise_for_errors(data: dict) -> None:
+    """Raise MondayError if the payload reports errors."""
+    if "errors" in data:
+        json_errors = data["errors"][0]
+        raise (
+            MondayError(json_errors["message"])
+            if "message" in json_errors
+            else MondayError(json_errors)
+        )
+    if "error_message" in data:
+        raise MondayError(data["error_message"])
+
+
+def _raise_for_complexity(response: "httpx.Response") -> None:
+    """Raise MondayComplexityError if an error response reports a spent budget."""
+    try:
+        data = response.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return
+    if isinstance(data, dict):
+        _raise_for_complexity_errors(data)
+
+
+def _raise_for_complexity_errors(data: dict) -> None:
+    """Raise MondayComplexityError if the payload reports a spent budget."""
+    if data.get("error_code") in COMPLEXITY_ERROR_CODES:
+        message = str(data.get("error_message", data["error_code"]))
+        raise MondayComplexityError(message, _parse_reset_in(message))
+
+    for error in data.get("errors") or ():
+        if not isinstance(error, dict):
+            continue
+        extensions = error.get("extensions") or {}
+        message = str(error.get("message", ""))
+        if (
+            extensions.get("code") in COMPLEXITY_ERROR_CODES
+            or "complexity budget exhausted" in message.lower()
+        ):
+            retry_in = extensions.get("retry_in_seconds")
+            raise MondayComplexityError(
+                message,
+                float(retry_in) if retry_in is not None else _parse_reset_in(message),
+            )
+
+
+def _parse_reset_in(message: str) -> float | None:
+    match = RESET_IN_PATTERN.search(message)
+    return float(match.group(1)) if match else None
@@ -0,0 +1,127 @@
+"""JSON encoding and decoding, backed by the fastest library installed."""
+
+import functools
+import json
+from typing import Any
+
+from src.monday.exceptions import ArgumentError
+
+CODECS = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """Encode request payloads and decode response bodies.
+
+    The base class uses the standard library. Subclasses wrap faster libraries
+    with the same interface, and `get_codec` picks the best one installed.
+
+    Attributes:
+        name (str): The name of the library used.
+        decode_errors (tuple): The exceptions raised for malformed documents.
+    """
+
+    name = "json"
+    decode_errors: tuple[type[Exception], ...] = (ValueError,)
+
+    def dumps(self: "JSONCodec", value: Any) -> bytes:  # noqa: ANN401
+        """Encode a value as compact UTF-8 JSON.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self: "JSONCodec", data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a JSON document.
+
+        Args:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(data)
+
+    def __repr__(self: "JSONCodec") -> str:  # noqa: D105
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self: "OrjsonCodec") -> None:
+        """Initialize a new instance of OrjsonCodec.
+
+        Raises:
+            ImportError: If orjson isn't installed.
+        """
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self.decode_errors = (orjson.JSONDecodeError,)
+
+    def dumps(self: "OrjsonCodec", value: Any) -> bytes:  # noqa: ANN401, D102
+        return self._dumps(value)
+
+    def loads(self: "OrjsonCodec", data: bytes | str) -> Any:  # noqa: ANN401, D102
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self: "MsgspecCodec") -> None:
+        """Initialize a new instance of MsgspecCodec.
+
+        Raises:
+            ImportError: If msgspec isn't installed.
+        """
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self.decode_errors = (msgspec.DecodeError,)
+
+    def dumps(self: "MsgspecCodec", value: Any) -> bytes:  # noqa: ANN401, D102
+        return self._encoder.encode(value)
+
+    def loads(self: "MsgspecCodec", data: bytes | str) -> Any:  # noqa: ANN401, D102
+        return self._decoder.decode(data)
+
+
+@functools.cache
+def get_codec(name: str | None = None) -> JSONCodec:
+    """Return a JSON codec.
+
+    Args:
+        name (str, optional): One of CODECS. When omitted, the first library of
+            CODECS that is installed is used, falling back to the standard library.
+
+    Returns:
+        JSONCodec: The codec, shared by every caller asking for the same name.
+
+    Raises:
+        ArgumentError: If the name isn't one of CODECS.
+        ImportError: If the requested library isn't installed.
+    """
+    factories = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": JSONCodec}
+    if name is not None:
+        if name not in factories:
+            msg = f"Unknown JSON codec {name!r}, expected one of {CODECS}."
+            raise ArgumentError(msg)
+        return factories[name]()
+
+    for candidate in CODECS:
+        try:
+            return factories[candidate]()
+        except ImportError:
+            continue
+    return JSONCodec()
@@ -0,0 +1,138 @@
+"""Events emitted by GraphQLClient, for logging, tracing and metrics."""
+
+import contextvars
+import functools
+import itertools
+import warnings
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from .query import operation_type, root_fields
+
+REQUEST_START = "request_start"
+REQUEST_END = "request_end"
+RETRY = "retry"
+THROTTLE = "throttle"
+CACHE_HIT = "cache_hit"
+ERROR = "error"
+EVENT_KINDS = (REQUEST_START, REQUEST_END, RETRY, THROTTLE, CACHE_HIT, ERROR)
+
+# The resource method being run, such as "items.fetch_items_page".
+current_resource: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_resource",
+    default=None,
+)
+
+_request_ids = itertools.count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """Something that happened while executing an operation.
+
+    Attributes:
+        kind (str): One of EVENT_KINDS.
+        operation (str): The operation type and its root fields, such as
+            "query boards" or "mutation create_item".
+        resource (str | None): The resource method that sent the operation, such
+            as "items.fetch_items_page", if any.
+        request_id (int): Identifies the HTTP request the event belongs to, so
+            that the start and the end of a request can be matched. Zero for
+            events that don't belong to a request, such as cache hits.
+        attempt (int): The attempt number, starting at 1.
+        latency (float | None): For request_end and error, the number of seconds
+            since the request started. For throttle and retry, the number of
+            seconds spent or to be spent waiting.
+        request_bytes (int | None): The size of the request body, if known.
+        response_bytes (int | None): The size of the response body.
+        response_encoded_bytes (int | None): The size of the response body as
+            received, before it was decompressed.
+        complexity (int | None): The complexity points the operation cost.
+        status_code (int | None): The HTTP status of the response.
+        http_version (str | None): The protocol of the response, "HTTP/1.1" or
+            "HTTP/2".
+        content_encoding (str | None): The compression of the response body,
+            such as "gzip", if it was compressed.
+        error (BaseException | None): The error, for error and retry events.
+            Requests that are cancelled, or whose stream is closed early, end
+            with an error event holding CancelledError or GeneratorExit.
+    """
+
+    kind: str
+    operation: str
+    resource: str | None = None
+    request_id: int = 0
+    attempt: int = 1
+    latency: float | None = None
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    response_encoded_bytes: int | None = None
+    complexity: int | None = None
+    status_code: int | None = None
+    http_version: str | None = None
+    content_encoding: str | None = None
+    error: BaseException | None = field(default=None, compare=False)
+
+
+Hook = Callable[[Event], object]
+
+
+def next_request_id() -> int:
+    """Return a new request identifier, unique within the process."""
+    return next(_request_ids)
+
+
+def emit(hooks: Iterable[Hook], event: Event) -> None:
+    """Call every hook with an event.
+
+    A failing hook must not fail the operation it observes, so its error is
+    turned into a warning.
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception as error:  # noqa: BLE001
+            warnings.warn(
+                f"Instrumentation hook {hook!r} failed: {error!r}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+
+@functools.lru_cache(maxsize=1_024)
+def operation_name(query: str) -> str:
+    """Return the type and the root fields of a GraphQL operation.
+
+    Aliased fields, as sent by batches, are reported under their field name.
+
+    Args:
+        query (str): The GraphQL document.
+
+    Returns:
+        str: For example "query boards" or "mutation change_column_value".
+    """
+    kind, start = operation_type(query)
+    fields = root_fields(query, start) if start != -1 else []
+    return f"{kind} {",".join(fields)}" if fields else kind
+
+
+def instrumented(method: Callable, name: str) -> Callable:
+    """Wrap a coroutine function so that it sets `current_resource` while it runs.
+
+    Args:
+        method (Callable): The coroutine function.
+        name (str): The name reported in events, such as "items.fetch_items".
+
+    Returns:
+        Callable: The wrapped coroutine function.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args: object, **kwargs: object) -> object:
+        token = current_resource.set(name)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_resource.reset(token)
+
+    return wrapper
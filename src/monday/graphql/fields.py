@@ -0,0 +1,72 @@
+"""Render field selections of GraphQL queries from nested lists and dicts."""
+
+import functools
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from src.monday.exceptions import ArgumentError
+
+FieldSpec = str | Sequence[Any] | Mapping[str, Any]
+"""A field selection.
+
+Either a list of field names and nested selections, a dict mapping fields to
+their own selection (or None for scalar fields), a raw GraphQL fragment such
+as "id name", or the name of one of the presets of the method being called.
+
+Example:
+    ["id", "name", {"column_values": ["id", "text"]}]
+"""
+
+
+def render_fields(
+    fields: FieldSpec,
+    presets: Mapping[str, FieldSpec] | None = None,
+) -> str:
+    """Render a field selection as a minified GraphQL selection set body.
+
+    Args:
+        fields (FieldSpec): The selection, or the name of a preset.
+        presets (dict, optional): The named selections available.
+
+    Returns:
+        str: The fields, without the surrounding braces.
+
+    Raises:
+        ArgumentError: If the selection is empty or has an unsupported type.
+    """
+    if isinstance(fields, str) and presets and fields in presets:
+        fields = presets[fields]
+    return _render(_freeze(fields))
+
+
+def _freeze(fields: FieldSpec) -> Any:  # noqa: ANN401
+    """Turn a selection into a hashable value, so its rendering can be cached."""
+    if fields is None or isinstance(fields, str):
+        return fields
+    if isinstance(fields, Mapping):
+        return (
+            "mapping",
+            tuple((name, _freeze(value)) for name, value in fields.items()),
+        )
+    if isinstance(fields, Sequence):
+        return ("sequence", tuple(_freeze(value) for value in fields))
+    msg = f"Unsupported field selection: {fields!r}"
+    raise ArgumentError(msg)
+
+
+@functools.lru_cache(maxsize=512)
+def _render(fields: Any) -> str:  # noqa: ANN401
+    if isinstance(fields, str):
+        rendered = " ".join(fields.split())
+    elif fields[0] == "mapping":
+        rendered = " ".join(
+            f"{name} {{ {_render(value)} }}" if value is not None else name
+            for name, value in fields[1]
+        )
+    else:
+        rendered = " ".join(_render(value) for value in fields[1])
+
+    if not rendered:
+        msg = "A field selection can't be empty."
+        raise ArgumentError(msg)
+    return rendered
@@ -0,0 +1,117 @@
+"""Batch lookups by id made during the same event loop iteration."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+DEFAULT_BATCH_SIZE = 100
+
+BatchLoadFunction = Callable[[list[str]], Awaitable[dict[str, Any]]]
+
+
+class DataLoader:
+    """Collect `load` calls and resolve them with a single query per batch.
+
+    Every key requested before the event loop gets back to the loader is sent in
+    the same call to `batch_load`, split into chunks of `max_batch_size`. Results
+    are cached by key for the lifetime of the loader, so create one loader per
+    request or unit of work rather than sharing it for the whole process.
+
+    Example:
+        users = client.users.loader()
+        owners = await asyncio.gather(*(users.load(item["owner"]) for item in items))
+    """
+
+    def __init__(
+        self: "DataLoader",
+        batch_load: BatchLoadFunction,
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize a new instance of DataLoader.
+
+        Args:
+            batch_load (Callable): Coroutine function receiving a list of keys and
+                returning the records found, keyed by their id.
+            max_batch_size (int, optional): The maximum number of keys per call to
+                `batch_load`. Defaults to DEFAULT_BATCH_SIZE.
+        """
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._cache: dict[str, asyncio.Future] = {}
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self: "DataLoader", key: str | int) -> Any:  # noqa: ANN401
+        """Return the record with the given id, or None if it doesn't exist.
+
+        Args:
+            key (str | int): The record's id.
+
+        Returns:
+            Any: The record, as returned by `batch_load`.
+        """
+        key = str(key)
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append((key, future))
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self: "DataLoader",
+        keys: Iterable[str | int],
+    ) -> list[Any]:
+        """Return the records with the given ids, in the same order.
+
+        Args:
+            keys ([str | int]): The records' ids.
+
+        Returns:
+            list: The records, with None for the ids that don't exist.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self: "DataLoader", key: str | int | None = None) -> None:
+        """Forget a cached record, or every cached record when no key is given.
+
+        Args:
+            key (str | int, optional): The record's id.
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(key), None)
+
+    def _dispatch(self: "DataLoader") -> None:
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch_size):
+            task = asyncio.ensure_future(
+                self._load_batch(pending[start : start + self.max_batch_size]),
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self: "DataLoader",
+        batch: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        try:
+            records = await self.batch_load([key for key, _ in batch])
+        except Exception as error:  # noqa: BLE001
+            for key, future in batch:
+                # Failed lookups aren't cached, so they can be attempted again.
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(error)
+                    # Mark the error as retrieved in case every caller is gone.
+                    future.exception()
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(records.get(key))
@@ -0,0 +1,212 @@
+"""Compile GraphQL documents once and pass their values as variables.
+
+Also find the operation of a document, and the fields it selects.
+"""
+
+import functools
+import re
+from collections.abc import Iterator
+from typing import Any
+
+WHITESPACE_PATTERN = re.compile(r'("(?:\\.|[^"\\])*")|\s+')
+NAME_PATTERN = re.compile(r"[_A-Za-z]\w*")
+ROOT_FIELD_PATTERN = re.compile(r"(?:\w+\s*:\s*)?(\w+)")
+OPERATION_TYPES = ("query", "mutation", "subscription")
+
+
+@functools.lru_cache(maxsize=1_024)
+def compile_query(document: str, **fragments: str) -> str:
+    """Return a minified GraphQL document, formatted with its fragments.
+
+    Documents are written like the body of an f-string, with literal braces
+    doubled and a `{name}` placeholder for each fragment, typically a field
+    selection rendered by `render_fields`. Values must be declared as $variables
+    rather than formatted into the document, so the same call always returns
+    the same string and is only compiled once.
+
+    Example:
+        query = compile_query(
+            '''query ($ids: [ID!]) {{
+                tags (ids: $ids) {{
+                    {fields}
+                }}
+            }}''',
+            fields=render_fields(fields, TAG_FIELDS),
+        )
+
+    Args:
+        document (str): The GraphQL document.
+        **fragments (str): The text of each placeholder.
+
+    Returns:
+        str: The compiled document.
+    """
+    return minify(document.format(**fragments))
+
+
+def minify(document: str) -> str:
+    """Collapse the whitespace of a document, outside of its string literals.
+
+    Args:
+        document (str): The GraphQL document.
+
+    Returns:
+        str: The minified document.
+    """
+    return WHITESPACE_PATTERN.sub(
+        lambda match: match.group(1) or " ",
+        document,
+    ).strip()
+
+
+def variables(**values: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Return the variables of a document, leaving out the ones that are None.
+
+    A nullable variable that is declared by a document but missing from the
+    payload leaves its argument unset, as if it wasn't part of the query.
+
+    Returns:
+        dict: The variables to send along with the document.
+    """
+    return {name: value for name, value in values.items() if value is not None}
+
+
+@functools.lru_cache(maxsize=1_024)
+def operation_type(document: str) -> tuple[str, int]:
+    """Return the type of the operation of a document, and where its fields start.
+
+    Comments, string literals and fragment definitions are skipped, so that a
+    mutation is recognized as such even when a comment or a fragment comes
+    first. Of a document with several operations, the first one is returned.
+
+    Args:
+        document (str): The GraphQL document.
+
+    Returns:
+        tuple[str, int]: "query", "mutation" or "subscription", and the index
+            of the brace opening the root selection set of the operation, or -1
+            if the document has none.
+    """
+    index = 0
+    while True:
+        index = _skip_ignored(document, index)
+        if index >= len(document):
+            return "query", -1
+        if document[index] == "{":
+            return "query", index
+        match = NAME_PATTERN.match(document, index)
+        if match is None:
+            return "query", -1
+        brace = _selection_set(document, match.end())
+        if match.group() in OPERATION_TYPES:
+            return match.group(), brace
+        if brace == -1:
+            return "query", -1
+        # A fragment definition, which is skipped.
+        index = _block_end(document, brace)
+
+
+def root_fields(document: str, start: int) -> list[str]:
+    """Return the names of the fields of a selection set, without aliases.
+
+    Args:
+        document (str): The GraphQL document.
+        start (int): The index of the brace opening the selection set.
+
+    Returns:
+        list[str]: The names of the fields, in order and without duplicates.
+    """
+    fields: list[str] = []
+    depth = 0
+    parentheses = 0
+    name_end = 0
+    for index, character in characters(document, start + 1):
+        if index < name_end:
+            continue
+        if character in "()":
+            parentheses += 1 if character == "(" else -1
+        elif parentheses:
+            continue
+        elif character in "{}":
+            depth += 1 if character == "{" else -1
+            if depth < 0:
+                break
+        elif depth == 0 and NAME_PATTERN.match(character):
+            match = ROOT_FIELD_PATTERN.match(document, index)
+            if match.group(1) not in fields:
+                fields.append(match.group(1))
+            name_end = match.end()
+    return fields
+
+
+def characters(document: str, index: int = 0) -> Iterator[tuple[int, str]]:
+    """Yield the index of each character outside of comments and strings.
+
+    Args:
+        document (str): The GraphQL document.
+        index (int, optional): The index to start at.
+
+    Yields:
+        tuple[int, str]: The index and the character.
+    """
+    while index < len(document):
+        character = document[index]
+        if character == '"':
+            index = _skip_string(document, index)
+        elif character == "#":
+            end = document.find("\n", index)
+            index = len(document) if end == -1 else end
+        else:
+            yield index, character
+            index += 1
+
+
+def _skip_ignored(document: str, index: int) -> int:
+    """Return the index of the next character that isn't ignored by GraphQL."""
+    for position, character in characters(document, index):
+        if not character.isspace() and character not in ",\ufeff":
+            return position
+    return len(document)
+
+
+def _selection_set(document: str, index: int) -> int:
+    """Return the index of the next brace outside of parentheses, or -1."""
+    parentheses = 0
+    for position, character in characters(document, index):
+        if character == "(":
+            parentheses += 1
+        elif character == ")":
+            parentheses -= 1
+        elif character == "{" and not parentheses:
+            return position
+    return -1
+
+
+def _block_end(document: str, brace: int) -> int:
+    """Return the index following the brace closing the one at `brace`."""
+    depth = 0
+    for position, character in characters(document, brace):
+        if character == "{":
+            depth += 1
+        elif character == "}":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+    return len(document)
+
+
+def _skip_string(document: str, index: int) -> int:
+    """Return the index following the string literal starting at `index`."""
+    if document.startswith('"""', index):
+        end = index + 3
+        while True:
+            end = document.find('"""', end)
+            if end == -1:
+                return len(document)
+            if document[end - 1] != "\\":
+                return end + 3
+            end += 3
+    index += 1
+    while index < len(document) and document[index] not in '"\n':
+        index += 2 if document[index] == "\\" else 1
+    return index + 1
@@ -0,0 +1,143 @@
+"""Retry policy for transient failures of the Monday.com API."""
+
+import functools
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from src.monday.exceptions import MondayComplexityError
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+REJECTED_STATUSES = frozenset({429})
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Build UNSENT_ERRORS on first use, so that importing httpx is deferred."""
+    if name == "UNSENT_ERRORS":
+        return _unsent_errors()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@functools.cache
+def _unsent_errors() -> tuple[type[Exception], ...]:
+    """Return the errors of failures that are safe to replay even for mutations.
+
+    They happen before the request reaches the API, or the API reports them
+    without executing the operation.
+    """
+    import httpx
+
+    return (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Decide which failures are retried and how long to wait between attempts.
+
+    Attributes:
+        max_attempts (int): The total number of attempts, including the first one.
+            Use 1 to disable retries.
+        backoff_base (float): The delay in seconds before the first retry.
+        backoff_multiplier (float): The factor applied to the delay on each retry.
+        backoff_max (float): The upper bound of a single delay in seconds.
+        jitter (float): The fraction of each delay that is randomized, from 0 (no
+            jitter) to 1 (full jitter).
+        retry_statuses (frozenset[int]): The HTTP statuses treated as transient.
+        retry_mutations (bool): Replay mutations after failures that may have
+            happened once the API received them. Mutations aren't idempotent, so
+            by default they are only retried when the API is known not to have
+            executed them.
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_multiplier: float = 2.0
+    backoff_max: float = 60.0
+    jitter: float = 1.0
+    retry_statuses: frozenset[int] = field(default=RETRYABLE_STATUSES)
+    retry_mutations: bool = False
+
+    def is_retryable(
+        self: "RetryPolicy",
+        error: Exception,
+        *,
+        mutation: bool = False,
+    ) -> bool:
+        """Return whether a failed operation should be attempted again.
+
+        Args:
+            error (Exception): The error raised by the failed attempt.
+            mutation (bool, optional): Whether the operation is a mutation.
+
+        Returns:
+            bool: True if the error is transient and replaying the operation is safe.
+        """
+        import httpx
+
+        if isinstance(error, (MondayComplexityError, *_unsent_errors())):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status in REJECTED_STATUSES and status in self.retry_statuses:
+                return True
+            return status in self.retry_statuses and (
+                not mutation or self.retry_mutations
+            )
+        if isinstance(error, httpx.TransportError):
+            return not mutation or self.retry_mutations
+        return False
+
+    def delay(self: "RetryPolicy", attempt: int, error: Exception) -> float:
+        """Return the number of seconds to wait before the next attempt.
+
+        The delay suggested by the API, through `Retry-After` or the complexity
+        reset time, takes precedence over the exponential backoff.
+
+        Args:
+            attempt (int): The number of the attempt that just failed, from 1.
+            error (Exception): The error raised by the failed attempt.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        suggested = _suggested_delay(error)
+        if suggested is not None:
+            return min(suggested, self.backoff_max) + random.uniform(  # noqa: S311
+                0,
+                self.jitter * self.backoff_base,
+            )
+
+        delay = min(
+            self.backoff_base * self.backoff_multiplier ** (attempt - 1),
+            self.backoff_max,
+        )
+        return delay * (1 - self.jitter * random.random())  # noqa: S311
+
+
+def _suggested_delay(error: Exception) -> float | None:
+    import httpx
+
+    if isinstance(error, MondayComplexityError):
+        return error.retry_in_seconds
+    if isinstance(error, httpx.HTTPStatusError):
+        return _parse_retry_after(error.response.headers.get("Retry-After"))
+    return None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
@@ -0,0 +1,212 @@
+"""Pace requests against Monday.com's per-minute complexity budget."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+
+DEFAULT_COMPLEXITY_LIMIT = 5_000_000
+DEFAULT_QUERY_COST = 1_000
+DEFAULT_RESET_SECONDS = 60.0
+MAX_TRACKED_OPERATIONS = 1_024
+
+
+@dataclass(frozen=True, slots=True)
+class ComplexityBudget:
+    """Snapshot of the complexity budget as seen by a scheduler.
+
+    Attributes:
+        remaining (int): The budget left, minus the cost reserved by requests
+            that are currently in flight.
+        limit (int): The budget available per reset window.
+        reset_in (float | None): Seconds until the budget resets, if known.
+        in_flight (int): The complexity reserved by requests in flight.
+        queued (int): The number of requests waiting for budget.
+    """
+
+    remaining: int
+    limit: int
+    reset_in: float | None
+    in_flight: int
+    queued: int
+
+
+class ComplexityScheduler:
+    """Queue and pace requests so they stay within the complexity budget.
+
+    The scheduler keeps an estimate of the remaining budget, refreshed from the
+    `complexity` field of every response and from complexity errors. Before a
+    request is sent, its estimated cost is reserved; when the budget can't cover
+    it, the request waits in a priority queue until the budget resets or other
+    requests release their reservations.
+    """
+
+    def __init__(
+        self: "ComplexityScheduler",
+        limit: int = DEFAULT_COMPLEXITY_LIMIT,
+        default_cost: int = DEFAULT_QUERY_COST,
+    ) -> None:
+        """Initialize a new instance of ComplexityScheduler.
+
+        Args:
+            limit (int, optional): The complexity budget per reset window.
+            default_cost (int, optional): The cost assumed for an operation that
+                hasn't been observed yet.
+        """
+        self.limit = limit
+        self.default_cost = default_cost
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+        self._reserved = 0
+        self._costs: dict[str, int] = {}
+        self._queue: list[list] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def budget(self: "ComplexityScheduler") -> ComplexityBudget:
+        """Return a snapshot of the current complexity budget."""
+        self._refresh()
+        reset_in = (
+            max(self._reset_at - time.monotonic(), 0.0)
+            if self._reset_at is not None
+            else None
+        )
+        return ComplexityBudget(
+            remaining=self._available(),
+            limit=self.limit,
+            reset_in=reset_in,
+            in_flight=self._reserved,
+            queued=len(self._queue),
+        )
+
+    def estimate(self: "ComplexityScheduler", key: str) -> int:
+        """Return the estimated cost of an operation.
+
+        Args:
+            key (str): The operation's identifier, usually its query string.
+
+        Returns:
+            int: The last observed cost, or the default cost.
+        """
+        return self._costs.get(key, self.default_cost)
+
+    async def acquire(
+        self: "ComplexityScheduler",
+        cost: int,
+        priority: int = 0,
+    ) -> int:
+        """Wait until the budget can cover a request and reserve its cost.
+
+        Args:
+            cost (int): The estimated cost of the request.
+            priority (int, optional): Requests with a higher priority leave the
+                queue first. Defaults to 0.
+
+        Returns:
+            int: The reserved cost, to be handed back to `release`.
+        """
+        cost = min(max(cost, 0), self.limit)
+        self._refresh()
+        if not self._queue and self._available() >= cost:
+            self._reserved += cost
+            return cost
+
+        future = asyncio.get_running_loop().create_future()
+        entry = [-priority, next(self._counter), cost, future]
+        heapq.heappush(self._queue, entry)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._reserved -= cost
+            elif entry in self._queue:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+            self._dispatch()
+            raise
+        return cost
+
+    def release(
+        self: "ComplexityScheduler",
+        reserved: int,
+        key: str | None = None,
+        complexity: dict | None = None,
+    ) -> None:
+        """Release a reservation and record the complexity reported by the API.
+
+        Args:
+            reserved (int): The cost returned by `acquire`.
+            key (str, optional): The operation's identifier, used to learn its cost.
+            complexity (dict, optional): The `complexity` object of the response,
+                with its `before`, `after` and `reset_in_x_seconds` fields.
+        """
+        self._reserved = max(self._reserved - reserved, 0)
+        if complexity:
+            before = complexity.get("before")
+            after = complexity.get("after")
+            reset_in = complexity.get("reset_in_x_seconds")
+            if key is not None and before is not None and after is not None:
+                self._learn(key, before - after)
+            if after is not None:
+                self._remaining = after
+                self._reset_at = time.monotonic() + (
+                    reset_in if reset_in is not None else DEFAULT_RESET_SECONDS
+                )
+        self._dispatch()
+
+    def exhausted(
+        self: "ComplexityScheduler",
+        reset_in: float | None = None,
+        remaining: int = 0,
+    ) -> None:
+        """Record that the API rejected a request for lack of budget.
+
+        Args:
+            reset_in (float, optional): Seconds until the budget resets.
+            remaining (int, optional): The budget reported as left. Defaults to 0.
+        """
+        self._remaining = remaining
+        self._reset_at = time.monotonic() + (
+            reset_in if reset_in is not None else DEFAULT_RESET_SECONDS
+        )
+        self._dispatch()
+
+    def _available(self: "ComplexityScheduler") -> int:
+        remaining = self.limit if self._remaining is None else self._remaining
+        return remaining - self._reserved
+
+    def _refresh(self: "ComplexityScheduler") -> None:
+        if self._reset_at is not None and time.monotonic() >= self._reset_at:
+            self._remaining = None
+            self._reset_at = None
+
+    def _learn(self: "ComplexityScheduler", key: str, cost: int) -> None:
+        if cost <= 0:
+            return
+        if key not in self._costs and len(self._costs) >= MAX_TRACKED_OPERATIONS:
+            del self._costs[next(iter(self._costs))]
+        self._costs[key] = cost
+
+    def _dispatch(self: "ComplexityScheduler") -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refresh()
+
+        while self._queue:
+            _, _, cost, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._available() < cost:
+                break
+            heapq.heappop(self._queue)
+            self._reserved += cost
+            future.set_result(None)
+
+        if self._queue and self._reset_at is not None:
+            delay = max(self._reset_at - time.monotonic(), 0.0)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
@@ -0,0 +1,200 @@
+"""Decode the items of a page while its response is still being received."""
+
+import codecs
+import re
+from typing import Any
+
+from src.monday.exceptions import MondayError
+
+from .codec import JSONCodec, get_codec
+
+PAGE_KEYS = frozenset({"items_page", "next_items_page"})
+TOKEN_PATTERN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]|[^\s{}\[\]:,"]+|\s+',
+    re.DOTALL,
+)
+SEPARATOR_PATTERN = re.compile(r"[\s,]*")
+# Strings, skipped whole, and the brackets delimiting a value outside of them.
+VALUE_PATTERN = re.compile(
+    r'(?P<string>"[^"\\]*(?:\\.[^"\\]*)*")|(?P<open>[{\[])|(?P<close>[}\]])'
+    r'|(?P<partial>")',
+    re.DOTALL,
+)
+
+
+class _Frame:
+    __slots__ = ("expect_key", "is_object", "key", "name", "target")
+
+    def __init__(self: "_Frame", *, is_object: bool, name: str | None) -> None:
+        self.is_object = is_object
+        self.name = name
+        self.key: str | None = None
+        self.expect_key = is_object
+        self.target = False
+
+
+class PageStreamParser:
+    """Incrementally parse a response holding pages of items.
+
+    Bytes are fed as they arrive. Each element of the `items` array of an
+    `items_page` or `next_items_page` field is decoded on its own as soon as it
+    is complete, so only one item at a time is held as raw text. Everything
+    else in the response, with the item arrays left empty, is decoded by
+    `close` once the body has been received.
+
+    Attributes:
+        cursors (list): The cursor of every page seen so far, in order.
+    """
+
+    def __init__(self: "PageStreamParser", codec: JSONCodec | None = None) -> None:
+        """Initialize a new instance of PageStreamParser.
+
+        Args:
+            codec (JSONCodec, optional): The codec decoding the items and the
+                rest of the response. Defaults to `get_codec()`.
+        """
+        self.codec = codec or get_codec()
+        self.cursors: list[str | None] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._stack: list[_Frame] = []
+        self._skeleton: list[str] = []
+
+    def feed(self: "PageStreamParser", chunk: bytes) -> list[Any]:
+        """Parse the next chunk of the response.
+
+        Args:
+            chunk (bytes): The bytes received.
+
+        Returns:
+            list: The items completed by this chunk.
+        """
+        self._text += self._decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self: "PageStreamParser") -> dict:
+        """Finish parsing and return the response without its items.
+
+        Returns:
+            dict: The response, with empty item arrays.
+
+        Raises:
+            MondayError: If the response is truncated or malformed.
+        """
+        self._text += self._decoder.decode(b"", final=True)
+        self._parse(final=True)
+        if self._text.strip() or self._stack:
+            msg = "The response ended in the middle of a JSON document."
+            raise MondayError(msg)
+        return self.codec.loads("".join(self._skeleton))
+
+    def _parse(self: "PageStreamParser", *, final: bool) -> list[Any]:
+        text = self._text
+        items: list[Any] = []
+        position = 0
+        while position < len(text):
+            if self._stack and self._stack[-1].target:
+                next_position = self._read_item(text, position, items)
+            else:
+                next_position = self._read_token(text, position, final=final)
+            if next_position is None:
+                # The next item or token isn't complete yet: wait for the rest.
+                break
+            position = next_position
+
+        self._text = text[position:]
+        return items
+
+    def _read_item(
+        self: "PageStreamParser",
+        text: str,
+        position: int,
+        items: list[Any],
+    ) -> int | None:
+        """Decode the next item of an items array, or read the end of the array."""
+        position = SEPARATOR_PATTERN.match(text, position).end()
+        if position == len(text):
+            return None
+        if text[position] == "]":
+            self._stack.pop()
+            self._skeleton.append("]")
+            return position + 1
+        end = _value_end(text, position)
+        if end is None:
+            return None
+        try:
+            items.append(self.codec.loads(text[position:end]))
+        except self.codec.decode_errors as error:
+            msg = f"Malformed item in the response: {error}"
+            raise MondayError(msg) from error
+        return end
+
+    def _read_token(
+        self: "PageStreamParser",
+        text: str,
+        position: int,
+        *,
+        final: bool,
+    ) -> int | None:
+        """Copy the next token outside of the items to the skeleton."""
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            # An unterminated string.
+            return None
+        token = match.group()
+        first = token[0]
+        if match.end() == len(text) and not final and first not in '{}[]:,"':
+            # A number or literal that may continue in the next chunk.
+            return None
+
+        top = self._stack[-1] if self._stack else None
+        if first in "{[":
+            self._stack.append(_open(first, top))
+        elif first in "}]":
+            self._stack.pop()
+        elif top is not None and top.is_object:
+            self._read_member(top, token)
+        self._skeleton.append(token)
+        return match.end()
+
+    def _read_member(self: "PageStreamParser", top: _Frame, token: str) -> None:
+        """Track the keys of an object, and the cursor of a page."""
+        first = token[0]
+        if first == ":":
+            top.expect_key = False
+        elif first == ",":
+            top.expect_key = True
+        elif first == '"' and top.expect_key:
+            top.key = self.codec.loads(token)
+        elif top.key == "cursor" and top.name in PAGE_KEYS and not token.isspace():
+            self.cursors.append(self.codec.loads(token))
+
+
+def _open(bracket: str, top: _Frame | None) -> _Frame:
+    """Return the frame of an object or array, opened within `top`."""
+    name = top.key if top is not None and top.is_object else None
+    frame = _Frame(is_object=bracket == "{", name=name)
+    frame.target = (
+        bracket == "[" and name == "items" and top is not None and top.name in PAGE_KEYS
+    )
+    return frame
+
+
+def _value_end(text: str, start: int) -> int | None:
+    """Return the end of the JSON value at `start`, or None if it is incomplete."""
+    if text[start] not in "{[":
+        match = TOKEN_PATTERN.match(text, start)
+        # A scalar running to the end of the text may continue in the next chunk.
+        return match.end() if match and match.end() < len(text) else None
+    depth = 0
+    for match in VALUE_PATTERN.finditer(text, start):
+        kind = match.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if not depth:
+                return match.end()
+        elif kind == "partial":
+            return None
+    return None
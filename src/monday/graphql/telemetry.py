@@ -0,0 +1,260 @@
+"""Hooks turning the events of GraphQLClient into traces and metrics."""
+
+import threading
+from bisect import bisect_left
+from typing import Any
+
+from .events import (
+    CACHE_HIT,
+    ERROR,
+    REQUEST_END,
+    REQUEST_START,
+    RETRY,
+    THROTTLE,
+    Event,
+)
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Name, type and help text of each metric of MetricsRegistry.
+METRICS = {
+    "requests_total": ("counter", "Requests sent to the API, by outcome."),
+    "request_duration_seconds": ("histogram", "Latency of the requests."),
+    "request_bytes_total": ("counter", "Bytes sent in request bodies."),
+    "response_bytes_total": ("counter", "Bytes received in response bodies."),
+    "response_encoded_bytes_total": (
+        "counter",
+        "Bytes of response bodies before decompression, by encoding.",
+    ),
+    "complexity_total": ("counter", "Complexity points spent."),
+    "retries_total": ("counter", "Failed requests that were retried."),
+    "throttle_seconds_total": ("counter", "Time spent waiting for the budget."),
+    "cache_hits_total": ("counter", "Operations answered from the cache."),
+    "errors_total": ("counter", "Failed requests, by error type."),
+}
+
+
+class OpenTelemetryHook:
+    """Report each request as an OpenTelemetry span.
+
+    Spans are children of the span active when the operation was started. Retries,
+    throttling and cache hits are recorded as span events.
+
+    Example:
+        client = MondayClient(api_key, hooks=[OpenTelemetryHook()])
+    """
+
+    def __init__(self: "OpenTelemetryHook", tracer: Any = None) -> None:  # noqa: ANN401
+        """Initialize a new instance of OpenTelemetryHook.
+
+        Args:
+            tracer (opentelemetry.trace.Tracer, optional): The tracer creating the
+                spans. Defaults to the tracer of the global provider.
+
+        Raises:
+            ImportError: If opentelemetry-api isn't installed.
+        """
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("monday")
+        self._spans: dict[int, Any] = {}
+
+    def __call__(self: "OpenTelemetryHook", event: Event) -> None:  # noqa: D102
+        trace = self._trace
+        if event.kind == REQUEST_START:
+            self._spans[event.request_id] = self.tracer.start_span(
+                event.operation,
+                kind=trace.SpanKind.CLIENT,
+                attributes=_attributes(event),
+            )
+            return
+
+        if event.kind in (REQUEST_END, ERROR):
+            span = self._spans.pop(event.request_id, None)
+            if span is None:
+                return
+            span.set_attributes(_attributes(event))
+            if event.kind == ERROR:
+                span.record_exception(event.error)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+            span.end()
+            return
+
+        span = self._spans.get(event.request_id) or trace.get_current_span()
+        span.add_event(f"monday.{event.kind}", _attributes(event))
+
+
+def _attributes(event: Event) -> dict[str, Any]:
+    kind, _, name = event.operation.partition(" ")
+    attributes = {
+        "graphql.operation.type": kind,
+        "graphql.operation.name": name,
+        "monday.resource": event.resource,
+        "monday.attempt": event.attempt,
+        "monday.complexity": event.complexity,
+        "monday.wait_seconds": (
+            event.latency if event.kind in (RETRY, THROTTLE) else None
+        ),
+        "http.request.body.size": event.request_bytes,
+        "http.response.body.size": event.response_encoded_bytes,
+        "monday.response.decompressed_size": event.response_bytes,
+        "monday.response.content_encoding": event.content_encoding,
+        "http.response.status_code": event.status_code,
+        "network.protocol.version": (
+            event.http_version.removeprefix("HTTP/") if event.http_version else None
+        ),
+        "error.type": type(event.error).__name__ if event.error else None,
+    }
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+class MetricsRegistry:
+    """Count requests in process, in the style of Prometheus client libraries.
+
+    Metrics are labelled by operation, and requests additionally by resource
+    method and outcome. `render` returns them in the Prometheus text format, to
+    be served by the application's metrics endpoint.
+
+    Example:
+        metrics = MetricsRegistry()
+        client = MondayClient(api_key, hooks=[metrics])
+        ...
+        print(metrics.render())
+    """
+
+    def __init__(
+        self: "MetricsRegistry",
+        namespace: str = "monday",
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize a new instance of MetricsRegistry.
+
+        Args:
+            namespace (str, optional): The prefix of the metric names.
+            buckets (tuple[float, ...], optional): The upper bounds, in seconds,
+                of the buckets of the latency histogram.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[str, dict[tuple[tuple[str, str], ...], float]] = {
+            name: {} for name in METRICS
+        }
+        self._histograms: dict[tuple[tuple[str, str], ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self: "MetricsRegistry", event: Event) -> None:  # noqa: D102
+        operation = (("operation", event.operation),)
+        with self._lock:
+            if event.kind == CACHE_HIT:
+                self._add("cache_hits_total", operation)
+            elif event.kind == RETRY:
+                self._add("retries_total", operation)
+            elif event.kind == THROTTLE:
+                self._add("throttle_seconds_total", operation, event.latency or 0.0)
+            elif event.kind in (REQUEST_END, ERROR):
+                status = "ok" if event.kind == REQUEST_END else "error"
+                labels = (*operation, ("resource", event.resource or ""))
+                self._add("requests_total", (*labels, ("status", status)))
+                self._add("request_bytes_total", operation, event.request_bytes)
+                self._add("response_bytes_total", operation, event.response_bytes)
+                self._add(
+                    "response_encoded_bytes_total",
+                    (*operation, ("encoding", event.content_encoding or "identity")),
+                    event.response_encoded_bytes,
+                )
+                self._add("complexity_total", operation, event.complexity)
+                if event.kind == ERROR:
+                    error = type(event.error).__name__
+                    self._add("errors_total", (*operation, ("error", error)))
+                if event.latency is not None:
+                    self._observe(operation, event.latency)
+
+    def value(self: "MetricsRegistry", name: str, **labels: str) -> float:
+        """Return the current value of a counter.
+
+        Args:
+            name (str): The name of the metric, without the namespace.
+            **labels (str): The labels of the series.
+
+        Returns:
+            float: The value of the series, or 0 if it was never incremented.
+        """
+        with self._lock:
+            return self._values[name].get(tuple(sorted(labels.items())), 0.0)
+
+    def render(self: "MetricsRegistry") -> str:
+        """Return every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition, ending with a newline.
+        """
+        lines = []
+        with self._lock:
+            for name, (kind, description) in METRICS.items():
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} {kind}")
+                if kind == "histogram":
+                    lines.extend(self._render_histogram(metric))
+                    continue
+                for labels, value in self._values[name].items():
+                    lines.append(f"{metric}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _add(
+        self: "MetricsRegistry",
+        name: str,
+        labels: tuple[tuple[str, str], ...],
+        amount: float | None = 1,
+    ) -> None:
+        if amount is None:
+            return
+        series = self._values[name]
+        key = tuple(sorted(labels))
+        series[key] = series.get(key, 0.0) + amount
+
+    def _observe(
+        self: "MetricsRegistry",
+        labels: tuple[tuple[str, str], ...],
+        seconds: float,
+    ) -> None:
+        # One count per bucket, then the sum and the count of observations.
+        histogram = self._histograms.setdefault(
+            labels,
+            [0.0] * (len(self.buckets) + 2),
+        )
+        index = bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            histogram[index] += 1
+        histogram[-2] += seconds
+        histogram[-1] += 1
+
+    def _render_histogram(self: "MetricsRegistry", metric: str) -> list[str]:
+        lines = []
+        for labels, histogram in self._histograms.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, histogram, strict=False):
+                cumulative += count
+                bucket = (*labels, ("le", _number(bound)))
+                lines.append(f"{metric}_bucket{_labels(bucket)} {_number(cumulative)}")
+            bucket = (*labels, ("le", "+Inf"))
+            lines.append(f"{metric}_bucket{_labels(bucket)} {_number(histogram[-1])}")
+            lines.append(f"{metric}_sum{_labels(labels)} {histogram[-2]}")
+            lines.append(f"{metric}_count{_labels(labels)} {_number(histogram[-1])}")
+        return lines
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
@@ -0,0 +1,233 @@
+"""Stream files to the upload endpoint as multipart requests."""
+
+import inspect
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+FILE_FIELD = "variables[file]"
+
+UploadSource = str | os.PathLike | bytes | IO[bytes] | AsyncIterable[bytes] | Any
+ProgressCallback = Callable[[int, int | None], Any]
+
+
+class Upload:
+    """A file to upload, read in chunks while the request is being sent.
+
+    The source can be a path, bytes, a binary file object (sync, or async with a
+    `read` coroutine such as anyio's) or an async iterator of bytes. Only one
+    chunk at a time is held in memory. Paths, bytes and seekable files can be
+    sent again when a request is retried; other sources can only be sent once.
+
+    Example:
+        upload = Upload("report.pdf", progress=lambda sent, total: print(sent))
+        await client.updates.add_file_to_update(update_id, upload)
+
+    Attributes:
+        filename (str): The name of the file sent to the API.
+        content_type (str): The MIME type of the file.
+        size (int | None): The size of the file in bytes, if it can be known
+            without reading it.
+    """
+
+    def __init__(
+        self: "Upload",
+        source: UploadSource,
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        """Initialize a new instance of Upload.
+
+        Args:
+            source (UploadSource): The content of the file.
+            filename (str, optional): The name of the file. Defaults to the name of
+                the path or of the file object, or "file".
+            content_type (str, optional): The MIME type of the file. Guessed from
+                the filename when omitted.
+            chunk_size (int, optional): The number of bytes read at a time.
+            progress (ProgressCallback, optional): Called after each chunk with
+                the number of bytes sent so far and the total size, or None if
+                it is unknown.
+        """
+        import mimetypes
+
+        self.source = source
+        self.filename = filename or _filename(source)
+        self.content_type = (
+            content_type
+            or mimetypes.guess_type(self.filename)[0]
+            or "application/octet-stream"
+        )
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.size = _size(source)
+        self._start = _tell(source)
+        self._consumed = False
+
+    @property
+    def replayable(self: "Upload") -> bool:
+        """Return whether the file can be read again for another attempt."""
+        return isinstance(self.source, (str, os.PathLike, bytes)) or (
+            self._start is not None
+        )
+
+    async def chunks(self: "Upload") -> AsyncIterator[bytes]:
+        """Read the file chunk by chunk, reporting the progress.
+
+        Yields:
+            bytes: The next chunk of the file.
+
+        Raises:
+            httpx.StreamConsumed: If a source that can't be replayed was already
+                read.
+        """
+        if self._consumed and not self.replayable:
+            import httpx
+
+            raise httpx.StreamConsumed
+        self._consumed = True
+        sent = 0
+        async for chunk in self._read():
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.size)
+            yield chunk
+
+    async def _read(self: "Upload") -> AsyncIterator[bytes]:
+        from anyio import open_file
+
+        source = self.source
+        size = self.chunk_size
+        if isinstance(source, bytes):
+            for start in range(0, len(source), size):
+                yield source[start : start + size]
+        elif isinstance(source, (str, os.PathLike)):
+            async with await open_file(source, "rb") as file:
+                while chunk := await file.read(size):
+                    yield chunk
+        elif hasattr(source, "read"):
+            async for chunk in self._read_file():
+                yield chunk
+        else:
+            async for chunk in source:
+                yield chunk
+
+    async def _read_file(self: "Upload") -> AsyncIterator[bytes]:
+        """Read a file object, in a worker thread unless its reads are async."""
+        from anyio import to_thread
+
+        source = self.source
+        if self._start is not None:
+            source.seek(self._start)
+        if inspect.iscoroutinefunction(source.read):
+            while chunk := await source.read(self.chunk_size):
+                yield chunk
+        else:
+            while chunk := await to_thread.run_sync(source.read, self.chunk_size):
+                yield chunk
+
+    def __repr__(self: "Upload") -> str:  # noqa: D105
+        return f"Upload(filename={self.filename!r}, size={self.size!r})"
+
+
+class MultipartUpload:
+    """The multipart/form-data body of a file upload, streamed as it is sent.
+
+    Attributes:
+        boundary (str): The boundary between the parts.
+        headers (dict): The Content-Type and, when the size of the file is known,
+            the Content-Length of the body.
+    """
+
+    def __init__(
+        self: "MultipartUpload",
+        fields: dict[str, str],
+        upload: Upload,
+        name: str = FILE_FIELD,
+    ) -> None:
+        """Initialize a new instance of MultipartUpload.
+
+        Args:
+            fields (dict): The text parts sent before the file.
+            upload (Upload): The file.
+            name (str, optional): The name of the file part.
+        """
+        self.upload = upload
+        self.boundary = os.urandom(16).hex()
+        self._head = b"".join(
+            [
+                *(self._part(key, value) for key, value in fields.items()),
+                self._file_part(name, upload),
+            ],
+        )
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+        }
+        if upload.size is not None:
+            length = len(self._head) + upload.size + len(self._tail)
+            self.headers["Content-Length"] = str(length)
+
+    def _part(self: "MultipartUpload", name: str, value: str) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+
+    def _file_part(self: "MultipartUpload", name: str, upload: Upload) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; '
+            f'filename="{_quote(upload.filename)}"\r\n'
+            f"Content-Type: {upload.content_type}\r\n\r\n"
+        ).encode()
+
+    async def __aiter__(self: "MultipartUpload") -> AsyncIterator[bytes]:  # noqa: D105
+        yield self._head
+        async for chunk in self.upload.chunks():
+            yield chunk
+        yield self._tail
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", "%0D%0A")
+
+
+def _filename(source: UploadSource) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, (str, os.PathLike)):
+        return os.path.basename(name)
+    return "file"
+
+
+def _size(source: UploadSource) -> int | None:
+    if isinstance(source, bytes):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.stat(source).st_size
+    start = _tell(source)
+    if start is None:
+        return None
+    try:
+        return source.seek(0, os.SEEK_END) - start
+    finally:
+        source.seek(start)
+
+
+def _tell(source: UploadSource) -> int | None:
+    """Return the position of a seekable sync file object, None otherwise."""
+    if not hasattr(source, "seekable") or inspect.iscoroutinefunction(
+        getattr(source, "read", None),
+    ):
+        return None
+    try:
+        return source.tell() if source.seekable() else None
+    except (OSError, ValueError):
+        return None
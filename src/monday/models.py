@@ -0,0 +1,439 @@
+"""Typed, slotted views of API responses, parsed lazily.
+
+Resource methods return plain dicts. Models are an opt-in alternative for
+callers that keep many records around: each record becomes an instance with
+`__slots__` instead of a dict, nested records are only turned into models when
+they are first accessed, and JSON encoded column values are only decoded when
+read.
+
+Example:
+    async for item in client.items.iter_items(board_id, model=Item):
+        print(item.name, item.column_values[0].value)
+"""
+
+from collections.abc import Iterable
+from typing import Any, ClassVar, Self
+
+from src.monday.graphql.codec import get_codec
+
+_REGISTRY: dict[str, type["Model"]] = {}
+
+
+class Field:
+    """A scalar field, stored as returned by the API."""
+
+
+class Nested:
+    """A field holding one record, or a list of records, of another model.
+
+    The raw value is kept until the attribute is first read, then replaced by
+    the parsed model(s).
+    """
+
+    __slots__ = ("many", "model", "slot")
+
+    def __init__(self: "Nested", model: str, *, many: bool = False) -> None:
+        """Initialize a new instance of Nested.
+
+        Args:
+            model (str): The name of the nested model.
+            many (bool, optional): Whether the field holds a list of records.
+        """
+        self.model = model
+        self.many = many
+        self.slot = ""
+
+    def __set_name__(self: "Nested", owner: type, name: str) -> None:  # noqa: D105
+        self.slot = f"_{name}"
+
+    def __get__(  # noqa: D105
+        self: "Nested",
+        instance: "Model | None",
+        owner: type | None = None,
+    ) -> Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if self.many:
+            if value and type(value[0]) is dict:
+                model = _REGISTRY[self.model]
+                value = [model.from_dict(record) for record in value]
+                setattr(instance, self.slot, value)
+        elif type(value) is dict:
+            value = _REGISTRY[self.model].from_dict(value)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(  # noqa: D105
+        self: "Nested",
+        instance: "Model",
+        value: Any,  # noqa: ANN401
+    ) -> None:
+        setattr(instance, self.slot, value)
+
+
+class JSONField:
+    """A field holding a JSON encoded string, decoded on first access."""
+
+    __slots__ = ("decoded", "slot")
+
+    def __init__(self: "JSONField") -> None:
+        """Initialize a new instance of JSONField."""
+        self.slot = ""
+        self.decoded = ""
+
+    def __set_name__(self: "JSONField", owner: type, name: str) -> None:  # noqa: D105
+        self.slot = f"_{name}"
+        self.decoded = f"_{name}_decoded"
+
+    def __get__(  # noqa: D105
+        self: "JSONField",
+        instance: "Model | None",
+        owner: type | None = None,
+    ) -> Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.decoded)
+        except AttributeError:
+            raw = getattr(instance, self.slot)
+            value = get_codec().loads(raw) if raw is not None else None
+            setattr(instance, self.decoded, value)
+            return value
+
+    def __set__(  # noqa: D105
+        self: "JSONField",
+        instance: "Model",
+        value: Any,  # noqa: ANN401
+    ) -> None:
+        raw = None if value is None else get_codec().dumps(value).decode()
+        setattr(instance, self.slot, raw)
+        setattr(instance, self.decoded, value)
+
+
+class _ModelMeta(type):
+    """Turn the fields declared on a model into slots."""
+
+    def __new__(
+        cls: type["_ModelMeta"],
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+    ) -> "_ModelMeta":
+        slots: list[str] = list(namespace.get("__slots__", ()))
+        keys: list[tuple[str, str]] = []
+        for key, value in list(namespace.items()):
+            if isinstance(value, Field):
+                del namespace[key]
+                slots.append(key)
+                keys.append((key, key))
+            elif isinstance(value, Nested):
+                slots.append(f"_{key}")
+                keys.append((key, f"_{key}"))
+            elif isinstance(value, JSONField):
+                slots.extend((f"_{key}", f"_{key}_decoded"))
+                keys.append((key, f"_{key}"))
+        namespace["__slots__"] = tuple(slots)
+        namespace["_keys"] = tuple(keys)
+        namespace["_known"] = frozenset(key for key, _ in keys)
+        namespace["_slots"] = frozenset(slot for _, slot in keys)
+        model = super().__new__(cls, name, bases, namespace)
+        _REGISTRY[name] = model
+        return model
+
+
+class Model(metaclass=_ModelMeta):
+    """Base class of the response models.
+
+    Fields that the model doesn't declare, for example ones requested with a
+    custom field selection, are kept in `extra`. Declared fields missing from
+    the record are left unset, and read as None.
+    """
+
+    __slots__ = ("extra",)
+    _keys: ClassVar[tuple[tuple[str, str], ...]]
+    _known: ClassVar[frozenset[str]]
+    _slots: ClassVar[frozenset[str]]
+
+    extra: dict[str, Any] | None
+
+    @classmethod
+    def from_dict(cls: type[Self], data: dict[str, Any]) -> Self:
+        """Build a model from a record of an API response.
+
+        Args:
+            data (dict): The record.
+
+        Returns:
+            Model: The model. Fields missing from the record are None.
+        """
+        instance = cls.__new__(cls)
+        for key, slot in cls._keys:
+            if key in data:
+                object.__setattr__(instance, slot, data[key])
+        instance.extra = None
+        if not cls._known.issuperset(data):
+            instance.extra = {
+                key: value for key, value in data.items() if key not in cls._known
+            }
+        return instance
+
+    @classmethod
+    def from_list(cls: type[Self], records: Iterable[dict[str, Any]]) -> list[Self]:
+        """Build a list of models from records of an API response.
+
+        Args:
+            records ([dict]): The records.
+
+        Returns:
+            list: The models, in the same order.
+        """
+        return [cls.from_dict(record) for record in records]
+
+    def to_dict(self: "Model") -> dict[str, Any]:
+        """Return the record as a dict shaped like the API response.
+
+        Returns:
+            dict: The declared fields that are set, and the extra ones, with
+                nested models converted back to dicts.
+        """
+        data = {}
+        for key, slot in self._keys:
+            try:
+                # Bypasses __getattr__, which reads unset fields as None.
+                value = object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+            data[key] = _to_raw(value)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getattr__(self: "Model", name: str) -> Any:  # noqa: ANN401, D105
+        if name in self._slots:
+            return None
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __repr__(self: "Model") -> str:  # noqa: D105
+        fields = ", ".join(
+            f"{key}={getattr(self, slot)!r}"
+            for key, slot in self._keys
+            if not isinstance(type(self).__dict__.get(key), Nested)
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self: "Model", other: object) -> bool:  # noqa: D105
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _to_raw(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_raw(element) for element in value]
+    return value
+
+
+class Account(Model):
+    """A monday.com account."""
+
+    id = Field()
+    name = Field()
+    slug = Field()
+    tier = Field()
+
+
+class Board(Model):
+    """A board."""
+
+    id = Field()
+    name = Field()
+    board_folder_id = Field()
+    board_kind = Field()
+    communication = Field()
+    description = Field()
+    items_count = Field()
+    item_terminology = Field()
+    permissions = Field()
+    state = Field()
+    type = Field()
+    updated_at = Field()
+    workspace_id = Field()
+    columns = Nested("Column", many=True)
+    creator = Nested("User")
+    groups = Nested("Group", many=True)
+    items_page = Nested("ItemsPage")
+    owners = Nested("User", many=True)
+    subscribers = Nested("User", many=True)
+    tags = Nested("Tag", many=True)
+    top_group = Nested("Group")
+
+
+class Column(Model):
+    """A column of a board."""
+
+    id = Field()
+    title = Field()
+    archived = Field()
+    description = Field()
+    type = Field()
+    width = Field()
+    settings_str = Field()
+
+
+class ColumnValue(Model):
+    """The value of a column for an item.
+
+    `value` is the decoded JSON value; `text` is its textual representation.
+    """
+
+    id = Field()
+    text = Field()
+    type = Field()
+    value = JSONField()
+    column = Nested("Column")
+
+
+class Folder(Model):
+    """A folder of a workspace."""
+
+    id = Field()
+    name = Field()
+    owner_id = Field()
+    color = Field()
+    created_at = Field()
+    children = Nested("Board", many=True)
+    parent = Nested("Folder")
+    sub_folders = Nested("Folder", many=True)
+    workspace = Nested("Workspace")
+
+
+class Group(Model):
+    """A group of items on a board."""
+
+    id = Field()
+    title = Field()
+    archived = Field()
+    color = Field()
+    deleted = Field()
+    position = Field()
+
+
+class Item(Model):
+    """An item (row) of a board."""
+
+    id = Field()
+    name = Field()
+    created_at = Field()
+    relative_link = Field()
+    state = Field()
+    updated_at = Field()
+    board = Nested("Board")
+    column_values = Nested("ColumnValue", many=True)
+    group = Nested("Group")
+    subitems = Nested("Item", many=True)
+    subscribers = Nested("User", many=True)
+    updates = Nested("Update", many=True)
+
+
+class ItemsPage(Model):
+    """A page of items and the cursor of the next one."""
+
+    cursor = Field()
+    items = Nested("Item", many=True)
+
+
+class Tag(Model):
+    """A tag."""
+
+    id = Field()
+    name = Field()
+    color = Field()
+
+
+class Team(Model):
+    """A team of users."""
+
+    id = Field()
+    name = Field()
+    picture_url = Field()
+    owners = Nested("User", many=True)
+    users = Nested("User", many=True)
+
+
+class Update(Model):
+    """An update posted on an item."""
+
+    id = Field()
+    body = Field()
+    created_at = Field()
+    creator = Nested("User")
+
+
+class User(Model):
+    """A user of the account."""
+
+    id = Field()
+    name = Field()
+    email = Field()
+    birthday = Field()
+    country_code = Field()
+    created_at = Field()
+    current_language = Field()
+    enabled = Field()
+    is_admin = Field()
+    is_guest = Field()
+    is_pending = Field()
+    is_verified = Field()
+    is_view_only = Field()
+    join_date = Field()
+    last_activity = Field()
+    location = Field()
+    mobile_phone = Field()
+    out_of_office = Field()
+    phone = Field()
+    photo_original = Field()
+    photo_small = Field()
+    time_zone_identifier = Field()
+    title = Field()
+    url = Field()
+    utc_hours_diff = Field()
+    account = Nested("Account")
+    teams = Nested("Team", many=True)
+
+
+class Version(Model):
+    """A version of the API."""
+
+    kind = Field()
+    value = Field()
+    display_name = Field()
+
+
+class Webhook(Model):
+    """A webhook subscribed to the events of a board."""
+
+    id = Field()
+    event = Field()
+    board_id = Field()
+    config = Field()
+
+
+class Workspace(Model):
+    """A workspace."""
+
+    id = Field()
+    name = Field()
+    created_at = Field()
+    description = Field()
+    is_default_workspace = Field()
+    kind = Field()
+    state = Field()
+    owners_subscribers = Nested("User", many=True)
+    teams_subscribers = Nested("Team", many=True)
+    users_subscribers = Nested("User", many=True)
@@ -1,22 +1,46 @@
 """This is the init file for the resources package."""
 
-from .boards import BoardResource
-from .columns import ColumnResource
-from .folders import FolderResource
-from .groups import GroupResource
-from .items import ItemResource
-from .notifications import NotificationResource
-from .tags import TagResource
-from .teams import TeamResource
-from .updates import UpdateResource
-from .users import UserResource
-from .versions import VersionResource
-from .webhooks import WebhookResource
-from .workspaces import WorkspaceResource
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .boards import BoardResource
+    from .columns import ColumnResource
+    from .files import FileResource
+    from .folders import FolderResource
+    from .groups import GroupResource
+    from .items import ItemResource
+    from .notifications import NotificationResource
+    from .tags import TagResource
+    from .teams import TeamResource
+    from .updates import UpdateResource
+    from .users import UserResource
+    from .versions import VersionResource
+    from .webhooks import WebhookResource
+    from .workspaces import WorkspaceResource
+
+# Resources are only imported when first used, see MondayClient.
+MODULES = {
+    "BoardResource": "boards",
+    "ColumnResource": "columns",
+    "FileResource": "files",
+    "FolderResource": "folders",
+    "GroupResource": "groups",
+    "ItemResource": "items",
+    "NotificationResource": "notifications",
+    "TagResource": "tags",
+    "TeamResource": "teams",
+    "UpdateResource": "updates",
+    "UserResource": "users",
+    "VersionResource": "versions",
+    "WebhookResource": "webhooks",
+    "WorkspaceResource": "workspaces",
+}
 
 __all__ = [
     "BoardResource",
     "ColumnResource",
+    "FileResource",
     "FolderResource",
     "GroupResource",
     "ItemResource",
@@ -29,3 +53,11 @@ __all__ = [
     "WebhookResource",
     "WorkspaceResource",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a resource class on first use."""
+    if name not in MODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return getattr(importlib.import_module(f".{MODULES[name]}", __name__), name)
@@ -1,6 +1,9 @@
 """BaseResource class for Monday.com API."""
 
+import inspect
+
 from src.monday.graphql.client import GraphQLClient
+from src.monday.graphql.events import instrumented
 
 URLS = {
     "prod": "https://api.monday.com/v2",
@@ -9,22 +12,50 @@ URLS = {
 
 
 class BaseResource:
-    """BaseResource class for Monday.com API."""
+    """BaseResource class for Monday.com API.
+
+    The public coroutine methods of subclasses are reported in the events of the
+    requests they send, as "<resource>.<method>", for example "items.fetch_items".
+    """
+
+    resource_name = ""
+
+    def __init_subclass__(  # noqa: D105
+        cls: type["BaseResource"],
+        **kwargs: object,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.resource_name = f"{cls.__name__.removesuffix("Resource").lower()}s"
+        for name, method in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(method):
+                setattr(cls, name, instrumented(method, f"{cls.resource_name}.{name}"))
 
     def __init__(
         self: "BaseResource",
         api_key: str,
         api_version: str | None = None,
+        *,
+        client: GraphQLClient | None = None,
+        client_file_upload: GraphQLClient | None = None,
     ) -> None:
-        """Initialize the BaseResource class."""
+        """Initialize the BaseResource class.
+
+        Args:
+            api_key (str): The API key used to authenticate requests.
+            api_version (str, optional): The API version to request.
+            client (GraphQLClient, optional): A shared client for the GraphQL
+                endpoint. A dedicated one is created when omitted.
+            client_file_upload (GraphQLClient, optional): A shared client for the
+                file upload endpoint. A dedicated one is created when omitted.
+        """
         self.api_key = api_key
         self.api_version = api_version
-        self.client = GraphQLClient(
+        self.client = client or GraphQLClient(
             endpoint=URLS["prod"],
             api_key=api_key,
             api_version=api_version,
         )
-        self.client_file_upload = GraphQLClient(
+        self.client_file_upload = client_file_upload or GraphQLClient(
             endpoint=URLS["file"],
             api_key=api_key,
             api_version=api_version,
@@ -1,8 +1,12 @@
 """This module provides the Board class for managing boards."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.loader import DEFAULT_BATCH_SIZE, DataLoader
+from src.monday.graphql.query import compile_query, variables
+from src.monday.utils import cache_tags
 
 from .base import BaseResource
+from .fields import BOARD_FIELDS
 from .types.types import BoardAttributes, BoardKind, DuplicateBoardType, OrderBy, State
 
 
@@ -18,6 +22,7 @@ class BoardResource(BaseResource):
         page: int | None = None,
         state: State | None = None,
         workspace_ids: list[str] | str | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Will return metadata about one or a collection of boards.
 
@@ -30,70 +35,71 @@ class BoardResource(BaseResource):
             state (str, optional):The state of board to return. The default is active.
             workspace_ids (str | [str], optional): The specific workspace IDs that
                 contain the boards to return.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of BOARD_FIELDS. Defaults to "default".
 
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(
-            locals(),
-            literals=["board_kind", "order_by", "state"],
+        query = compile_query(
+            """query (
+                $ids: [ID!]
+                $board_kind: BoardKind
+                $limit: Int
+                $order_by: BoardsOrderBy
+                $page: Int
+                $state: State
+                $workspace_ids: [ID]
+            ) {{
+                boards (
+                    ids: $ids
+                    board_kind: $board_kind
+                    limit: $limit
+                    order_by: $order_by
+                    page: $page
+                    state: $state
+                    workspace_ids: $workspace_ids
+                ) {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, BOARD_FIELDS),
         )
 
-        query = f"""query {{
-            boards {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-                name
-                board_folder_id
-                board_kind
-                communication
-                description
-                items_count
-                item_terminology
-                permissions
-                state
-                type
-                updated_at
-                workspace_id
-                columns {{
-                    id
-                    title
-                    type
-                }}
-                creator {{
-                    id
-                    name
-                    email
-                }}
-                groups {{
-                    id
-                    title
-                    color
-                    position
-                }}
-                owners {{
-                    id
-                    name
-                    email
-                }}
-                subscribers {{
-                    id
-                    name
-                    email
-                }}
-                tags {{
-                    id
-                    name
-                    color
-                }}
-                top_group {{
-                    id
-                    title
-                    color
-                }}
-            }}
-        }}"""
+        return await self.client.execute(
+            query,
+            variables(
+                ids=ids,
+                board_kind=board_kind,
+                limit=limit,
+                order_by=order_by,
+                page=page,
+                state=state,
+                workspace_ids=workspace_ids,
+            ),
+            cache_tags=cache_tags("boards", ids),
+        )
 
-        return await self.client.execute(query)
+    def loader(
+        self: "BoardResource",
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> DataLoader:
+        """Return a loader that batches lookups of boards by id.
+
+        Every `load(id)` made during the same event loop iteration is resolved
+        with a single boards query, and results are cached by the loader.
+
+        Args:
+            max_batch_size (int, optional): The maximum number of ids per query.
+
+        Returns:
+            DataLoader: A new loader, resolving each id to a board dict or None.
+        """
+        return DataLoader(self._load_boards, max_batch_size=max_batch_size)
+
+    async def _load_boards(self: "BoardResource", ids: list[str]) -> dict[str, dict]:
+        response = await self.fetch_boards(ids=ids, limit=len(ids))
+        return {board["id"]: board for board in response["data"]["boards"]}
 
     async def create_board(
         self: "BoardResource",
@@ -126,15 +132,49 @@ class BoardResource(BaseResource):
         template_id (str | None): The board's template ID.
         workspace_id (str | None): The board's workspace ID.
         """
-        parameters = parse_parameters(locals(), literals=["board_kind"])
-
-        query = f"""mutation {{
-            create_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_name: String!
+                $board_kind: BoardKind!
+                $board_owner_ids: [ID!]
+                $board_subscriber_ids: [ID!]
+                $board_subscriber_team_ids: [ID!]
+                $description: String
+                $folder_id: ID
+                $template_id: ID
+                $workspace_id: ID
+            ) {{
+                create_board (
+                    board_name: $board_name
+                    board_kind: $board_kind
+                    board_owner_ids: $board_owner_ids
+                    board_subscriber_ids: $board_subscriber_ids
+                    board_subscriber_teams_ids: $board_subscriber_team_ids
+                    description: $description
+                    folder_id: $folder_id
+                    template_id: $template_id
+                    workspace_id: $workspace_id
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_name=board_name,
+                board_kind=board_kind,
+                board_owner_ids=board_owner_ids,
+                board_subscriber_ids=board_subscriber_ids,
+                board_subscriber_team_ids=board_subscriber_team_ids,
+                description=description,
+                folder_id=folder_id,
+                template_id=template_id,
+                workspace_id=workspace_id,
+            ),
+            invalidates=cache_tags("boards"),
+        )
 
     async def duplicate_board(
         self: "BoardResource",
@@ -168,17 +208,42 @@ class BoardResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["duplicate_type"])
-
-        query = f"""mutation {{
-            duplicate_board ({", ".join(parameters)}) {{
-                board {{
-                    id
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $duplicate_type: DuplicateBoardType!
+                $board_name: String
+                $folder_id: ID
+                $workspace_id: ID
+                $keep_subscribers: Boolean
+            ) {{
+                duplicate_board (
+                    board_id: $board_id
+                    duplicate_type: $duplicate_type
+                    board_name: $board_name
+                    folder_id: $folder_id
+                    workspace_id: $workspace_id
+                    keep_subscribers: $keep_subscribers
+                ) {{
+                    board {{
+                        id
+                    }}
                 }}
-            }}
-        }}"""
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                duplicate_type=duplicate_type,
+                board_name=board_name,
+                folder_id=folder_id,
+                workspace_id=workspace_id,
+                keep_subscribers=keep_subscribers,
+            ),
+            invalidates=cache_tags("boards"),
+        )
 
     async def update_board(
         self: "BoardResource",
@@ -195,12 +260,29 @@ class BoardResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["board_attribute"])
-        query = f""" mutation {{
-            update_board ({", ".join(parameters)})
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $board_attribute: BoardAttributes!
+                $new_value: String!
+            ) {{
+                update_board (
+                    board_id: $board_id
+                    board_attribute: $board_attribute
+                    new_value: $new_value
+                )
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                board_attribute=board_attribute,
+                new_value=new_value,
+            ),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def archive_board(self: "BoardResource", board_id: str) -> dict:
         """This method allows you to archive a board.
@@ -210,14 +292,19 @@ class BoardResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            archive_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($board_id: ID!) {{
+                archive_board (board_id: $board_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def delete_board(self: "BoardResource", board_id: str) -> dict:
         """Allows you to delete a board via the API.
@@ -227,11 +314,16 @@ class BoardResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($board_id: ID!) {{
+                delete_board (board_id: $board_id) {{
+                    id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
@@ -1,10 +1,16 @@
 """Class for interacting with the Monday.com API's columns endpoint."""
 
-import json
+from collections.abc import AsyncIterable, Iterable
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.batch import DEFAULT_CHUNK_SIZE, BatchResult, MutationBatch
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
+from src.monday.graphql.upload import ProgressCallback, Upload, UploadSource
+from src.monday.utils import cache_tags
 
 from .base import BaseResource
+from .fields import COLUMN_FIELDS
+from .files import ColumnTarget
 from .types.types import ColumnType
 
 
@@ -16,6 +22,7 @@ class ColumnResource(BaseResource):
         board_ids: list[str] | str,
         column_ids: list[str] | str | None = None,
         types: ColumnType | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Return metadata about one or a collection of columns.
 
@@ -26,28 +33,29 @@ class ColumnResource(BaseResource):
             board_ids (str | [str]): The board's unique identifier.
             column_ids (str | [str]): The column's unique identifier.
             types (str): The column's type.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of COLUMN_FIELDS. Defaults to "default".
         """
-        parameters = parse_parameters(
-            locals(),
-            literals=["types"],
-            exclude=["board_ids"],
-        )
-
-        query = f"""query {{
-            boards(ids: {json.dumps(board_ids)}) {{
-                columns {f"({", ".join(parameters)})" if parameters else ""} {{
-                    id
-                    title
-                    archived
-                    description
-                    settings_str
-                    type
-                    width
+        query = compile_query(
+            """query (
+                $board_ids: [ID!]
+                $column_ids: [String]
+                $types: [ColumnType!]
+            ) {{
+                boards (ids: $board_ids) {{
+                    columns (ids: $column_ids, types: $types) {{
+                        {fields}
+                    }}
                 }}
-            }}
-        }}"""
+            }}""",
+            fields=render_fields(fields, COLUMN_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_ids=board_ids, column_ids=column_ids, types=types),
+            cache_tags=cache_tags("columns", board_ids),
+        )
 
     async def create_column(
         self: "ColumnResource",
@@ -81,16 +89,47 @@ class ColumnResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals(), literals=["column_type"])
-
-        query = f"""mutation {{
-            create_column ({", ".join(parameters)}) {{
-                id
-                title
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $title: String!
+                $column_type: ColumnType!
+                $after_column_id: ID
+                $defaults: JSON
+                $description: String
+                $id: String
+            ) {{
+                create_column (
+                    board_id: $board_id
+                    title: $title
+                    column_type: $column_type
+                    after_column_id: $after_column_id
+                    defaults: $defaults
+                    description: $description
+                    id: $id
+                ) {{
+                    id
+                    title
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                title=title,
+                column_type=column_type,
+                after_column_id=after_column_id,
+                defaults=self._dumps(defaults) if defaults is not None else None,
+                description=description,
+                id=id,
+            ),
+            invalidates=[
+                *cache_tags("columns", board_id),
+                *cache_tags("boards", board_id, listings=True),
+            ],
+        )
 
     async def change_column_value(
         self: "ColumnResource",
@@ -123,17 +162,225 @@ class ColumnResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            change_column_value({", ".join(parameters)}) {{
-                id
-                name
-                column_values {{
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $column_id: String!
+                $value: JSON!
+                $item_id: ID
+                $create_labels_if_missing: Boolean
+            ) {{
+                change_column_value (
+                    board_id: $board_id
+                    column_id: $column_id
+                    value: $value
+                    item_id: $item_id
+                    create_labels_if_missing: $create_labels_if_missing
+                ) {{
                     id
-                    text
-                    value
+                    name
+                    column_values {{
+                        id
+                        text
+                        value
+                    }}
                 }}
-            }}
-        }}"""
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                column_id=column_id,
+                value=value if isinstance(value, str) else self._dumps(value),
+                item_id=item_id,
+                create_labels_if_missing=create_labels_if_missing,
+            ),
+        )
+
+    async def add_file_to_column(
+        self: "ColumnResource",
+        item_id: str,
+        column_id: str,
+        file: UploadSource | Upload,
+        *,
+        progress: ProgressCallback | None = None,
+    ) -> dict:
+        """Adds a file to the file column of an item.
+
+        The file is streamed from its source while the request is sent, so it is
+        never loaded in memory as a whole.
+
+        Example:
+            await client.columns.add_file_to_column(
+                item_id="200819371",
+                column_id="files",
+                file="report.pdf",
+                progress=lambda sent, total: print(f"{sent}/{total}"),
+            )
+
+        Args:
+            item_id (str): The item's identifier.
+            column_id (str): The identifier of the file column.
+            file (UploadSource | Upload): The file to be added: a path, bytes, a
+                binary file object, an async iterator of bytes or an Upload.
+            progress (ProgressCallback, optional): Called with the number of
+                bytes sent so far and the total size, if known. Ignored when
+                `file` is an Upload, which has its own callback.
+
+        Returns:
+            (dict): dict object with the response from the API
+        """
+        if not isinstance(file, Upload):
+            file = Upload(file, progress=progress)
+        return await self.client_file_upload.execute(
+            ColumnTarget(item_id, column_id).mutation(),
+            variables={"file": file},
+        )
+
+    async def change_multiple_column_values(
+        self: "ColumnResource",
+        board_id: str,
+        item_id: str,
+        column_values: dict,
+        *,
+        create_labels_if_missing: bool = False,
+    ) -> dict:
+        """Allows you to change the values of several columns of an item at once.
+
+        Args:
+            board_id (str): The board identifier.
+            item_id (str): The item's identifier.
+            column_values (dict): The new values, keyed by column identifier.
+            create_labels_if_missing (bool): Creates status/dropdown labels if they
+                are missing. Requires permission to change the board structure.
+
+        Example:
+            change_multiple_column_values(
+                board_id="20178755",
+                item_id="200819371",
+                column_values={"status": {"index": 1}, "text": "Done"},
+            )
+
+        Returns:
+            (dict): dict object with the response from the API
+        """
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $item_id: ID
+                $column_values: JSON!
+                $create_labels_if_missing: Boolean
+            ) {{
+                change_multiple_column_values (
+                    board_id: $board_id
+                    item_id: $item_id
+                    column_values: $column_values
+                    create_labels_if_missing: $create_labels_if_missing
+                ) {{
+                    id
+                    name
+                    column_values {{
+                        id
+                        text
+                        value
+                    }}
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                item_id=item_id,
+                column_values=self._dumps(column_values),
+                create_labels_if_missing=create_labels_if_missing,
+            ),
+        )
+
+    async def change_multiple_column_values_bulk(
+        self: "ColumnResource",
+        board_id: str,
+        rows: Iterable[tuple[str, dict]] | AsyncIterable[tuple[str, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_complexity: int | None = None,
+        *,
+        create_labels_if_missing: bool = False,
+    ) -> list[BatchResult]:
+        """Change the column values of many items with batched mutations.
+
+        Rows are consumed lazily and sent `chunk_size` at a time as aliased
+        change_multiple_column_values mutations. The next chunk is only built once
+        the previous one has been answered, so large imports are throttled by
+        the API's pace and the complexity scheduler.
+
+        Example:
+            results = await client.columns.change_multiple_column_values_bulk(
+                board_id="20178755",
+                rows=(
+                    (row["item_id"], {"text": row["name"]})
+                    for row in csv.DictReader(file)
+                ),
+            )
+
+        Args:
+            board_id (str): The board identifier.
+            rows ([(str, dict)]): Pairs of item identifier and new column values.
+            chunk_size (int, optional): The maximum number of items updated per
+                request. Defaults to DEFAULT_CHUNK_SIZE.
+            max_complexity (int, optional): The maximum complexity of a request.
+                Defaults to a tenth of the scheduler's budget.
+            create_labels_if_missing (bool): Creates status/dropdown labels if they
+                are missing. Requires permission to change the board structure.
+
+        Returns:
+            ([BatchResult]): The outcome of each row, in the order of `rows`. A
+                row that can't be sent, such as one with values that aren't
+                JSON serializable, holds the error instead.
+        """
+        batch = MutationBatch(
+            self.client,
+            chunk_size=chunk_size,
+            max_complexity=max_complexity,
+        )
+        resource = ColumnResource(
+            api_key=self.api_key,
+            api_version=self.api_version,
+            client=batch,
+            client_file_upload=self.client_file_upload,
+        )
+
+        scheduled = 0
+
+        async def change(row: tuple[str, dict]) -> dict:
+            # Unpacked here, so that a malformed row fails on its own.
+            item_id, column_values = row
+            return await resource.change_multiple_column_values(
+                board_id,
+                item_id,
+                column_values,
+                create_labels_if_missing=create_labels_if_missing,
+            )
+
+        async def schedule(row: tuple[str, dict]) -> None:
+            nonlocal scheduled
+            batch.schedule(change(row))
+            scheduled += 1
+            if scheduled % chunk_size == 0:
+                await batch.flush()
+
+        async with batch:
+            if isinstance(rows, AsyncIterable):
+                async for row in rows:
+                    await schedule(row)
+            else:
+                for row in rows:
+                    await schedule(row)
+
+        return batch.results
 
-        return await self.client.execute(query)
+    def _dumps(self: "ColumnResource", value: object) -> str:
+        """Encode a JSON variable with the codec of the client."""
+        return self.client.codec.dumps(value).decode()
@@ -0,0 +1,219 @@
+"""Named field selections of the fetch methods.
+
+The "default" preset of every method matches the fields it has always returned;
+"minimal" presets only request identifiers and names.
+"""
+
+from src.monday.graphql.fields import FieldSpec
+
+ID_NAME = ["id", "name"]
+ID_NAME_EMAIL = ["id", "name", "email"]
+
+BOARD_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "name",
+        "board_folder_id",
+        "board_kind",
+        "communication",
+        "description",
+        "items_count",
+        "item_terminology",
+        "permissions",
+        "state",
+        "type",
+        "updated_at",
+        "workspace_id",
+        {
+            "columns": ["id", "title", "type"],
+            "creator": ID_NAME_EMAIL,
+            "groups": ["id", "title", "color", "position"],
+            "owners": ID_NAME_EMAIL,
+            "subscribers": ID_NAME_EMAIL,
+            "tags": ["id", "name", "color"],
+            "top_group": ["id", "title", "color"],
+        },
+    ],
+    "minimal": ID_NAME,
+}
+
+COLUMN_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "title",
+        "archived",
+        "description",
+        "settings_str",
+        "type",
+        "width",
+    ],
+    "minimal": ["id", "title", "type"],
+}
+
+FOLDER_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "name",
+        "owner_id",
+        "color",
+        "created_at",
+        {
+            "children": ID_NAME,
+            "workspace": ID_NAME,
+            "parent": ID_NAME,
+            "sub_folders": ID_NAME,
+        },
+    ],
+    "minimal": ID_NAME,
+}
+
+GROUP_FIELDS: dict[str, FieldSpec] = {
+    "default": ["archived", "color", "deleted", "id", "position", "title"],
+    "minimal": ["id", "title"],
+}
+
+ITEM_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "name",
+        "created_at",
+        "relative_link",
+        "state",
+        "updated_at",
+        {
+            "board": ID_NAME,
+            "subitems": ID_NAME,
+            "subscribers": ID_NAME_EMAIL,
+            "group": ["id", "title"],
+            "updates": ["id"],
+            "column_values": ["id", "value", "text"],
+        },
+    ],
+    "minimal": ID_NAME,
+}
+
+TAG_FIELDS: dict[str, FieldSpec] = {
+    "default": ["color", "id", "name"],
+    "minimal": ID_NAME,
+}
+
+TEAM_FIELDS: dict[str, FieldSpec] = {
+    "default": ["id", "name", "picture_url", {"owners": ["id"]}],
+    "with_users": [
+        "id",
+        "name",
+        "picture_url",
+        {"owners": ["id"], "users": ["email", "id", "name"]},
+    ],
+    "minimal": ID_NAME,
+}
+
+UPDATE_FIELDS: dict[str, FieldSpec] = {
+    "default": ["id", "body", "created_at", {"creator": ["name", "id"]}],
+    "minimal": ["id"],
+}
+
+USER_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "birthday",
+        "country_code",
+        "created_at",
+        "current_language",
+        "email",
+        "enabled",
+        "is_admin",
+        "is_guest",
+        "is_pending",
+        "is_verified",
+        "is_view_only",
+        "join_date",
+        "last_activity",
+        "location",
+        "mobile_phone",
+        "name",
+        {
+            "out_of_office": [
+                "active",
+                "disable_notifications",
+                "end_date",
+                "start_date",
+                "type",
+            ],
+        },
+        "phone",
+        "photo_original",
+        "photo_small",
+        {"teams": ID_NAME},
+        "time_zone_identifier",
+        "title",
+        "url",
+        "utc_hours_diff",
+    ],
+    "minimal": ID_NAME_EMAIL,
+}
+
+CURRENT_USER_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "birthday",
+        "country_code",
+        "created_at",
+        "join_date",
+        "email",
+        "enabled",
+        "id",
+        "is_admin",
+        "is_guest",
+        "is_pending",
+        "is_view_only",
+        "location",
+        "mobile_phone",
+        "name",
+        "phone",
+        "photo_original",
+        "photo_small",
+        {"teams": ID_NAME},
+        "time_zone_identifier",
+        "title",
+        "url",
+        "utc_hours_diff",
+    ],
+    "minimal": ID_NAME_EMAIL,
+}
+
+VERSION_FIELDS: dict[str, FieldSpec] = {
+    "default": ["kind", "value", "display_name"],
+    "minimal": ["value"],
+}
+
+WEBHOOK_FIELDS: dict[str, FieldSpec] = {
+    "default": ["id", "event", "board_id", "config"],
+    "minimal": ["id"],
+}
+
+WORKSPACE_FIELDS: dict[str, FieldSpec] = {
+    "default": [
+        "id",
+        "name",
+        "created_at",
+        "description",
+        "is_default_workspace",
+        "state",
+    ],
+    "full": [
+        "id",
+        "name",
+        "created_at",
+        "description",
+        "is_default_workspace",
+        "state",
+        {
+            "account_product": ["id", "kind"],
+            "owners_subscribers": ID_NAME_EMAIL,
+            "team_owners_subscribers": ["id", "name", "picture_url"],
+            "teams_subscribers": ["id", "name", "picture_url"],
+            "users_subscribers": ID_NAME_EMAIL,
+        },
+    ],
+    "minimal": ID_NAME,
+}
@@ -0,0 +1,213 @@
+"""Class for uploading many files to the Monday.com API."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.monday.graphql.retry import RetryPolicy
+from src.monday.graphql.upload import Upload, UploadSource
+
+from .base import BaseResource
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateTarget:
+    """Attach a file to an update.
+
+    Attributes:
+        update_id (str): The update's identifier.
+    """
+
+    update_id: str
+
+    def mutation(self: "UpdateTarget") -> str:
+        """Return the mutation uploading a file to the update."""
+        # The upload endpoint only reads the file from the variables, so the
+        # other arguments are written into the document.
+        return f"""mutation ($file: File!) {{
+            add_file_to_update (
+                update_id: {json.dumps(str(self.update_id))}
+                file: $file
+            ) {{
+                id
+            }}
+        }}"""
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnTarget:
+    """Attach a file to the file column of an item.
+
+    Attributes:
+        item_id (str): The item's identifier.
+        column_id (str): The identifier of the file column.
+    """
+
+    item_id: str
+    column_id: str
+
+    def mutation(self: "ColumnTarget") -> str:
+        """Return the mutation uploading a file to the column."""
+        return f"""mutation ($file: File!) {{
+            add_file_to_column (
+                item_id: {json.dumps(str(self.item_id))}
+                column_id: {json.dumps(str(self.column_id))}
+                file: $file
+            ) {{
+                id
+            }}
+        }}"""
+
+
+FileTarget = UpdateTarget | ColumnTarget
+
+
+@dataclass(slots=True)
+class UploadResult:
+    """Outcome of one file of a bulk upload.
+
+    Attributes:
+        target (FileTarget | None): Where the file was attached, or None if the
+            pair given couldn't be unpacked.
+        file (UploadSource | Upload): The file, or the pair, as it was given.
+        data (dict | None): The response of the upload.
+        error (Exception | None): The error that made the upload fail, if any.
+        size (int | None): The size of the file in bytes, if known.
+        elapsed (float): The number of seconds spent uploading, retries included.
+    """
+
+    target: FileTarget | None
+    file: UploadSource | Upload
+    data: dict | None = None
+    error: Exception | None = None
+    size: int | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self: "UploadResult") -> bool:
+        """Return whether the file was uploaded."""
+        return self.error is None
+
+
+class FileResource(BaseResource):
+    """Class for uploading many files to the Monday.com API."""
+
+    async def upload_files(
+        self: "FileResource",
+        files: (
+            Iterable[tuple[FileTarget, UploadSource | Upload]]
+            | AsyncIterable[tuple[FileTarget, UploadSource | Upload]]
+        ),
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retry: RetryPolicy | None = None,
+        on_result: Callable[[UploadResult], Any] | None = None,
+    ) -> list[UploadResult]:
+        """Upload many files, several at a time.
+
+        Pairs are consumed lazily by `concurrency` workers sharing the pooled
+        connections of the upload endpoint, and each file is streamed from its
+        source. A failed upload doesn't stop the others: its error is recorded
+        in the report. So is a pair that can't be unpacked, or an error raised by
+        `on_result` for that file.
+
+        Like every mutation, an upload is only retried when the API is known not
+        to have received it. Pass `RetryPolicy(retry_mutations=True)` to also
+        retry timeouts and server errors, at the risk of attaching a file twice.
+
+        Example:
+            results = await client.files.upload_files(
+                (ColumnTarget(item_id, "files"), path)
+                for item_id, path in reports.items()
+            )
+            failed = [result for result in results if not result.ok]
+
+        Args:
+            files ([(FileTarget, UploadSource | Upload)]): Pairs of target and file,
+                the file being a path, bytes, a binary file object, an async
+                iterator of bytes or an Upload.
+            concurrency (int, optional): The maximum number of files uploaded at
+                the same time. Defaults to DEFAULT_CONCURRENCY.
+            retry (RetryPolicy, optional): The retry policy of each upload.
+                Defaults to the policy of the upload client.
+            on_result (Callable, optional): Called with the result of each file
+                as soon as it is known, for example to log the progress.
+
+        Returns:
+            ([UploadResult]): The outcome of each file, in the order of `files`.
+
+        Raises:
+            Exception: The error raised while iterating over `files`, if any.
+        """
+        pairs = _aenumerate(files)
+        lock = asyncio.Lock()
+        results: dict[int, UploadResult] = {}
+
+        async def worker() -> None:
+            while True:
+                async with lock:
+                    entry = await anext(pairs, None)
+                if entry is None:
+                    return
+                index, pair = entry
+                try:
+                    target, file = pair
+                except Exception as error:  # noqa: BLE001
+                    result = UploadResult(target=None, file=pair, error=error)
+                else:
+                    result = await self._upload(target, file, retry)
+                results[index] = result
+                if on_result is not None:
+                    try:
+                        on_result(result)
+                    except Exception as error:  # noqa: BLE001
+                        result.error = result.error or error
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(concurrency):
+                    group.create_task(worker())
+        except ExceptionGroup as errors:
+            # Only iterating over `files` can fail.
+            raise errors.exceptions[0] from None
+
+        return [results[index] for index in range(len(results))]
+
+    async def _upload(
+        self: "FileResource",
+        target: FileTarget,
+        file: UploadSource | Upload,
+        retry: RetryPolicy | None,
+    ) -> UploadResult:
+        result = UploadResult(target=target, file=file)
+        start = time.perf_counter()
+        try:
+            upload = file if isinstance(file, Upload) else Upload(file)
+            result.size = upload.size
+            result.data = await self.client_file_upload.execute(
+                target.mutation(),
+                variables={"file": upload},
+                retry=retry,
+            )
+        except Exception as error:  # noqa: BLE001
+            result.error = error
+        result.elapsed = time.perf_counter() - start
+        return result
+
+
+async def _aenumerate(
+    pairs: Iterable[tuple[FileTarget, Any]] | AsyncIterable[tuple[FileTarget, Any]],
+) -> AsyncIterator[tuple[int, tuple[FileTarget, Any]]]:
+    index = 0
+    if isinstance(pairs, AsyncIterable):
+        async for pair in pairs:
+            yield index, pair
+            index += 1
+    else:
+        for pair in pairs:
+            yield index, pair
+            index += 1
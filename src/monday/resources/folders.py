@@ -1,8 +1,10 @@
 """This module provides the Folder class for accessing the Folders endpoint."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
 
 from .base import BaseResource
+from .fields import FOLDER_FIELDS
 from .types.types import FolderColor
 
 
@@ -15,6 +17,7 @@ class FolderResource(BaseResource):
         limit: int = 25,
         page: int = 1,
         workspace_ids: list[str] | str | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Querying folders will return metadata about one or a collection of folders.
 
@@ -25,41 +28,30 @@ class FolderResource(BaseResource):
             page (int): The page number to return. Starts at 1.
             workspace_ids (str | [str], optional): The unique identifiers of
                 the specific workspaces to return.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of FOLDER_FIELDS. Defaults to "default".
 
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-
-        query = f"""
-            query {{
-                folders {f"({", ".join(parameters)})" if parameters else ""} {{
-                    id
-                    name
-                    owner_id
-                    color
-                    created_at
-                    children {{
-                        id
-                        name
-                    }}
-                    workspace {{
-                        id
-                        name
-                    }}
-                    parent {{
-                        id
-                        name
-                    }}
-                    sub_folders {{
-                        id
-                        name
-                    }}
+        query = compile_query(
+            """query ($ids: [ID!], $limit: Int, $page: Int, $workspace_ids: [ID]) {{
+                folders (
+                    ids: $ids
+                    limit: $limit
+                    page: $page
+                    workspace_ids: $workspace_ids
+                ) {{
+                    {fields}
                 }}
-            }}
-        """
+            }}""",
+            fields=render_fields(fields, FOLDER_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(ids=ids, limit=limit, page=page, workspace_ids=workspace_ids),
+        )
 
     async def create_folder(
         self: "FolderResource",
@@ -81,15 +73,34 @@ class FolderResource(BaseResource):
         Returns:
             dict: Dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            create_folder ({", ".join(parameters)}) {{
-                id
-                name
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation (
+                $name: String!
+                $workspace_id: ID
+                $color: FolderColor
+                $parent_folder_id: ID
+            ) {{
+                create_folder (
+                    name: $name
+                    workspace_id: $workspace_id
+                    color: $color
+                    parent_folder_id: $parent_folder_id
+                ) {{
+                    id
+                    name
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                name=name,
+                workspace_id=workspace_id,
+                color=color,
+                parent_folder_id=parent_folder_id,
+            ),
+        )
 
     async def update_folder(
         self: "FolderResource",
@@ -110,20 +121,39 @@ class FolderResource(BaseResource):
         Returns:
             (dict): Dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            update_folder ({", ".join(parameters)}) {{
-                id
-                name
-                color
-                parent {{
+        query = compile_query(
+            """mutation (
+                $folder_id: ID!
+                $name: String
+                $color: FolderColor
+                $parent_folder_id: ID
+            ) {{
+                update_folder (
+                    folder_id: $folder_id
+                    name: $name
+                    color: $color
+                    parent_folder_id: $parent_folder_id
+                ) {{
                     id
                     name
+                    color
+                    parent {{
+                        id
+                        name
+                    }}
                 }}
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                folder_id=folder_id,
+                name=name,
+                color=color,
+                parent_folder_id=parent_folder_id,
+            ),
+        )
 
     async def delete_folder(self: "FolderResource", folder_id: str) -> dict:
         """Allows you to delete and folder and all its contents.
@@ -134,11 +164,12 @@ class FolderResource(BaseResource):
         Returns:
             (dict): Dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_folder ({" ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($folder_id: ID!) {{
+                delete_folder (folder_id: $folder_id) {{
+                    id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(query, variables(folder_id=folder_id))
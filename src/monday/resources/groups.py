@@ -1,11 +1,13 @@
 """This module provides the Group class for accessing the Groups endpoint."""
 
-import json
 from typing import Literal
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
+from src.monday.utils import cache_tags
 
 from .base import BaseResource
+from .fields import GROUP_FIELDS
 from .types.types import GroupColor
 
 
@@ -16,34 +18,36 @@ class GroupResource(BaseResource):
         self: "GroupResource",
         board_ids: str | list[str],
         group_ids: str | list[str] | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Allows you to query one or a collection of groups on a specific board.
 
         Args:
             board_ids (str | [str]): The board's identifier.
             group_ids (str, optional): The group's identifier.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of GROUP_FIELDS. Defaults to "default".
 
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-
-        query = f"""query {{
-            boards (ids: {json.dumps(board_ids)}) {{
-                groups {f"(ids: {json.dumps(group_ids)})" if group_ids else ""} {{
-                    archived
-                    color
-                    deleted
+        query = compile_query(
+            """query ($board_ids: [ID!], $group_ids: [String]) {{
+                boards (ids: $board_ids) {{
+                    groups (ids: $group_ids) {{
+                        {fields}
+                    }}
                     id
-                    position
-                    title
+                    name
                 }}
-                id
-                name
-            }}
-        }}"""
+            }}""",
+            fields=render_fields(fields, GROUP_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_ids=board_ids, group_ids=group_ids or None),
+        )
 
     async def create_group(
         self: "GroupResource",
@@ -79,18 +83,37 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(
-            locals(),
-            literals=["position_relative_method", "group_color"],
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $group_name: String!
+                $relative_to: String
+                $position_relative_method: PositionRelative
+                $group_color: String
+            ) {{
+                create_group (
+                    board_id: $board_id
+                    group_name: $group_name
+                    relative_to: $relative_to
+                    position_relative_method: $position_relative_method
+                    group_color: $group_color
+                ) {{
+                    id
+                }}
+            }}""",
         )
 
-        query = f"""mutation {{
-            create_group ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                group_name=group_name,
+                relative_to=relative_to,
+                position_relative_method=position_relative_method,
+                group_color=group_color,
+            ),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def update_group(
         self: "GroupResource",
@@ -121,14 +144,34 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals(), literals=["group_attribute"])
-        query = f"""mutation {{
-            update_group ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $group_id: String!
+                $group_attribute: GroupAttributes!
+                $new_value: String!
+            ) {{
+                update_group (
+                    board_id: $board_id
+                    group_id: $group_id
+                    group_attribute: $group_attribute
+                    new_value: $new_value
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                group_id=group_id,
+                group_attribute=group_attribute,
+                new_value=new_value,
+            ),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def duplicate_group(
         self: "GroupResource",
@@ -148,14 +191,34 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            duplicate_group ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $group_id: String!
+                $group_title: String
+                $add_to_top: Boolean
+            ) {{
+                duplicate_group (
+                    board_id: $board_id
+                    group_id: $group_id
+                    group_title: $group_title
+                    add_to_top: $add_to_top
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                group_id=group_id,
+                group_title=group_title,
+                add_to_top=add_to_top,
+            ),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def move_item_to_group(
         self: "GroupResource",
@@ -171,14 +234,18 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            move_item_to_group ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($group_id: String!, $item_id: ID) {{
+                move_item_to_group (group_id: $group_id, item_id: $item_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(group_id=group_id, item_id=item_id),
+        )
 
     async def archive_group(
         self: "GroupResource",
@@ -194,14 +261,19 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            archive_group ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($board_id: ID!, $group_id: String!) {{
+                archive_group (board_id: $board_id, group_id: $group_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, group_id=group_id),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def delete_group(
         self: "GroupResource",
@@ -217,12 +289,17 @@ class GroupResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_group ({", ".join(parameters)}) {{
-                id
-                deleted
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($board_id: ID!, $group_id: String!) {{
+                delete_group (board_id: $board_id, group_id: $group_id) {{
+                    id
+                    deleted
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, group_id=group_id),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
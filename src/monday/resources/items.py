@@ -1,8 +1,20 @@
 """This module provides the Item class for managing items."""
 
-from src.monday.utils import parse_parameters
+import asyncio
+import re
+from collections.abc import AsyncIterator, Iterable
+
+from src.monday.exceptions import ArgumentError
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
+from src.monday.graphql.stream import PageStreamParser
+from src.monday.models import Model
 
 from .base import BaseResource
+from .fields import ITEM_FIELDS
+from .types.types import ColumnType
+
+COLUMN_VALUES_PATTERN = re.compile(r"\bcolumn_values\s*(\([^)]*\))?\s*\{")
 
 
 class ItemResource(BaseResource):
@@ -14,6 +26,9 @@ class ItemResource(BaseResource):
         cursor: str | None = None,
         limit: int = 25,
         query_params: dict | None = None,
+        fields: FieldSpec = "default",
+        column_ids: list[str] | str | None = None,
+        column_types: list[ColumnType] | ColumnType | None = None,
     ) -> dict:
         """Querying items_page return items filtered by the specified criteria.
 
@@ -34,59 +49,36 @@ class ItemResource(BaseResource):
                 based on specific criteria. Please note that you can't use query_params
                 and cursor in the same request. We recommend using query_params for the
                 initial request and cursor for paginated requests.
+            fields (FieldSpec, optional): The fields of each item, or the name of a
+                preset of ITEM_FIELDS. Defaults to "default".
+            column_ids (str | [str], optional): Only return the values of these
+                columns.
+            column_types (str | [str], optional): Only return the values of
+                columns of these types.
 
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), exclude=[board_ids])
-
-        query = f"""query {{
-            boards (ids: {board_ids}) {{
-                items_page ({parameters}) {{
-                    cursor
-                    items {{
-                        id
-                        name
-                        created_at
-                        relative_link
-                        state
-                        updated_at
-
-                        board {{
-                            id
-                            name
-                        }}
-                        subitems {{
-                            id
-                            name
-                        }}
-                        subscribers {{
-                            id
-                            name
-                            email
-                        }}
-                        group {{
-                            id
-                            title
-                        }}
-                        updates {{
-                            id
-                        }}
-                        column_values {{
-                            id
-                            value
-                            text
-                        }}
-                    }}
-                }}
-                id
-                name
-            }}
-        }}"""
+        return await self.client.execute(
+            *_items_page_request(
+                board_ids,
+                cursor=cursor,
+                limit=limit,
+                query_params=query_params,
+                fields=fields,
+                column_ids=column_ids,
+                column_types=column_types,
+            ),
+        )
 
-        return await self.client.execute(query)
-
-    async def fetch_next_items_page(self, cursor: str, limit: int = 25) -> dict:
+    async def fetch_next_items_page(
+        self,
+        cursor: str,
+        limit: int = 25,
+        fields: FieldSpec = "default",
+        column_ids: list[str] | str | None = None,
+        column_types: list[ColumnType] | ColumnType | None = None,
+    ) -> dict:
         """Return the next set of items that correspond with the provided cursor.
 
         Args:
@@ -96,49 +88,362 @@ class ItemResource(BaseResource):
                 to fetch.
             limit (int, optional): The number of items to return. The default is 25.
                 The maximum is 500.
+            fields (FieldSpec, optional): The fields of each item, or the name of a
+                preset of ITEM_FIELDS. Defaults to "default".
+            column_ids (str | [str], optional): Only return the values of these
+                columns.
+            column_types (str | [str], optional): Only return the values of
+                columns of these types.
 
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""query {{
-            next_items_page ({parameters}) {{
+        return await self.client.execute(
+            *_next_items_page_request(
+                cursor,
+                limit=limit,
+                fields=fields,
+                column_ids=column_ids,
+                column_types=column_types,
+            ),
+        )
+
+    async def iter_items(
+        self: "ItemResource",
+        board_ids: list[str] | str,
+        limit: int = 500,
+        query_params: dict | None = None,
+        fields: FieldSpec = "default",
+        column_ids: list[str] | str | None = None,
+        column_types: list[ColumnType] | ColumnType | None = None,
+        model: type[Model] | None = None,
+        *,
+        stream: bool = False,
+    ) -> AsyncIterator[dict | Model]:
+        """Iterate over every item of one or more boards.
+
+        Items are yielded one at a time while the cursor chain of each board is
+        followed with next_items_page. The next page is requested as soon as the
+        current one arrives, so it downloads while the caller processes items.
+
+        With `stream=True`, each page is instead decoded while it is received:
+        items are yielded before the rest of the page has arrived, and only one
+        of them at a time is held as raw text. Pages are then requested one after
+        the other, and aren't cached or retried. When several boards are given,
+        the first page of each comes before the pages that follow.
+
+        Example:
+            async for item in client.items.iter_items("1234567890"):
+                print(item["name"])
+
+        Args:
+            board_ids (str | [str]): The boards' unique identifiers.
+            limit (int, optional): The number of items to request per page.
+                The default and maximum is 500.
+            query_params (dict, optional): A set of parameters to filter, sort, and
+                control the scope of the items. Only applies to the first page.
+            fields (FieldSpec, optional): The fields of each item, or the name of a
+                preset of ITEM_FIELDS. Defaults to "default".
+            column_ids (str | [str], optional): Only return the values of these
+                columns.
+            column_types (str | [str], optional): Only return the values of
+                columns of these types.
+            model (type[Model], optional): A model, such as models.Item, to
+                build from each item instead of yielding dicts.
+            stream (bool, optional): Whether to decode pages while they are
+                received. Defaults to False.
+
+        Yields:
+            dict | Model: Each item, as returned by the monday.com GraphQL API, or
+                as an instance of `model` when one is given.
+        """
+        selection = {
+            "fields": fields,
+            "column_ids": column_ids,
+            "column_types": column_types,
+        }
+        if stream:
+            items = self._stream_items(board_ids, limit, query_params, selection)
+            async for item in items:
+                yield item if model is None else model.from_dict(item)
+            return
+
+        response = await self.fetch_items_page(
+            board_ids,
+            limit=limit,
+            query_params=query_params,
+            **selection,
+        )
+        for board in response["data"]["boards"]:
+            page = board.get("items_page")
+            async for item in self._iter_cursor(page, limit, selection):
+                yield item if model is None else model.from_dict(item)
+
+    async def iter_boards_items(
+        self: "ItemResource",
+        board_ids: Iterable[str],
+        concurrency: int = 8,
+        limit: int = 500,
+        query_params: dict | None = None,
+        fields: FieldSpec = "default",
+        column_ids: list[str] | str | None = None,
+        column_types: list[ColumnType] | ColumnType | None = None,
+        model: type[Model] | None = None,
+        *,
+        stream: bool = False,
+    ) -> AsyncIterator[tuple[str, dict | Model]]:
+        """Iterate over the items of many boards, paginating boards concurrently.
+
+        Up to `concurrency` boards have their cursor chains followed at the same
+        time. Their items are merged into a single stream in arrival order, so
+        items of different boards are interleaved. Requests go through the
+        client's complexity scheduler, which holds them back when the budget
+        runs low.
+
+        Example:
+            async for board_id, item in client.items.iter_boards_items(board_ids):
+                print(board_id, item["name"])
+
+        Args:
+            board_ids ([str]): The boards' unique identifiers.
+            concurrency (int, optional): The maximum number of boards paginated at
+                the same time. Defaults to 8.
+            limit (int, optional): The number of items to request per page.
+                The default and maximum is 500.
+            query_params (dict, optional): A set of parameters to filter, sort, and
+                control the scope of the items of each board.
+            fields (FieldSpec, optional): The fields of each item, or the name of a
+                preset of ITEM_FIELDS. Defaults to "default".
+            column_ids (str | [str], optional): Only return the values of these
+                columns.
+            column_types (str | [str], optional): Only return the values of
+                columns of these types.
+            model (type[Model], optional): A model, such as models.Item, to
+                build from each item instead of yielding dicts.
+            stream (bool, optional): Whether to decode pages while they are
+                received, see `iter_items`. Defaults to False.
+
+        Yields:
+            tuple[str, dict | Model]: The board's identifier and one of its items,
+                as an instance of `model` when one is given.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=limit)
+        semaphore = asyncio.Semaphore(concurrency)
+        finished = object()
+
+        async def export(board_id: str) -> None:
+            async with semaphore:
+                async for item in self.iter_items(
+                    board_id,
+                    limit=limit,
+                    query_params=query_params,
+                    fields=fields,
+                    column_ids=column_ids,
+                    column_types=column_types,
+                    model=model,
+                    stream=stream,
+                ):
+                    await queue.put((board_id, item))
+
+        async def export_all() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for board_id in board_ids:
+                        group.create_task(export(str(board_id)))
+            finally:
+                # Once the consumer has stopped and cancelled this, the queue may
+                # stay full and nobody waits for the end anymore.
+                if not asyncio.current_task().cancelling():
+                    await queue.put(finished)
+
+        producer = asyncio.ensure_future(export_all())
+        try:
+            while (entry := await queue.get()) is not finished:
+                yield entry
+            try:
+                await producer
+            except ExceptionGroup as errors:
+                raise errors.exceptions[0] from None
+        finally:
+            if not producer.done():
+                producer.cancel()
+                # Errors are moot once the consumer has stopped.
+                await asyncio.gather(producer, return_exceptions=True)
+
+    async def _stream_items(
+        self: "ItemResource",
+        board_ids: list[str] | str,
+        limit: int,
+        query_params: dict | None,
+        selection: dict,
+    ) -> AsyncIterator[dict]:
+        """Stream the items of the first pages, then of every page that follows."""
+        parser = PageStreamParser(self.client.codec)
+        request = _items_page_request(
+            board_ids,
+            limit=limit,
+            query_params=query_params,
+            **selection,
+        )
+        async for item in self.client.stream(*request, parser=parser):
+            yield item
+
+        for cursor in parser.cursors:
+            while cursor:
+                parser = PageStreamParser(self.client.codec)
+                request = _next_items_page_request(cursor, limit=limit, **selection)
+                async for item in self.client.stream(*request, parser=parser):
+                    yield item
+                cursor = parser.cursors[0] if parser.cursors else None
+
+    async def _iter_cursor(
+        self: "ItemResource",
+        page: dict | None,
+        limit: int,
+        selection: dict,
+    ) -> AsyncIterator[dict]:
+        """Yield the items of a page and of every page that follows its cursor."""
+        while page is not None:
+            cursor = page.get("cursor")
+            next_page = (
+                asyncio.ensure_future(
+                    self.fetch_next_items_page(cursor, limit=limit, **selection),
+                )
+                if cursor
+                else None
+            )
+            # Pages may be shared with concurrent identical requests, so they
+            # are read without being modified.
+            items = page.get("items") or ()
+            page = None
+            try:
+                for item in items:
+                    yield item
+            except BaseException:
+                # Cancels the request too, unless an identical one still waits.
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is not None:
+                page = (await next_page)["data"]["next_items_page"]
+
+
+def _items_page_request(
+    board_ids: list[str] | str,
+    cursor: str | None = None,
+    limit: int = 25,
+    query_params: dict | None = None,
+    fields: FieldSpec = "default",
+    column_ids: list[str] | str | None = None,
+    column_types: list[ColumnType] | ColumnType | None = None,
+) -> tuple[str, dict]:
+    """Return the query and variables fetching the first page of boards' items."""
+    query = compile_query(
+        """query (
+            $board_ids: [ID!]
+            $cursor: String
+            $limit: Int!
+            $query_params: ItemsQuery
+            {declarations}
+        ) {{
+            boards (ids: $board_ids) {{
+                items_page (
+                    cursor: $cursor
+                    limit: $limit
+                    query_params: $query_params
+                ) {{
+                    cursor
+                    items {{
+                        {fields}
+                    }}
+                }}
+                id
+                name
+            }}
+        }}""",
+        **_item_fields(fields, column_ids, column_types),
+    )
+    return query, variables(
+        board_ids=board_ids,
+        cursor=cursor,
+        limit=limit,
+        query_params=query_params or None,
+        column_ids=column_ids,
+        column_types=column_types,
+    )
+
+
+def _next_items_page_request(
+    cursor: str,
+    limit: int = 25,
+    fields: FieldSpec = "default",
+    column_ids: list[str] | str | None = None,
+    column_types: list[ColumnType] | ColumnType | None = None,
+) -> tuple[str, dict]:
+    """Return the query and variables fetching the page following a cursor."""
+    query = compile_query(
+        """query ($cursor: String!, $limit: Int! {declarations}) {{
+            next_items_page (cursor: $cursor, limit: $limit) {{
                 cursor
                 items {{
-                    id
-                    name
-                    created_at
-                    relative_link
-                    state
-                    updated_at
-
-                    board {{
-                        id
-                        name
-                    }}
-                    subitems {{
-                        id
-                        name
-                    }}
-                    subscribers {{
-                        id
-                        name
-                        email
-                    }}
-                    group {{
-                        id
-                        title
-                    }}
-                    updates {{
-                        id
-                    }}
-                    column_values {{
-                        id
-                        value
-                        text
-                    }}
+                    {fields}
                 }}
             }}
-        }}"""
+        }}""",
+        **_item_fields(fields, column_ids, column_types),
+    )
+    return query, variables(
+        cursor=cursor,
+        limit=limit,
+        column_ids=column_ids,
+        column_types=column_types,
+    )
+
+
+def _item_fields(
+    fields: FieldSpec,
+    column_ids: list[str] | str | None,
+    column_types: list[str] | str | None,
+) -> dict[str, str]:
+    """Render the fields of an item, restricting its column_values if asked to.
+
+    The restrictions are passed as the $column_ids and $column_types variables.
+    When the selection has no top-level column_values field, one requesting the
+    id, value and text of each column is added.
+
+    Returns:
+        dict: The `fields` and variable `declarations` fragments of the query.
+
+    Raises:
+        ArgumentError: If the restrictions are asked for while the selection's
+            column_values field already has arguments.
+    """
+    selection = render_fields(fields, ITEM_FIELDS)
+    declarations = []
+    arguments = []
+    if column_ids is not None:
+        declarations.append("$column_ids: [String!]")
+        arguments.append("ids: $column_ids")
+    if column_types is not None:
+        declarations.append("$column_types: [ColumnType!]")
+        arguments.append("types: $column_types")
+    if not arguments:
+        return {"fields": selection, "declarations": ""}
 
-        return await self.client.execute(query)
+    column_values = f"column_values ({", ".join(arguments)})"
+    for match in COLUMN_VALUES_PATTERN.finditer(selection):
+        # Only the item's own column values, not those of nested subitems.
+        prefix = selection[: match.start()]
+        if prefix.count("{") == prefix.count("}"):
+            if match.group(1):
+                msg = (
+                    "column_ids and column_types can't be combined with arguments"
+                    " of the column_values field in the selection."
+                )
+                raise ArgumentError(msg)
+            selection = f"{prefix}{column_values} {{{selection[match.end() :]}"
+            break
+    else:
+        selection = f"{selection} {column_values} {{ id value text }}"
+    return {"fields": selection, "declarations": " ".join(declarations)}
@@ -1,6 +1,6 @@
 """This module contains the NotificationResource class for handling notifications."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.query import compile_query, variables
 
 from .base import BaseResource
 from .types.types import NotificationTargetType
@@ -39,13 +39,30 @@ class NotificationResource(BaseResource):
         Returns:
             (dict): dictionary response from the API
         """
-        parameters = parse_parameters(locals(), literals=["target_type"])
-        query = f"""mutation {{
-            create_notification (
-                {", ".join(parameters)}
+        query = compile_query(
+            """mutation (
+                $user_id: ID!
+                $target_id: ID!
+                $text: String!
+                $target_type: NotificationTargetType!
             ) {{
-                text
-            }}
-        }}"""
+                create_notification (
+                    user_id: $user_id
+                    target_id: $target_id
+                    text: $text
+                    target_type: $target_type
+                ) {{
+                    text
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(
+                user_id=user_id,
+                target_id=target_id,
+                text=text,
+                target_type=target_type,
+            ),
+        )
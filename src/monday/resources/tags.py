@@ -1,8 +1,12 @@
 """This module provides the Tags class for accessing the Tags endpoint."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.loader import DEFAULT_BATCH_SIZE, DataLoader
+from src.monday.graphql.query import compile_query, variables
+from src.monday.utils import cache_tags
 
 from .base import BaseResource
+from .fields import TAG_FIELDS
 
 
 class TagResource(BaseResource):
@@ -11,6 +15,7 @@ class TagResource(BaseResource):
     async def fetch_tags(
         self: "TagResource",
         ids: str | list[str] | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Return metadata about one or a collection of the account's public tags.
 
@@ -19,20 +24,47 @@ class TagResource(BaseResource):
 
         Args:
             ids (str | list(str), optional): A list of tags' identifiers.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of TAG_FIELDS. Defaults to "default".
 
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""query {{
-            tags {f"({", ".join(parameters)})" if parameters else ""} {{
-                color
-                id
-                name
-            }}
-        }}"""
+        query = compile_query(
+            """query ($ids: [ID!]) {{
+                tags (ids: $ids) {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, TAG_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(ids=ids),
+            cache_tags=cache_tags("tags", ids),
+        )
+
+    def loader(
+        self: "TagResource",
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> DataLoader:
+        """Return a loader that batches lookups of tags by id.
+
+        Every `load(id)` made during the same event loop iteration is resolved
+        with a single tags query, and results are cached by the loader.
+
+        Args:
+            max_batch_size (int, optional): The maximum number of ids per query.
+
+        Returns:
+            DataLoader: A new loader, resolving each id to a tag dict or None.
+        """
+        return DataLoader(self._load_tags, max_batch_size=max_batch_size)
+
+    async def _load_tags(self: "TagResource", ids: list[str]) -> dict[str, dict]:
+        response = await self.fetch_tags(ids=ids)
+        return {tag["id"]: tag for tag in response["data"]["tags"]}
 
     async def create_or_get_tag(
         self: "TagResource",
@@ -53,14 +85,18 @@ class TagResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation
-        {{
-            create_or_get_tag {f"({", ".join(parameters)})" if parameters else ""} {{
-                name
-                color
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($tag_name: String, $board_id: ID) {{
+                create_or_get_tag (tag_name: $tag_name, board_id: $board_id) {{
+                    name
+                    color
+                    id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(tag_name=tag_name, board_id=board_id),
+            invalidates=cache_tags("tags"),
+        )
@@ -1,8 +1,11 @@
 """This module provides the Team class for accessing the Teams endpoint."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.loader import DEFAULT_BATCH_SIZE, DataLoader
+from src.monday.graphql.query import compile_query, variables
 
 from .base import BaseResource
+from .fields import TEAM_FIELDS
 from .types.types import SubscriberKind
 
 
@@ -14,6 +17,7 @@ class TeamResource(BaseResource):
         ids: str | list[str] | None = None,
         *,
         include_users: bool = False,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Return metadata about one or several teams.
 
@@ -21,28 +25,45 @@ class TeamResource(BaseResource):
             ids (str | list(str), optional): The unique identifiers of the
                 specific teams to return.
             include_users (bool, optional): Whether to include the team's users
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of TEAM_FIELDS. Defaults to "default", or "with_users" when
+                include_users is set.
 
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals(), exclude=["include_users", "users"])
-        users = """users {
-            email
-            id
-            name
-        }"""
-        query = f"""query {{
-            teams {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-                name
-                picture_url
-                owners {{
-                    id
+        if include_users and fields == "default":
+            fields = "with_users"
+        query = compile_query(
+            """query ($ids: [ID!]) {{
+                teams (ids: $ids) {{
+                    {fields}
                 }}
-                {users if include_users else ""}
-            }}
-        }}"""
-        return await self.client.execute(query)
+            }}""",
+            fields=render_fields(fields, TEAM_FIELDS),
+        )
+        return await self.client.execute(query, variables(ids=ids))
+
+    def loader(
+        self: "TeamResource",
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> DataLoader:
+        """Return a loader that batches lookups of teams by id.
+
+        Every `load(id)` made during the same event loop iteration is resolved
+        with a single teams query, and results are cached by the loader.
+
+        Args:
+            max_batch_size (int, optional): The maximum number of ids per query.
+
+        Returns:
+            DataLoader: A new loader, resolving each id to a team dict or None.
+        """
+        return DataLoader(self._load_teams, max_batch_size=max_batch_size)
+
+    async def _load_teams(self: "TeamResource", ids: list[str]) -> dict[str, dict]:
+        response = await self.fetch_teams(ids=ids)
+        return {team["id"]: team for team in response["data"]["teams"]}
 
     async def add_teams_to_board(
         self: "TeamResource",
@@ -63,14 +84,22 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals(), exclude=["kind"])
-        query = f"""mutation {{
-            add_teams_to_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($board_id: ID!, $team_ids: [ID!]!, $kind: SubscriberKind) {{
+                add_teams_to_board (
+                    board_id: $board_id
+                    team_ids: $team_ids
+                    kind: $kind
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, team_ids=team_ids, kind=kind),
+        )
 
     async def add_users_to_team(
         self: "TeamResource",
@@ -87,21 +116,25 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            add_users_to_team ({", ".join(parameters)}) {{
-                successful_users {{
-                    name
-                    email
-                }}
-                failed_users {{
-                    name
-                    email
+        query = compile_query(
+            """mutation ($team_id: ID!, $user_ids: [ID!]!) {{
+                add_users_to_team (team_id: $team_id, user_ids: $user_ids) {{
+                    successful_users {{
+                        name
+                        email
+                    }}
+                    failed_users {{
+                        name
+                        email
+                    }}
                 }}
-            }}
-        }}"""
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(team_id=team_id, user_ids=user_ids),
+        )
 
     async def add_teams_to_workspace(
         self: "TeamResource",
@@ -120,15 +153,27 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals(), exclude=["kind"])
-        query = f"""mutation {{
-            add_teams_to_workspace ({", ".join(parameters)}) {{
-                id
-                name
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $team_ids: [ID!]!
+                $workspace_id: ID!
+                $kind: WorkspaceSubscriberKind
+            ) {{
+                add_teams_to_workspace (
+                    team_ids: $team_ids
+                    workspace_id: $workspace_id
+                    kind: $kind
+                ) {{
+                    id
+                    name
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(team_ids=team_ids, workspace_id=workspace_id, kind=kind),
+        )
 
     async def delete_teams_from_board(
         self: "TeamResource",
@@ -145,15 +190,19 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_teams_from_board ({", ".join(parameters)}) {{
-                id
-                name
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($board_id: ID!, $team_ids: [ID!]!) {{
+                delete_teams_from_board (board_id: $board_id, team_ids: $team_ids) {{
+                    id
+                    name
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, team_ids=team_ids),
+        )
 
     async def remove_users_from_team(
         self: "TeamResource",
@@ -170,21 +219,25 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            remove_users_from_team ({", ".join(parameters)}) {{
-                successful_users {{
-                    name
-                    email
-                }}
-                failed_users {{
-                    name
-                    email
+        query = compile_query(
+            """mutation ($team_id: ID!, $user_ids: [ID!]!) {{
+                remove_users_from_team (team_id: $team_id, user_ids: $user_ids) {{
+                    successful_users {{
+                        name
+                        email
+                    }}
+                    failed_users {{
+                        name
+                        email
+                    }}
                 }}
-            }}
-        }}"""
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(team_id=team_id, user_ids=user_ids),
+        )
 
     async def delete_teams_from_workspace(
         self: "TeamResource",
@@ -202,12 +255,19 @@ class TeamResource(BaseResource):
         Returns:
             (dict): Dict response from the monday.com GraphQL API.
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_teams_from_workspace ({", ".join(parameters)}) {{
-                id
-                name
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($team_ids: [ID!]!, $workspace_id: ID!) {{
+                delete_teams_from_workspace (
+                    team_ids: $team_ids
+                    workspace_id: $workspace_id
+                ) {{
+                    id
+                    name
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(team_ids=team_ids, workspace_id=workspace_id),
+        )
@@ -1,8 +1,12 @@
 """Class for interacting with the Monday.com API's Updates endpoint."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
+from src.monday.graphql.upload import ProgressCallback, Upload, UploadSource
 
 from .base import BaseResource
+from .fields import UPDATE_FIELDS
+from .files import UpdateTarget
 
 
 class UpdateResource(BaseResource):
@@ -13,6 +17,7 @@ class UpdateResource(BaseResource):
         ids: str | list[str] | None = None,
         limit: int | None = 25,
         page: int | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """This method allows you to query updates.
 
@@ -22,24 +27,25 @@ class UpdateResource(BaseResource):
             ids (str, list[str] | None): The specific ID(s) to return updates for
             limit (int | None): The number of updates to get, the default is 25.
             page (int | None): Page number to get, starting at 1.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of UPDATE_FIELDS. Defaults to "default".
 
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""query {{
-            updates {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-                body
-                created_at
-                creator {{
-                    name
-                    id
+        query = compile_query(
+            """query ($ids: [ID!], $limit: Int, $page: Int) {{
+                updates (ids: $ids, limit: $limit, page: $page) {{
+                    {fields}
                 }}
-            }}
-        }}"""
+            }}""",
+            fields=render_fields(fields, UPDATE_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(ids=ids, limit=limit, page=page),
+        )
 
     async def create_update(
         self: "UpdateResource",
@@ -58,14 +64,18 @@ class UpdateResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            create_update {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($item_id: ID, $body: String!, $parent_id: ID) {{
+                create_update (item_id: $item_id, body: $body, parent_id: $parent_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(item_id=item_id, body=body, parent_id=parent_id),
+        )
 
     async def like_update(self: "UpdateResource", update_id: str) -> dict:
         """Allows you to like an update via the API.
@@ -76,14 +86,15 @@ class UpdateResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            like_update ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($update_id: ID!) {{
+                like_update (update_id: $update_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(query, variables(update_id=update_id))
 
     async def clear_item_updates(self: "UpdateResource", item_id: str) -> dict:
         """Clear all updates on a specific item, including replies and likes.
@@ -94,14 +105,15 @@ class UpdateResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            clear_item_updates ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($item_id: ID!) {{
+                clear_item_updates (item_id: $item_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(query, variables(item_id=item_id))
 
     async def delete_update(self: "UpdateResource", update_id: str) -> dict:
         """Allows you to delete an update of an item.
@@ -112,33 +124,42 @@ class UpdateResource(BaseResource):
         Returns:
             (dict): dict object with the response from the API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_update ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($update_id: ID!) {{
+                delete_update (id: $update_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(query, variables(update_id=update_id))
 
     async def add_file_to_update(
         self: "UpdateResource",
         update_id: str,
-        file: str,
+        file: UploadSource | Upload,
+        *,
+        progress: ProgressCallback | None = None,
     ) -> dict:
         """Adds a file to an update.
 
+        The file is streamed from its source while the request is sent, so it is
+        never loaded in memory as a whole.
+
         Args:
             update_id (str): Id of the update to be updated
-            file (str): Path to the file to be added
+            file (UploadSource | Upload): The file to be added: a path, bytes, a
+                binary file object, an async iterator of bytes or an Upload.
+            progress (ProgressCallback, optional): Called with the number of
+                bytes sent so far and the total size, if known. Ignored when
+                `file` is an Upload, which has its own callback.
 
         Returns:
             (dict): dict object with the response from the API
         """
-        query = f"""mutation ($file: File!) {{
-            add_file_to_update(update_id: "{update_id}", file: $file) {{
-                id
-            }}
-        }}"""
-
-        return await self.client_file_upload.execute(query, variables={"file": file})
+        if not isinstance(file, Upload):
+            file = Upload(file, progress=progress)
+        return await self.client_file_upload.execute(
+            UpdateTarget(update_id).mutation(),
+            variables={"file": file},
+        )
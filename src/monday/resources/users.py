@@ -1,8 +1,12 @@
 """Class for interacting with the Monday.com API's Users endpoint."""
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.loader import DEFAULT_BATCH_SIZE, DataLoader
+from src.monday.graphql.query import compile_query, variables
+from src.monday.utils import cache_tags
 
 from .base import BaseResource
+from .fields import CURRENT_USER_FIELDS, USER_FIELDS
 from .types.types import BoardSubscriberKind, UserKind
 
 
@@ -20,6 +24,7 @@ class UserResource(BaseResource):
         *,
         newest_first: bool | None = None,
         non_active: bool | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """Fetch user(s) data from Monday.com.
 
@@ -38,94 +43,98 @@ class UserResource(BaseResource):
             newest_first (bool): Get the recently created users at the top of the list.
             non-active (bool): Returns the account's non-active users.
             page (int): The page number to return. Starts at 1.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of USER_FIELDS. Defaults to "default".
 
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind"])
-
-        query = f"""query
-        {{
-            users {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-                birthday
-                country_code
-                created_at
-                current_language
-                email
-                enabled
-                is_admin
-                is_guest
-                is_pending
-                is_verified
-                is_view_only
-                join_date
-                last_activity
-                location
-                mobile_phone
-                name
-                out_of_office {{
-                    active
-                    disable_notifications
-                    end_date
-                    start_date
-                    type
+        query = compile_query(
+            """query (
+                $emails: [String]
+                $ids: [ID!]
+                $kind: UserKind
+                $limit: Int
+                $name: String
+                $page: Int
+                $newest_first: Boolean
+                $non_active: Boolean
+            ) {{
+                users (
+                    emails: $emails
+                    ids: $ids
+                    kind: $kind
+                    limit: $limit
+                    name: $name
+                    page: $page
+                    newest_first: $newest_first
+                    non_active: $non_active
+                ) {{
+                    {fields}
                 }}
-                phone
-                photo_original
-                photo_small
-                teams {{
-                    id
-                    name
-                }}
-                time_zone_identifier
-                title
-                url
-                utc_hours_diff
-            }}
-        }}"""
+            }}""",
+            fields=render_fields(fields, USER_FIELDS),
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                emails=emails,
+                ids=ids,
+                kind=kind,
+                limit=limit,
+                name=name,
+                page=page,
+                newest_first=newest_first,
+                non_active=non_active,
+            ),
+            cache_tags=cache_tags("users", ids),
+        )
+
+    def loader(
+        self: "UserResource",
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> DataLoader:
+        """Return a loader that batches lookups of users by id.
+
+        Every `load(id)` made during the same event loop iteration is resolved
+        with a single users query, and results are cached by the loader.
+
+        Args:
+            max_batch_size (int, optional): The maximum number of ids per query.
 
-        return await self.client.execute(query)
+        Returns:
+            DataLoader: A new loader, resolving each id to a user dict or None.
+        """
+        return DataLoader(self._load_users, max_batch_size=max_batch_size)
+
+    async def _load_users(self: "UserResource", ids: list[str]) -> dict[str, dict]:
+        response = await self.fetch_users(ids=ids, limit=len(ids))
+        return {user["id"]: user for user in response["data"]["users"]}
 
-    async def fetch_current_user(self: "UserResource") -> dict:
+    async def fetch_current_user(
+        self: "UserResource",
+        fields: FieldSpec = "default",
+    ) -> dict:
         """Returns the user details of the user whose API key is being used.
 
+        Args:
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of CURRENT_USER_FIELDS. Defaults to "default".
+
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        query = """
-            query {
-                me {
-                    birthday
-                    country_code
-                    created_at
-                    join_date
-                    email
-                    enabled
-                    id
-                    is_admin
-                    is_guest
-                    is_pending
-                    is_view_only
-                    location
-                    mobile_phone
-                    name
-                    phone
-                    photo_original
-                    photo_small
-                    teams {
-                        id
-                        name
-                    }
-                    time_zone_identifier
-                    title
-                    url
-                    utc_hours_diff
-                }
-            }
-        """
+        query = compile_query(
+            """query {{
+                me {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, CURRENT_USER_FIELDS),
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(query, cache_tags=cache_tags("users"))
 
     async def add_users_to_board(
         self: "UserResource",
@@ -143,15 +152,27 @@ class UserResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind"])
-
-        query = f"""mutation {{
-            add_users_to_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $board_id: ID!
+                $user_ids: [ID!]!
+                $kind: BoardSubscriberKind
+            ) {{
+                add_users_to_board (
+                    board_id: $board_id
+                    user_ids: $user_ids
+                    kind: $kind
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, user_ids=user_ids, kind=kind),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
 
     async def delete_subscribers_from_board(
         self: "UserResource",
@@ -166,12 +187,19 @@ class UserResource(BaseResource):
         Returns:
             dict: dictionary response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-
-        query = f"""mutation {{
-            delete_subscribers_from_board ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($board_id: ID!, $user_ids: [ID!]!) {{
+                delete_subscribers_from_board (
+                    board_id: $board_id
+                    user_ids: $user_ids
+                ) {{
+                    id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(board_id=board_id, user_ids=user_ids),
+            invalidates=cache_tags("boards", board_id, listings=True),
+        )
@@ -1,41 +1,60 @@
 """Class for interacting with the Monday.com API's Versions endpoint."""
 
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query
+from src.monday.utils import cache_tags
+
 from .base import BaseResource
+from .fields import VERSION_FIELDS
 
 
 class VersionResource(BaseResource):
     """Class for interacting with the Monday.com API's Users endpoint."""
 
-    async def fetch_versions(self: "VersionResource") -> dict:
+    async def fetch_versions(
+        self: "VersionResource",
+        fields: FieldSpec = "default",
+    ) -> dict:
         """Versions will return metadata about all available API versions.
 
+        Args:
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of VERSION_FIELDS. Defaults to "default".
+
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        query = """query
-        {
-            versions {
-                kind
-                value
-                display_name
-            }
-        }"""
-
-        return await self.client.execute(query)
-
-    async def fetch_version(self: "VersionResource") -> dict:
+        query = compile_query(
+            """query {{
+                versions {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, VERSION_FIELDS),
+        )
+
+        return await self.client.execute(query, cache_tags=cache_tags("versions"))
+
+    async def fetch_version(
+        self: "VersionResource",
+        fields: FieldSpec = "default",
+    ) -> dict:
         """Version will return metadata about the API version used to make a request.
 
+        Args:
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of VERSION_FIELDS. Defaults to "default".
+
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        query = """query
-        {
-            version {
-                kind
-                value
-                display_name
-            }
-        }"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """query {{
+                version {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, VERSION_FIELDS),
+        )
+
+        return await self.client.execute(query, cache_tags=cache_tags("versions"))
@@ -1,6 +1,10 @@
 """This module provides the Webhooks class for querying webhooks."""
 
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
+
 from .base import BaseResource
+from .fields import WEBHOOK_FIELDS
 
 
 class WebhookResource(BaseResource):
@@ -10,6 +14,7 @@ class WebhookResource(BaseResource):
         self: "WebhookResource",
         board_id: str,
         app_webhooks_only: bool | None = None,
+        fields: FieldSpec = "default",
     ) -> dict:
         """This method allows you to query webhooks.
 
@@ -22,22 +27,28 @@ class WebhookResource(BaseResource):
                 subscribes to.
             app_webhooks_only (bool): Returns only the webhooks created by the app
                 initiating the request.
+            fields (FieldSpec, optional): The fields to return, or the name of a
+                preset of WEBHOOK_FIELDS. Defaults to "default".
 
         Returns:
             dict: Dict response from the monday.com GraphQL API
         """
-        query = f"""query {{
-            webhooks(board_id: {board_id}
-            {f", app_webhooks_only: {app_webhooks_only}" if app_webhooks_only else ""}
-            ) {{
-                id
-                event
-                board_id
-                config
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """query ($board_id: ID!, $app_webhooks_only: Boolean) {{
+                webhooks (board_id: $board_id, app_webhooks_only: $app_webhooks_only) {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, WEBHOOK_FIELDS),
+        )
+
+        return await self.client.execute(
+            query,
+            variables(
+                board_id=board_id,
+                app_webhooks_only=app_webhooks_only or None,
+            ),
+        )
 
     async def delete_webhook(
         self: "WebhookResource",
@@ -53,11 +64,13 @@ class WebhookResource(BaseResource):
         Returns:
             dict: Dict response from the monday.com GraphQL API
         """
-        query = f"""mutation {{
-            delete_webhook (id: {webhook_id}) {{
-                id
-                board_id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($webhook_id: ID!) {{
+                delete_webhook (id: $webhook_id) {{
+                    id
+                    board_id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(query, variables(webhook_id=webhook_id))
@@ -2,9 +2,11 @@
 
 from typing import Literal
 
-from src.monday.utils import parse_parameters
+from src.monday.graphql.fields import FieldSpec, render_fields
+from src.monday.graphql.query import compile_query, variables
 
 from .base import BaseResource
+from .fields import WORKSPACE_FIELDS
 from .types.types import State, SubscriberKind, WorkspaceKind
 
 
@@ -21,6 +23,7 @@ class WorkspaceResource(BaseResource):
         state: State | None = None,
         *,
         all_fields: bool = False,
+        fields: FieldSpec = "default",
     ) -> dict:
         """This method allows you to query workspaces.
 
@@ -35,52 +38,50 @@ class WorkspaceResource(BaseResource):
             order_by (str): The order in which to retrieve your boards.
                 For now, you can only order by created_at.
             page (int): The page number to get, starting at 1.
+            all_fields (bool): Whether to include the workspace's product and
+                subscribers. Same as passing fields="full".
+            fields (FieldSpec): The fields to return, or the name of a preset of
+                WORKSPACE_FIELDS. Defaults to "default".
 
         Returns:
             (dict): Dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind", "state", "order_by"])
-
-        extra_fields = """
-        account_product {
-                id
-                kind
-            }
-            owners_subscribers {
-                id
-                name
-                email
-            }
-            team_owners_subscribers {
-                id
-                name
-                picture_url
-            }
-            teams_subscribers {
-                id
-                name
-                picture_url
-            }
-            users_subscribers {
-                id
-                name
-                email
-        }"""
-
-        query = f"""query
-            {{
-            workspaces {f"({", ".join(parameters)})" if parameters else ""} {{
-                id
-                name
-                created_at
-                description
-                is_default_workspace
-                state
-                {extra_fields if all_fields else ""}
-            }}
-        }}"""
-        print(query)
-        return await self.client.execute(query)
+        if all_fields and fields == "default":
+            fields = "full"
+
+        query = compile_query(
+            """query (
+                $ids: [ID!]
+                $kind: WorkspaceKind
+                $limit: Int
+                $order_by: WorkspacesOrderBy
+                $page: Int
+                $state: State
+            ) {{
+                workspaces (
+                    ids: $ids
+                    kind: $kind
+                    limit: $limit
+                    order_by: $order_by
+                    page: $page
+                    state: $state
+                ) {{
+                    {fields}
+                }}
+            }}""",
+            fields=render_fields(fields, WORKSPACE_FIELDS),
+        )
+        return await self.client.execute(
+            query,
+            variables(
+                ids=ids,
+                kind=kind,
+                limit=limit,
+                order_by=order_by,
+                page=page,
+                state=state,
+            ),
+        )
 
     async def create_workspace(
         self: "WorkspaceResource",
@@ -100,16 +101,28 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind"])
-        query = f"""mutation {{
-            create_workspace ({", ".join(parameters)}) {{
-                id
-                name
-                kind
-                description
-            }}
-        }}"""
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation (
+                $name: String!
+                $kind: WorkspaceKind!
+                $description: String
+            ) {{
+                create_workspace (
+                    name: $name
+                    kind: $kind
+                    description: $description
+                ) {{
+                    id
+                    name
+                    kind
+                    description
+                }}
+            }}""",
+        )
+        return await self.client.execute(
+            query,
+            variables(name=name, kind=kind, description=description),
+        )
 
     async def update_workspace(
         self: "WorkspaceResource",
@@ -129,24 +142,26 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: The updated workspace information.
         """
-        attributes = parse_parameters(
-            locals(),
-            literals=["kind"],
-            exclude=["workspace_id"],
-        )
-
-        query = f"""mutation {{
-            update_workspace (
-                id: "{workspace_id}",
-                attributes: {{{", ".join(attributes)}}}
+        query = compile_query(
+            """mutation (
+                $workspace_id: ID
+                $attributes: UpdateWorkspaceAttributesInput!
             ) {{
-                id
-                name
-                kind
-                description
-            }}
-        }}"""
-        return await self.client.execute(query)
+                update_workspace (id: $workspace_id, attributes: $attributes) {{
+                    id
+                    name
+                    kind
+                    description
+                }}
+            }}""",
+        )
+        return await self.client.execute(
+            query,
+            variables(
+                workspace_id=workspace_id,
+                attributes=variables(name=name, description=description, kind=kind),
+            ),
+        )
 
     async def delete_workspace(self: "WorkspaceResource", workspace_id: str) -> dict:
         """Allows you to delete a workspace.
@@ -157,13 +172,18 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        query = f"""mutation {{
-            delete_workspace ( workspace_id: "{workspace_id}") {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($workspace_id: ID!) {{
+                delete_workspace (workspace_id: $workspace_id) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(workspace_id=workspace_id),
+        )
 
     async def add_users_to_workspace(
         self: "WorkspaceResource",
@@ -183,13 +203,25 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind"])
-        query = f"""mutation {{
-            add_users_to_workspace ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation (
+                $workspace_id: ID!
+                $user_ids: [ID!]!
+                $kind: WorkspaceSubscriberKind!
+            ) {{
+                add_users_to_workspace (
+                    workspace_id: $workspace_id
+                    user_ids: $user_ids
+                    kind: $kind
+                ) {{
+                    id
+                }}
+            }}""",
+        )
+        return await self.client.execute(
+            query,
+            variables(workspace_id=workspace_id, user_ids=user_ids, kind=kind),
+        )
 
     async def delete_users_from_workspace(
         self: "WorkspaceResource",
@@ -205,14 +237,21 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation{{
-            delete_users_from_workspace ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation ($workspace_id: ID!, $user_ids: [ID!]!) {{
+                delete_users_from_workspace (
+                    workspace_id: $workspace_id
+                    user_ids: $user_ids
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(workspace_id=workspace_id, user_ids=user_ids),
+        )
 
     async def add_teams_to_workspace(
         self: "WorkspaceResource",
@@ -230,14 +269,26 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals(), literals=["kind"])
-        query = f"""mutation {{
-            add_teams_to_workspace ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
+        query = compile_query(
+            """mutation (
+                $workspace_id: ID!
+                $team_ids: [ID!]!
+                $kind: WorkspaceSubscriberKind!
+            ) {{
+                add_teams_to_workspace (
+                    workspace_id: $workspace_id
+                    team_ids: $team_ids
+                    kind: $kind
+                ) {{
+                    id
+                }}
+            }}""",
+        )
 
-        return await self.client.execute(query)
+        return await self.client.execute(
+            query,
+            variables(workspace_id=workspace_id, team_ids=team_ids, kind=kind),
+        )
 
     async def delete_teams_from_workspace(
         self: "WorkspaceResource",
@@ -253,11 +304,18 @@ class WorkspaceResource(BaseResource):
         Returns:
             dict: dict response from the monday.com GraphQL API
         """
-        parameters = parse_parameters(locals())
-        query = f"""mutation {{
-            delete_teams_from_workspace ({", ".join(parameters)}) {{
-                id
-            }}
-        }}"""
-
-        return await self.client.execute(query)
+        query = compile_query(
+            """mutation ($workspace_id: ID!, $team_ids: [ID!]!) {{
+                delete_teams_from_workspace (
+                    workspace_id: $workspace_id
+                    team_ids: $team_ids
+                ) {{
+                    id
+                }}
+            }}""",
+        )
+
+        return await self.client.execute(
+            query,
+            variables(workspace_id=workspace_id, team_ids=team_ids),
+        )
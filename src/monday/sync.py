@@ -0,0 +1,251 @@
+"""Blocking facade of MondayClient, for callers without an event loop."""
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from types import TracebackType
+from typing import Any
+
+from .client import MondayClient
+from .graphql.scheduler import ComplexityBudget
+from .resources.base import BaseResource
+
+
+class SyncMondayClient:
+    """Blocking client for the Monday.com API.
+
+    Every resource of MondayClient is mirrored with blocking methods. Calls are
+    run on a single event loop living in a background thread, so they share one
+    keep-alive connection pool and complexity scheduler, and calls made from
+    several threads at once are sent concurrently. Async iterators, such as
+    `items.iter_items`, become regular iterators. Calls block, so they can't be
+    made from a running event loop: await MondayClient there instead.
+
+    The loop is started on first use and restarted in a forked process, so a
+    client can be created at import time by prefork workers such as Celery's.
+
+    Example:
+        client = SyncMondayClient(api_key)
+        boards = client.boards.fetch_boards(limit=5)
+        for item in client.items.iter_items(board_id):
+            print(item["name"])
+        client.close()
+
+    Attributes:
+        client (MondayClient): The async client the calls are run with.
+    """
+
+    def __init__(
+        self: "SyncMondayClient",
+        api_key: str,
+        api_version: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize a new instance of SyncMondayClient.
+
+        Args:
+            api_key (str): The API key used to authenticate requests.
+            api_version (str, optional): The API version to request.
+            **kwargs (Any): The other arguments of MondayClient.
+        """
+        self._arguments = (api_key, api_version, kwargs)
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: MondayClient | None = None
+
+    @property
+    def client(self: "SyncMondayClient") -> MondayClient:
+        """Return the async client, starting the background loop if needed."""
+        self._start()
+        return self._client  # type: ignore[return-value]
+
+    @property
+    def complexity_budget(self: "SyncMondayClient") -> ComplexityBudget:
+        """Return a snapshot of the account's remaining complexity budget."""
+        return self.client.complexity_budget
+
+    def run[T](self: "SyncMondayClient", awaitable: Awaitable[T]) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        This gives blocking callers access to everything the async client can
+        do, such as running several calls concurrently.
+
+        Example:
+            async def fetch_all() -> list[dict]:
+                return await asyncio.gather(
+                    *(client.client.boards.fetch_boards(ids=[i]) for i in ids),
+                )
+
+            responses = client.run(fetch_all())
+
+        Args:
+            awaitable (Awaitable): The coroutine, which must use `client` rather
+                than a client of another event loop.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Raises:
+            RuntimeError: If called while an event loop is running in the thread,
+                which would block that loop, or never return when it is the
+                background loop itself.
+        """
+        if _running():
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            msg = (
+                "SyncMondayClient can't be called from a running event loop, "
+                "which it would block. Await the methods of MondayClient instead."
+            )
+            raise RuntimeError(msg)
+        if not inspect.iscoroutine(awaitable):
+            awaitable = _await(awaitable)
+        self._start()
+        return asyncio.run_coroutine_threadsafe(awaitable, self._loop).result()
+
+    def iterate[T](
+        self: "SyncMondayClient",
+        iterator: AsyncIterator[T],
+    ) -> Iterator[T]:
+        """Iterate over an async iterator of the async client, blocking.
+
+        Args:
+            iterator (AsyncIterator): The async iterator, such as the one returned
+                by `client.items.iter_items(...)`.
+
+        Yields:
+            Any: Each element of the iterator.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(anext(iterator))
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and self._loop is not None:
+                self.run(aclose())
+
+    def close(self: "SyncMondayClient") -> None:
+        """Close the connection pool and stop the background loop."""
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+            owned = self._pid == os.getpid()
+        if loop is None or not owned:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def __enter__(self: "SyncMondayClient") -> "SyncMondayClient":  # noqa: D105
+        return self
+
+    def __exit__(  # noqa: D105
+        self: "SyncMondayClient",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __getattr__(  # noqa: D105
+        self: "SyncMondayClient",
+        name: str,
+    ) -> "_SyncResource":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        resource = getattr(self.client, name)
+        if not isinstance(resource, BaseResource):
+            raise AttributeError(name)
+        return _SyncResource(resource, self)
+
+    def _start(self: "SyncMondayClient") -> None:
+        """Start the background loop, or restart it in a forked process."""
+        if self._pid == os.getpid() and self._loop is not None:
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="monday-sync",
+                daemon=True,
+            )
+            thread.start()
+            api_key, api_version, kwargs = self._arguments
+            self._client = asyncio.run_coroutine_threadsafe(
+                _create_client(api_key, api_version, kwargs),
+                loop,
+            ).result()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+
+class _SyncResource:
+    """Resource whose methods block until the background loop has run them."""
+
+    def __init__(
+        self: "_SyncResource",
+        resource: BaseResource,
+        client: SyncMondayClient,
+    ) -> None:
+        self._resource = resource
+        self._client = client
+
+    def __getattr__(self: "_SyncResource", name: str) -> Any:  # noqa: ANN401
+        attribute = getattr(self._resource, name)
+        if inspect.isasyncgenfunction(attribute):
+
+            @functools.wraps(attribute)
+            def iterate(*args: Any, **kwargs: Any) -> Iterator:  # noqa: ANN401
+                return self._client.iterate(attribute(*args, **kwargs))
+
+            return iterate
+
+        if inspect.iscoroutinefunction(attribute):
+
+            @functools.wraps(attribute)
+            def run(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                return self._client.run(attribute(*args, **kwargs))
+
+            return run
+
+        return attribute
+
+    def __repr__(self: "_SyncResource") -> str:  # noqa: D105
+        return f"Sync{self._resource!r}"
+
+
+def _running() -> bool:
+    """Return whether an event loop is running in the current thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def _await[T](awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _create_client(
+    api_key: str,
+    api_version: str | None,
+    kwargs: dict[str, Any],
+) -> MondayClient:
+    """Create the async client from within the loop it will be used on."""
+    return MondayClient(api_key, api_version, **kwargs)
+
+
+__all__ = ["SyncMondayClient"]
@@ -1,54 +1,29 @@
 """Provides utility functions for Monday.com API."""
 
-import json
-from typing import Any
 
-
-def monday_json_stringify(value: object) -> str:
-    """Convert a python object to a compatible JSON string.
-
-    Args:
-        value (oject): Monday query string
-
-    Returns:
-        json: JSON string
-
-    """
-    # Monday's API requires a JSON encoded string for JSON values. json.dumps() doesn't
-    # work. The only thing that works is a JSON encoded, JSON encoded string.
-
-    return json.dumps(json.dumps(value))
-
-
-def parse_parameters(
-    parameters: dict[str, Any],
-    literals: list[str] | None = None,
-    exclude: list[str] | None = None,
+def cache_tags(
+    namespace: str,
+    ids: list[str] | str | int | None = None,
+    *,
+    listings: bool = False,
 ) -> list[str]:
-    """Parse parameters for a query.
+    """Return the cache tags of one or more resources.
 
     Args:
-        parameters (dict): The parameters to parse.
-        literals (list, optional): The literal values. Defaults to None.
-        exclude (list, optional): The keys to exclude. Defaults to None.
+        namespace (str): The kind of resource, e.g. "boards".
+        ids (str | [str], optional): The resources' identifiers. Without ids, the
+            tag of unfiltered listings ("boards:*") is returned.
+        listings (bool, optional): Also return the tag of unfiltered listings, as
+            mutations of a resource also change the listings that include it.
 
     Returns:
-        list: The parsed parameters.
+        list: The cache tags.
     """
-    parameters.pop("self", None)
-    parameters.pop("all_fields", None)
-    if exclude:
-        for key in exclude:
-            parameters.pop(key, None)
-    if literals:
-        return [
-            f"{key}: {value if key in literals else json.dumps(value)}"
-            for key, value in parameters.items()
-            if value is not None
-        ]
-    else:
-        return [
-            f"{key}: {json.dumps(value)}"
-            for key, value in parameters.items()
-            if value is not None
-        ]
+    if ids is None:
+        return [f"{namespace}:*"]
+    if isinstance(ids, str | int):
+        ids = [ids]
+    tags = [f"{namespace}:{id_}" for id_ in ids]
+    if listings:
+        tags.append(f"{namespace}:*")
+    return tags
@@ -0,0 +1 @@
+"""Tests of the Monday.com client, run offline against mock transports."""
@@ -0,0 +1,55 @@
+"""Tests of MutationBatch."""
+
+import asyncio
+import json
+import re
+
+import httpx
+
+from src.monday.graphql.batch import MutationBatch
+from src.monday.graphql.client import GraphQLClient
+
+ALIAS_PATTERN = re.compile(r"(m\d+): (\w+)")
+
+
+def aliasing_server(documents: list[str]) -> httpx.MockTransport:
+    """Answer each aliased mutation with the alias it was sent under."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        documents.append(query)
+        data = {alias: {"id": alias} for alias, _ in ALIAS_PATTERN.findall(query)}
+        return httpx.Response(200, json={"data": data})
+
+    return httpx.MockTransport(handle)
+
+
+def test_results_follow_submission_order() -> None:
+    """Each submission has one result, including coroutines failing early."""
+    documents: list[str] = []
+
+    async def fail() -> dict:
+        msg = "Invalid row."
+        raise ValueError(msg)
+
+    async def run() -> list:
+        client = GraphQLClient(
+            "https://api.monday.com/v2",
+            "key",
+            http_client=httpx.AsyncClient(transport=aliasing_server(documents)),
+        )
+        async with MutationBatch(client, chunk_size=2) as batch:
+            batch.add("mutation { archive_item(item_id: 1) { id } }")
+            batch.schedule(fail())
+            batch.add("mutation { archive_item(item_id: 2) { id } }")
+            batch.add("mutation { archive_item(item_id: 3) { id } }")
+        return batch.results
+
+    results = asyncio.run(run())
+
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[0].data == {"data": {"archive_item": {"id": "m1"}}}
+    assert results[2].data == {"data": {"archive_item": {"id": "m2"}}}
+    assert results[3].data == {"data": {"archive_item": {"id": "m1"}}}
+    assert len(documents) == 2
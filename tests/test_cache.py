@@ -0,0 +1,121 @@
+"""Tests of QueryCache, alone and as used by GraphQLClient."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.monday.graphql import cache as cache_module
+from src.monday.graphql.cache import QueryCache
+from src.monday.graphql.client import GraphQLClient
+
+
+class Clock:
+    """A monotonic clock that only moves when told to."""
+
+    def __init__(self: "Clock") -> None:
+        """Initialize a new instance of Clock."""
+        self.now = 1_000.0
+
+    def __call__(self: "Clock") -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Replace the clock of the cache with one moved by the test."""
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_entries_expire_after_their_ttl(clock: Clock) -> None:
+    """Entries expire after the shortest TTL of their tag namespaces."""
+    cache = QueryCache(ttl=60, ttls={"columns": 10})
+    cache.set("boards", {"data": 1}, ["boards:*"])
+    cache.set("columns", {"data": 2}, ["boards:1", "columns:1"])
+
+    clock.now += 9
+    assert cache.get("columns") == {"data": 2}
+    clock.now += 1
+    assert cache.get("columns") is None
+    assert cache.get("boards") == {"data": 1}
+    clock.now += 50
+    assert cache.get("boards") is None
+    assert cache.stats.size == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    """A full cache drops the entry that was used the longest time ago."""
+    cache = QueryCache(maxsize=2)
+    cache.set("a", {"data": "a"})
+    cache.set("b", {"data": "b"})
+    cache.get("a")
+    cache.set("c", {"data": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"data": "a"}
+    assert cache.get("c") == {"data": "c"}
+
+
+def test_invalidating_a_tag_drops_its_entries(clock: Clock) -> None:
+    """Only the entries carrying an invalidated tag are dropped."""
+    cache = QueryCache()
+    cache.set("columns of 1", {"data": 1}, ["columns:1"])
+    cache.set("board 1", {"data": 2}, ["boards:1", "columns:1"])
+    cache.set("columns of 2", {"data": 3}, ["columns:2"])
+
+    assert cache.invalidate("columns:1", "tags:*") == 2
+    assert cache.get("columns of 1") is None
+    assert cache.get("board 1") is None
+    assert cache.get("columns of 2") == {"data": 3}
+
+
+def test_keys_ignore_formatting() -> None:
+    """Queries differing only in whitespace share a key, variables don't."""
+    assert QueryCache.key("query {\n  boards { id }\n}") == QueryCache.key(
+        "query { boards { id } }",
+    )
+    assert QueryCache.key("query { a }", {"x": 1}) != QueryCache.key(
+        "query { a }",
+        {"x": 2},
+    )
+
+
+def test_mutations_bypass_the_cache() -> None:
+    """Mutations are always sent, and invalidate the tags they are given."""
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["query"])
+        return httpx.Response(200, json={"data": {"count": len(sent)}})
+
+    async def run() -> GraphQLClient:
+        client = GraphQLClient(
+            "https://api.monday.com/v2",
+            "key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+            cache=QueryCache(),
+        )
+        query = "query { columns { id } }"
+        mutation = "mutation { create_column { id } }"
+        await client.execute(query, cache_tags=["columns:1"])
+        await client.execute(query, cache_tags=["columns:1"])
+        await client.execute(mutation, cache_tags=["columns:1"])
+        await client.execute(mutation, cache_tags=["columns:1"])
+        await client.execute(mutation, invalidates=["columns:1"])
+        await client.execute(query, cache_tags=["columns:1"])
+        return client
+
+    client = asyncio.run(run())
+
+    assert [query.split()[0] for query in sent] == [
+        "query",
+        "mutation",
+        "mutation",
+        "mutation",
+        "query",
+    ]
+    assert client.cache.stats.hits == 1
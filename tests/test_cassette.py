@@ -0,0 +1,106 @@
+"""Tests of recording traffic to a cassette and replaying it."""
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.monday.exceptions import CassetteError
+from src.monday.graphql.cassette import (
+    CassetteEntry,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+from src.monday.graphql.client import GraphQLClient
+
+QUERIES = [
+    "query { boards { state } }",
+    "query { me { id } }",
+    "query { boards { state } }",
+]
+
+
+def polled_server() -> httpx.MockTransport:
+    """Answer with a counter, so that repeated queries get new responses."""
+    sent = 0
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        query = json.loads(request.content)["query"]
+        return httpx.Response(
+            200,
+            json={"data": {"sent": sent, "me": "me" in query}},
+            headers={"Set-Cookie": "session=secret"},
+        )
+
+    return httpx.MockTransport(handle)
+
+
+async def run_job(transport: httpx.AsyncBaseTransport) -> list[dict]:
+    """Send the queries of a job, and return their responses."""
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = GraphQLClient(
+            "https://api.monday.com/v2",
+            "key",
+            http_client=http_client,
+        )
+        return [await client.execute(query) for query in QUERIES]
+
+
+def test_replay_returns_the_recorded_responses(tmp_path: Path) -> None:
+    """Replaying a cassette answers the job as the API did, in order."""
+    path = tmp_path / "job.jsonl.gz"
+    recorded = asyncio.run(run_job(RecordingTransport(path, polled_server())))
+    replayed = asyncio.run(run_job(ReplayTransport(path)))
+
+    assert replayed == recorded
+    assert [response["data"]["sent"] for response in replayed] == [1, 2, 3]
+    entries = list(read_cassette(path))
+    assert len(entries) == len(QUERIES)
+    assert entries[0].key == entries[2].key
+    assert all("set-cookie" not in dict(entry.headers) for entry in entries)
+
+
+def test_replay_fails_once_the_responses_are_used(tmp_path: Path) -> None:
+    """A request replayed more often than recorded fails unless repeating."""
+    path = tmp_path / "job.jsonl.gz"
+    asyncio.run(run_job(RecordingTransport(path, polled_server())))
+    replay = ReplayTransport(path)
+    asyncio.run(run_job(replay))
+
+    with pytest.raises(CassetteError):
+        asyncio.run(run_job(replay))
+    assert asyncio.run(run_job(ReplayTransport(path, repeat=True)))
+
+
+def test_interrupted_recording_is_readable(tmp_path: Path) -> None:
+    """A cassette whose recording never finished keeps its complete entries."""
+    path = tmp_path / "job.jsonl.gz"
+    recorder = RecordingTransport(path)
+    for key in "ab":
+        recorder.record(CassetteEntry(key, "POST", "url", 200, [], "", 0.1))
+    recorded = path.stat().st_size
+    recorder.record(CassetteEntry("c", "POST", "url", 200, [], "", 0.1))
+    # As if the process had died: the gzip stream is never terminated.
+    data = path.read_bytes()
+    asyncio.run(recorder.aclose())
+
+    path.write_bytes(data)
+    assert [entry.key for entry in read_cassette(path)] == ["a", "b", "c"]
+    path.write_bytes(data[: (recorded + len(data)) // 2])
+    assert [entry.key for entry in read_cassette(path)] == ["a", "b"]
+
+
+def test_other_files_are_rejected(tmp_path: Path) -> None:
+    """Files that aren't cassettes raise CassetteError."""
+    path = tmp_path / "other.jsonl.gz"
+    with gzip.open(path, "wt") as file:
+        file.write('{"version": 0}\n')
+
+    with pytest.raises(CassetteError):
+        ReplayTransport(path)
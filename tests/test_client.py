@@ -0,0 +1,91 @@
+"""Tests of GraphQLClient's handling of identical queries in flight."""
+
+import asyncio
+import json
+
+import httpx
+
+from src.monday.graphql.client import GraphQLClient
+
+QUERY = "query { boards { id } }"
+
+
+def slow_server(sent: list[str], cancelled: list[str]) -> httpx.MockTransport:
+    """Answer after a short delay, recording requests that were cancelled."""
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        sent.append(query)
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        return httpx.Response(200, json={"data": {"boards": [{"id": "1"}]}})
+
+    return httpx.MockTransport(handle)
+
+
+def client_for(transport: httpx.MockTransport) -> GraphQLClient:
+    """Return a client sending its requests to the transport."""
+    return GraphQLClient(
+        "https://api.monday.com/v2",
+        "key",
+        http_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_identical_queries_share_one_request() -> None:
+    """Queries in flight at the same time are sent once."""
+    sent: list[str] = []
+
+    async def run() -> list[dict]:
+        client = client_for(slow_server(sent, []))
+        return await asyncio.gather(*(client.execute(QUERY) for _ in range(3)))
+
+    first, *others = asyncio.run(run())
+
+    assert len(sent) == 1
+    assert all(response is first for response in others)
+
+
+def test_cancelled_waiter_leaves_the_request_to_the_others() -> None:
+    """Cancelling one of two waiters doesn't cancel the shared request."""
+    sent: list[str] = []
+    cancelled: list[str] = []
+
+    async def run() -> dict:
+        client = client_for(slow_server(sent, cancelled))
+        first = asyncio.ensure_future(client.execute(QUERY))
+        second = asyncio.ensure_future(client.execute(QUERY))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        return await second
+
+    response = asyncio.run(run())
+
+    assert response["data"] == {"boards": [{"id": "1"}]}
+    assert len(sent) == 1
+    assert not cancelled
+
+
+def test_request_is_cancelled_with_its_last_waiter() -> None:
+    """Once every waiter is cancelled, the request itself is cancelled."""
+    cancelled: list[str] = []
+
+    async def run() -> GraphQLClient:
+        client = client_for(slow_server([], cancelled))
+        waiters = [asyncio.ensure_future(client.execute(QUERY)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        return client
+
+    client = asyncio.run(run())
+
+    assert len(cancelled) == 1
+    assert not client._in_flight
+    assert not client._waiters
@@ -0,0 +1,69 @@
+"""Tests of the column resource."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.monday import MondayClient
+from src.monday.graphql.codec import CODECS, get_codec
+
+from .test_batch import ALIAS_PATTERN, aliasing_server
+
+
+def test_bulk_returns_one_result_per_row() -> None:
+    """Rows that can't be sent hold their error, without shifting later rows."""
+    documents: list[str] = []
+    rows = [
+        ("1", {"text": "a"}),
+        ("2", {"text": object()}),
+        ("3",),
+        ("4", {"text": "b"}),
+    ]
+
+    async def run() -> list:
+        async with MondayClient(
+            "key",
+            transport=aliasing_server(documents),
+        ) as client:
+            return await client.columns.change_multiple_column_values_bulk(
+                "1",
+                rows,
+                chunk_size=2,
+            )
+
+    results = asyncio.run(run())
+
+    assert len(results) == len(rows)
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, TypeError)
+    assert isinstance(results[2].error, ValueError)
+    sent = [ALIAS_PATTERN.findall(document) for document in documents]
+    assert sent == [[("m1", "change_multiple_column_values")]] * 2
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_json_variables_are_encoded_with_the_client_codec(name: str) -> None:
+    """Column values are encoded by the client's codec, batched or not."""
+    values = {"text": "é", "numbers": 1.5}
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent.extend(json.loads(request.content)["variables"].values())
+        return httpx.Response(200, json={"data": {}})
+
+    async def run() -> None:
+        async with MondayClient(
+            "key",
+            transport=httpx.MockTransport(handle),
+            codec=get_codec(name),
+        ) as client:
+            await client.columns.change_column_value("1", "text", values, "2")
+            async with client.batch() as batch:
+                batch.columns.change_multiple_column_values("1", "2", values)
+
+    asyncio.run(run())
+
+    encoded = get_codec(name).dumps(values).decode()
+    assert sent.count(encoded) == 2
@@ -0,0 +1,111 @@
+"""Tests of the events emitted by GraphQLClient, and of the hooks using them."""
+
+import asyncio
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+from src.monday.exceptions import MondayError
+from src.monday.graphql.client import GraphQLClient
+from src.monday.graphql.events import (
+    ERROR,
+    REQUEST_END,
+    REQUEST_START,
+    Event,
+    operation_name,
+)
+
+PAGE_QUERY = "query { boards { items_page { cursor items { id } } } }"
+
+
+async def handle(request: httpx.Request) -> httpx.Response:
+    """Answer like the API, slowly for queries named slow."""
+    query = json.loads(request.content)["query"]
+    if "slow" in query:
+        await asyncio.sleep(10)
+    if "fail" in query:
+        return httpx.Response(200, json={"errors": [{"message": "Bad query."}]})
+    items = [{"id": str(index)} for index in range(100)]
+    page = {"cursor": None, "items": items}
+    return httpx.Response(200, json={"data": {"boards": [{"items_page": page}]}})
+
+
+def client_with(hooks: list) -> GraphQLClient:
+    """Return a client answered by `handle`, reporting to the hooks."""
+    return GraphQLClient(
+        "https://api.monday.com/v2",
+        "key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+        hooks=hooks,
+    )
+
+
+async def send_every_kind(client: GraphQLClient) -> None:
+    """Send a request that succeeds, fails, is cancelled and is streamed."""
+    await client.execute("query { me { id } }")
+    with pytest.raises(MondayError):
+        await client.execute("query fail { me { id } }")
+    slow = asyncio.ensure_future(client.execute("query slow { me { id } }"))
+    await asyncio.sleep(0.01)
+    slow.cancel()
+    await asyncio.gather(slow, return_exceptions=True)
+    items = client.stream(PAGE_QUERY)
+    async for _ in items:
+        break
+    await items.aclose()
+
+
+def test_every_started_request_ends_once() -> None:
+    """Each request_start is closed by exactly one request_end or error."""
+    events: list[Event] = []
+    asyncio.run(send_every_kind(client_with([events.append])))
+
+    starts = [event.request_id for event in events if event.kind == REQUEST_START]
+    ends = Counter(
+        event.request_id for event in events if event.kind in (REQUEST_END, ERROR)
+    )
+    assert len(starts) == 4
+    assert ends == Counter(starts)
+    errors = [type(event.error) for event in events if event.kind == ERROR]
+    assert errors == [MondayError, asyncio.CancelledError, GeneratorExit]
+
+
+def test_opentelemetry_spans_are_ended() -> None:
+    """Cancelled and closed requests end their span too."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from src.monday.graphql.telemetry import OpenTelemetryHook
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    hook = OpenTelemetryHook(provider.get_tracer("tests"))
+    asyncio.run(send_every_kind(client_with([hook])))
+
+    assert len(exporter.get_finished_spans()) == 4
+
+
+@pytest.mark.parametrize(
+    ("query", "operation"),
+    [
+        ("{ boards { id } }", "query boards"),
+        ("query { boards { id } users { id } }", "query boards,users"),
+        ('mutation { create_item(name: "{") { id } }', "mutation create_item"),
+        ("# mutation\nquery { me { id } }", "query me"),
+        (
+            "fragment f on Item { id }\nmutation M { archive_item { ...f } }",
+            "mutation archive_item",
+        ),
+        ('query ($x: JSON = {a: "}"}) { items { id } }', "query items"),
+    ],
+)
+def test_operation_name_lists_the_root_fields(query: str, operation: str) -> None:
+    """Root fields are found past comments, fragments and default values."""
+    assert operation_name(query) == operation
@@ -0,0 +1,75 @@
+"""Tests of uploading many files."""
+
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from src.monday import MondayClient
+from src.monday.resources.files import UpdateTarget, UploadResult
+
+
+def upload_server() -> httpx.MockTransport:
+    """Accept every file, except those whose content is b"bad"."""
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if b"\r\n\r\nbad\r\n" in body:
+            return httpx.Response(200, json={"errors": [{"message": "Bad file."}]})
+        return httpx.Response(200, json={"data": {"add_file_to_update": {"id": "1"}}})
+
+    return httpx.MockTransport(handle)
+
+
+def test_failures_are_recorded_per_file() -> None:
+    """Failed uploads, malformed pairs and callback errors don't stop the others."""
+    files = [
+        (UpdateTarget("1"), b"good"),
+        (UpdateTarget("2"), b"bad"),
+        (UpdateTarget("3"),),
+        (UpdateTarget("4"), b"good"),
+        (UpdateTarget("5"), b"good"),
+    ]
+    reported: list[UploadResult] = []
+
+    def on_result(result: UploadResult) -> None:
+        reported.append(result)
+        if result.target == UpdateTarget("4"):
+            msg = "Can't log."
+            raise RuntimeError(msg)
+
+    async def run() -> list[UploadResult]:
+        async with MondayClient("key", transport=upload_server()) as client:
+            return await client.files.upload_files(
+                files,
+                concurrency=2,
+                on_result=on_result,
+            )
+
+    results = asyncio.run(run())
+
+    assert [result.ok for result in results] == [True, False, False, False, True]
+    assert results[0].data == {"data": {"add_file_to_update": {"id": "1"}}}
+    assert results[0].size == len(b"good")
+    assert results[2].target is None
+    assert results[2].file == (UpdateTarget("3"),)
+    assert isinstance(results[2].error, ValueError)
+    assert isinstance(results[3].error, RuntimeError)
+    assert len(reported) == len(files)
+
+
+def test_errors_of_the_files_iterator_are_raised() -> None:
+    """An error raised while iterating over the pairs is raised as is."""
+
+    def files() -> Iterator[tuple[UpdateTarget, bytes]]:
+        yield UpdateTarget("1"), b"good"
+        msg = "Unreadable manifest."
+        raise ValueError(msg)
+
+    async def run() -> None:
+        async with MondayClient("key", transport=upload_server()) as client:
+            await client.files.upload_files(files())
+
+    with pytest.raises(ValueError, match="manifest"):
+        asyncio.run(run())
@@ -0,0 +1,96 @@
+"""Tests of paginating the items of boards."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.monday import MondayClient
+from src.monday.exceptions import ArgumentError
+from src.monday.resources.items import _item_fields
+
+
+def page_server(requests: list[dict], delay: float = 0) -> httpx.MockTransport:
+    """Answer every items page with a page of five items and a next cursor."""
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests.append(payload)
+        page = {"cursor": "next", "items": [{"id": str(len(requests))}] * 5}
+        if "next_items_page" in payload["query"]:
+            await asyncio.sleep(delay)
+            data = {"next_items_page": page}
+        else:
+            data = {"boards": [{"items_page": page}]}
+        return httpx.Response(200, json={"data": data})
+
+    return httpx.MockTransport(handle)
+
+
+def test_stopping_early_cancels_the_prefetched_page() -> None:
+    """Closing the iterator cancels the request of the next page."""
+    requests: list[dict] = []
+
+    async def run() -> set[asyncio.Task]:
+        async with MondayClient("key", transport=page_server(requests, 10)) as client:
+            items = client.items.iter_items("1", limit=5)
+            async for _ in items:
+                break
+            await items.aclose()
+            await asyncio.sleep(0.01)
+            assert not client._client._in_flight
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(asyncio.wait_for(run(), 5)) == set()
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_stopping_many_boards_early_leaves_no_task(*, stream: bool) -> None:
+    """Closing iter_boards_items stops the boards still being paginated."""
+    requests: list[dict] = []
+
+    async def run() -> set[asyncio.Task]:
+        async with MondayClient("key", transport=page_server(requests)) as client:
+            items = client.items.iter_boards_items(
+                ["1", "2", "3"],
+                limit=5,
+                stream=stream,
+            )
+            count = 0
+            async for _ in items:
+                count += 1
+                if count == 12:
+                    break
+            await items.aclose()
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(asyncio.wait_for(run(), 5)) == set()
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        "id column_values { id text }",
+        "id column_values{ id text } subitems { column_values { id } }",
+    ],
+)
+def test_column_restrictions_apply_to_the_selected_column_values(
+    fields: str,
+) -> None:
+    """The item's own column_values field receives the restrictions."""
+    rendered = _item_fields(fields, ["status"], None)
+
+    assert rendered["declarations"] == "$column_ids: [String!]"
+    assert rendered["fields"].count("column_values (ids: $column_ids)") == 1
+    assert rendered["fields"].count("column_values") == fields.count("column_values")
+
+
+def test_column_restrictions_conflict_with_column_values_arguments() -> None:
+    """Restricting a column_values field that has arguments is refused."""
+    fields = 'id column_values (ids: ["status"]) { id text }'
+
+    assert _item_fields(fields, None, None)["fields"] == fields
+    with pytest.raises(ArgumentError, match="column_values"):
+        _item_fields(fields, ["status"], None)
@@ -0,0 +1,103 @@
+"""Tests of DataLoader and of the loaders of the resources."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.monday import MondayClient
+from src.monday.graphql.loader import DataLoader
+
+MISSING = "404"
+
+
+class Source:
+    """A batch load function recording the batches it was called with."""
+
+    def __init__(self: "Source", error: Exception | None = None) -> None:
+        """Initialize a new instance of Source."""
+        self.batches: list[list[str]] = []
+        self.error = error
+
+    async def __call__(self: "Source", ids: list[str]) -> dict[str, dict]:
+        """Return a record for each id, except the missing one."""
+        self.batches.append(ids)
+        if self.error is not None:
+            raise self.error
+        return {id_: {"id": id_} for id_ in ids if id_ != MISSING}
+
+
+def test_loads_of_one_tick_are_batched() -> None:
+    """Loads made in the same loop iteration make one deduplicated call."""
+    source = Source()
+
+    async def run() -> list:
+        loader = DataLoader(source)
+        first = await asyncio.gather(*(loader.load(key) for key in (1, "2", 1)))
+        second = await loader.load_many(["2", "3", MISSING])
+        return [first, second]
+
+    first, second = asyncio.run(run())
+
+    assert first == [{"id": "1"}, {"id": "2"}, {"id": "1"}]
+    assert second == [{"id": "2"}, {"id": "3"}, None]
+    assert source.batches == [["1", "2"], ["3", MISSING]]
+
+
+def test_batches_are_split() -> None:
+    """A tick's keys are split into batches of max_batch_size."""
+    source = Source()
+
+    async def run() -> None:
+        await DataLoader(source, max_batch_size=2).load_many(range(5))
+
+    asyncio.run(run())
+
+    assert source.batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_failed_loads_raise_and_are_not_cached() -> None:
+    """Every load of a failed batch raises, and can be attempted again."""
+    source = Source(ValueError("Unavailable."))
+
+    async def run() -> dict | None:
+        loader = DataLoader(source)
+        results = await asyncio.gather(
+            loader.load(1),
+            loader.load(2),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        source.error = None
+        return await loader.load(1)
+
+    assert asyncio.run(run()) == {"id": "1"}
+    assert source.batches == [["1", "2"], ["1"]]
+
+
+@pytest.mark.parametrize("resource", ["boards", "users", "tags", "teams"])
+def test_resource_loaders_send_one_query_per_tick(resource: str) -> None:
+    """The loader of a resource resolves a tick's ids with one query."""
+    sent: list[dict] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        sent.append(payload)
+        ids = payload["variables"]["ids"]
+        records = [{"id": str(id_)} for id_ in ids if str(id_) != MISSING]
+        return httpx.Response(200, json={"data": {resource: records}})
+
+    async def run() -> list:
+        transport = httpx.MockTransport(handle)
+        async with MondayClient("key", transport=transport) as client:
+            loader = getattr(client, resource).loader()
+            return await asyncio.gather(
+                loader.load("1"),
+                loader.load(MISSING),
+                loader.load("1"),
+            )
+
+    assert asyncio.run(run()) == [{"id": "1"}, None, {"id": "1"}]
+    assert len(sent) == 1
+    assert sorted(map(str, sent[0]["variables"]["ids"])) == ["1", MISSING]
@@ -0,0 +1,56 @@
+"""Tests of the response models."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.monday import MondayClient
+from src.monday.models import ColumnValue, Item
+
+RECORD = {
+    "id": "1",
+    "name": "Task",
+    "column_values": [{"id": "status", "value": '{"index":1}'}],
+    "custom": 42,
+}
+
+
+def test_to_dict_returns_the_record() -> None:
+    """Fields missing from the record stay out of to_dict."""
+    item = Item.from_dict(RECORD)
+
+    assert item.state is None
+    assert item.column_values[0].value == {"index": 1}
+    assert item.to_dict() == RECORD
+    assert Item.from_dict(item.to_dict()) == item
+
+
+def test_json_fields_are_encoded_when_set() -> None:
+    """Values assigned to a JSON field are encoded as the API would send them."""
+    value = ColumnValue.from_dict({"id": "status"})
+    value.value = {"label": "Done"}
+
+    assert value.to_dict() == {"id": "status", "value": '{"label":"Done"}'}
+
+
+def test_unknown_attributes_raise() -> None:
+    """Only declared fields read as None when unset."""
+    with pytest.raises(AttributeError):
+        _ = Item.from_dict(RECORD).custom
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iter_items_builds_the_model(*, stream: bool) -> None:
+    """Items are built into the given model when paginated."""
+    boards = [{"items_page": {"cursor": None, "items": [RECORD]}}]
+    transport = httpx.MockTransport(
+        lambda _: httpx.Response(200, json={"data": {"boards": boards}}),
+    )
+
+    async def run() -> list:
+        async with MondayClient("key", transport=transport) as client:
+            items = client.items.iter_items("1", model=Item, stream=stream)
+            return [item async for item in items]
+
+    assert asyncio.run(run()) == [Item.from_dict(RECORD)]
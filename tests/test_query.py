@@ -0,0 +1,34 @@
+"""Tests of finding the operation of a GraphQL document."""
+
+import pytest
+
+from src.monday.graphql.client import _with_complexity, is_mutation
+from src.monday.graphql.query import operation_type
+
+DOCUMENTS = [
+    ("{ boards { id } }", "query"),
+    ("query Boards { boards { id } }", "query"),
+    ('mutation { create_item(item_name: "{") { id } }', "mutation"),
+    ("# mutation\nquery { me { id } }", "query"),
+    ("# A comment first\nmutation { archive_item(item_id: 1) { id } }", "mutation"),
+    ("fragment f on Item { id }\nmutation M { archive_item { ...f } }", "mutation"),
+    ('query ($x: JSON = {a: "}"}) { items { id } }', "query"),
+    ('mutation { create_update(body: """a "quoted" }""") { id } }', "mutation"),
+]
+
+
+@pytest.mark.parametrize(("document", "kind"), DOCUMENTS)
+def test_operation_type(document: str, kind: str) -> None:
+    """Comments, strings, fragments and default values are skipped."""
+    assert operation_type(document)[0] == kind
+    assert is_mutation(document) is (kind == "mutation")
+
+
+def test_complexity_goes_into_the_operation() -> None:
+    """The complexity field is added to the operation, not to a fragment."""
+    document = "fragment f on Item { id }\nquery { items { ...f } }"
+
+    assert _with_complexity(document) == (
+        "fragment f on Item { id }\nquery { _complexity: complexity "
+        "{ before after reset_in_x_seconds } items { ...f } }"
+    )
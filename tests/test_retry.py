@@ -0,0 +1,90 @@
+"""Tests of RetryPolicy."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.monday.exceptions import MondayComplexityError
+from src.monday.graphql.retry import RetryPolicy
+
+REQUEST = httpx.Request("POST", "https://api.monday.com/v2")
+
+
+def status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    """Return the error raised for a response with this status."""
+    response = httpx.Response(status, headers=headers, request=REQUEST)
+    return httpx.HTTPStatusError("Failed.", request=REQUEST, response=response)
+
+
+@pytest.mark.parametrize(
+    ("error", "query", "mutation"),
+    [
+        (httpx.ConnectError("Refused."), True, True),
+        (httpx.PoolTimeout("Busy."), True, True),
+        (status_error(429), True, True),
+        (MondayComplexityError("Budget exhausted.", 1.0), True, True),
+        (status_error(503), True, False),
+        (httpx.ReadTimeout("Slow."), True, False),
+        (status_error(400), False, False),
+        (ValueError("Bug."), False, False),
+    ],
+)
+def test_mutations_are_only_retried_when_unsent(
+    error: Exception,
+    *,
+    query: bool,
+    mutation: bool,
+) -> None:
+    """Mutations are replayed only when the API can't have executed them."""
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(error) is query
+    assert policy.is_retryable(error, mutation=True) is mutation
+    assert RetryPolicy(retry_mutations=True).is_retryable(error, mutation=True) is (
+        query
+    )
+
+
+def test_retry_after_in_seconds() -> None:
+    """Retry-After as a number of seconds is followed."""
+    policy = RetryPolicy(jitter=0)
+
+    assert policy.delay(1, status_error(429, {"Retry-After": "7"})) == 7
+
+
+def test_retry_after_as_a_date() -> None:
+    """Retry-After as an HTTP date is turned into the seconds left until then."""
+    policy = RetryPolicy(jitter=0)
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+    error = status_error(503, {"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+    assert 28 <= policy.delay(1, error) <= 30
+
+
+def test_suggested_delays_are_capped() -> None:
+    """A delay suggested by the API never exceeds backoff_max."""
+    policy = RetryPolicy(jitter=0, backoff_max=10)
+
+    assert policy.delay(1, status_error(429, {"Retry-After": "3600"})) == 10
+
+
+def test_jitter_stays_within_bounds() -> None:
+    """Jitter only shortens the exponential delay, by at most its fraction."""
+    policy = RetryPolicy(backoff_base=1, backoff_multiplier=2, jitter=0.5)
+    error = httpx.ConnectError("Refused.")
+
+    for attempt, full in ((1, 1), (2, 2), (3, 4)):
+        delays = [policy.delay(attempt, error) for _ in range(200)]
+        assert all(full * 0.5 <= delay <= full for delay in delays)
+    assert RetryPolicy(jitter=0).delay(2, error) == 1.0
+
+
+def test_jitter_of_suggested_delays_stays_within_bounds() -> None:
+    """Jitter only lengthens a suggested delay, by at most backoff_base."""
+    policy = RetryPolicy(backoff_base=0.5, jitter=1)
+    error = status_error(429, {"Retry-After": "7"})
+
+    delays = [policy.delay(1, error) for _ in range(200)]
+    assert all(7 <= delay <= 7.5 for delay in delays)
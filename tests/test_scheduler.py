@@ -0,0 +1,114 @@
+"""Tests of ComplexityScheduler, alone and as used by GraphQLClient."""
+
+import asyncio
+import json
+
+import httpx
+
+from src.monday.graphql.client import GraphQLClient
+from src.monday.graphql.scheduler import ComplexityScheduler
+
+
+def test_acquire_reserves_the_cost_when_the_budget_allows() -> None:
+    """A request the budget covers is sent at once, its cost set aside."""
+
+    async def run() -> None:
+        scheduler = ComplexityScheduler(limit=100)
+
+        assert await scheduler.acquire(30) == 30
+        budget = scheduler.budget
+        assert (budget.remaining, budget.in_flight, budget.queued) == (70, 30, 0)
+
+    asyncio.run(run())
+
+
+def test_acquire_waits_for_the_budget_to_reset() -> None:
+    """Once the budget is spent, requests are queued until it resets."""
+
+    async def run() -> None:
+        scheduler = ComplexityScheduler(limit=100)
+        scheduler.exhausted(reset_in=0.05)
+        waiting = asyncio.ensure_future(scheduler.acquire(10))
+        await asyncio.sleep(0.01)
+
+        assert not waiting.done()
+        assert scheduler.budget.queued == 1
+        assert await asyncio.wait_for(waiting, 1) == 10
+        assert scheduler.budget.remaining == 90
+
+    asyncio.run(run())
+
+
+def test_queued_requests_leave_by_priority() -> None:
+    """Higher priorities leave the queue first, then the earliest queued."""
+
+    async def run() -> list[str]:
+        scheduler = ComplexityScheduler(limit=100)
+        reserved = await scheduler.acquire(100)
+        order: list[str] = []
+
+        async def request(name: str, priority: int) -> None:
+            cost = await scheduler.acquire(40, priority=priority)
+            order.append(name)
+            scheduler.release(cost)
+
+        tasks = [
+            asyncio.ensure_future(request("low", 0)),
+            asyncio.ensure_future(request("first high", 5)),
+            asyncio.ensure_future(request("second high", 5)),
+        ]
+        await asyncio.sleep(0)
+        scheduler.release(reserved)
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["first high", "second high", "low"]
+
+
+def test_release_returns_the_unused_reservation() -> None:
+    """Releasing a reservation lets the requests queued behind it through."""
+
+    async def run() -> None:
+        scheduler = ComplexityScheduler(limit=100)
+        reserved = await scheduler.acquire(80)
+        waiting = asyncio.ensure_future(scheduler.acquire(50))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        scheduler.release(reserved, complexity={"before": 100, "after": 90})
+
+        assert await asyncio.wait_for(waiting, 1) == 50
+        budget = scheduler.budget
+        assert (budget.remaining, budget.in_flight) == (40, 50)
+
+    asyncio.run(run())
+
+
+def test_client_learns_costs_from_the_complexity_field() -> None:
+    """The client asks for the complexity field and learns from its answer."""
+    query = "query { boards { id } }"
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["query"])
+        complexity = {"before": 1000, "after": 700, "reset_in_x_seconds": 30}
+        data = {"boards": [], "_complexity": complexity}
+        return httpx.Response(200, json={"data": data})
+
+    async def run() -> tuple[dict, ComplexityScheduler]:
+        scheduler = ComplexityScheduler(limit=1000, default_cost=10)
+        client = GraphQLClient(
+            "https://api.monday.com/v2",
+            "key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+            scheduler=scheduler,
+        )
+        return await client.execute(query), scheduler
+
+    response, scheduler = asyncio.run(run())
+
+    assert "_complexity: complexity" in sent[0]
+    assert response["data"] == {"boards": []}
+    assert response["extensions"]["complexity"]["after"] == 700
+    assert scheduler.estimate(query) == 300
+    assert scheduler.budget.remaining == 700
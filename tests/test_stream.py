@@ -0,0 +1,50 @@
+"""Tests of decoding items pages while they are received."""
+
+import json
+import random
+
+import pytest
+
+from src.monday.exceptions import MondayError
+from src.monday.graphql.stream import PageStreamParser
+
+ITEMS = [
+    {"id": str(index), "name": f'"quoted" [{index}] {{braces}} \\ é'}
+    for index in range(20)
+]
+RESPONSE = {
+    "data": {"boards": [{"items_page": {"cursor": "next", "items": ITEMS}}]},
+    "extensions": {"complexity": {"before": 100, "after": 90}},
+}
+
+
+def test_parser_decodes_items_split_across_chunks() -> None:
+    """Items are decoded whole, wherever the chunks of the body are split."""
+    body = json.dumps(RESPONSE, ensure_ascii=False).encode()
+    chunks = random.Random(0)  # noqa: S311
+
+    for _ in range(20):
+        parser = PageStreamParser()
+        items = []
+        start = 0
+        while start < len(body):
+            end = start + chunks.randint(1, 32)
+            items.extend(parser.feed(body[start:end]))
+            start = end
+
+        assert items == ITEMS
+        assert parser.cursors == ["next"]
+        assert parser.close() == {
+            "data": {"boards": [{"items_page": {"cursor": "next", "items": []}}]},
+            "extensions": {"complexity": {"before": 100, "after": 90}},
+        }
+
+
+def test_parser_rejects_truncated_responses() -> None:
+    """A body ending within an item raises rather than dropping the item."""
+    body = json.dumps(RESPONSE).encode()
+    parser = PageStreamParser()
+    parser.feed(body[: len(body) // 2])
+
+    with pytest.raises(MondayError):
+        parser.close()
@@ -0,0 +1,51 @@
+"""Tests of the blocking client."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.monday import SyncMondayClient
+
+
+def board_server(threads: list[str]) -> httpx.MockTransport:
+    """Answer every query with one board, recording the thread it runs in."""
+
+    def handle(_: httpx.Request) -> httpx.Response:
+        threads.append(threading.current_thread().name)
+        return httpx.Response(200, json={"data": {"boards": [{"id": "1"}]}})
+
+    return httpx.MockTransport(handle)
+
+
+def test_calls_run_on_the_background_loop() -> None:
+    """Calls block until the loop thread has run them, and close stops it."""
+    threads: list[str] = []
+    client = SyncMondayClient("key", transport=board_server(threads))
+
+    response = client.boards.fetch_boards(ids=["1"])
+    thread = client._thread
+
+    assert response == {"data": {"boards": [{"id": "1"}]}}
+    assert threads == ["monday-sync"]
+    assert thread is not threading.current_thread()
+
+    client.close()
+
+    assert not thread.is_alive()
+    assert client._loop is None
+
+
+def test_calls_from_a_running_loop_raise() -> None:
+    """A call made from a coroutine fails instead of blocking its loop."""
+    threads: list[str] = []
+
+    async def run() -> None:
+        with SyncMondayClient("key", transport=board_server(threads)) as client:
+            with pytest.raises(RuntimeError, match="running event loop"):
+                client.boards.fetch_boards(ids=["1"])
+
+    asyncio.run(run())
+
+    assert threads == []
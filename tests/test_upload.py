@@ -0,0 +1,118 @@
+"""Tests of streaming files as multipart upload bodies."""
+
+import asyncio
+import email
+import io
+from collections.abc import AsyncIterator
+from email.message import Message
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.monday.graphql.upload import MultipartUpload, Upload
+
+CONTENT = bytes(range(256)) * 40
+
+
+class RecordingFile(io.BytesIO):
+    """A file object recording the size of each read."""
+
+    def __init__(self: "RecordingFile", content: bytes) -> None:
+        """Initialize a new instance of RecordingFile."""
+        super().__init__(content)
+        self.reads: list[int] = []
+
+    def read(self: "RecordingFile", size: int | None = -1) -> bytes:
+        """Record the size asked for, then read."""
+        self.reads.append(size)
+        return super().read(size)
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    """Return every chunk of an async iterator."""
+    return [chunk async for chunk in chunks]
+
+
+def parse(body: MultipartUpload, chunks: list[bytes]) -> list[Message]:
+    """Split a multipart body into its parts."""
+    head = f"Content-Type: {body.headers['Content-Type']}\r\n\r\n".encode()
+    message = email.message_from_bytes(head + b"".join(chunks))
+    return message.get_payload()
+
+
+@pytest.mark.parametrize("kind", ["bytes", "path", "file"])
+def test_body_is_framed_with_its_length(kind: str, tmp_path: Path) -> None:
+    """Every source gives the same parts, with an exact Content-Length."""
+    path = tmp_path / "report.bin"
+    path.write_bytes(CONTENT)
+    source = {
+        "bytes": CONTENT,
+        "path": path,
+        "file": io.BytesIO(CONTENT),
+    }[kind]
+    upload = Upload(source, filename="report.bin", chunk_size=1000)
+    body = MultipartUpload({"query": "mutation { id }", "map": "{}"}, upload)
+
+    chunks = asyncio.run(collect(aiter(body)))
+    parts = parse(body, chunks)
+
+    assert int(body.headers["Content-Length"]) == len(b"".join(chunks))
+    assert [part.get_param("name", header="Content-Disposition") for part in parts] == [
+        "query",
+        "map",
+        "variables[file]",
+    ]
+    assert parts[0].get_payload() == "mutation { id }"
+    assert parts[2].get_filename() == "report.bin"
+    assert parts[2].get_content_type() == "application/octet-stream"
+    assert parts[2].get_payload(decode=True) == CONTENT
+
+
+def test_files_are_streamed_in_chunks() -> None:
+    """A file is read chunk_size bytes at a time, reporting the progress."""
+    source = RecordingFile(CONTENT)
+    progress: list[tuple[int, int | None]] = []
+    upload = Upload(
+        source,
+        chunk_size=4096,
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+
+    chunks = asyncio.run(collect(upload.chunks()))
+
+    assert b"".join(chunks) == CONTENT
+    assert max(map(len, chunks)) == 4096
+    assert set(source.reads) == {4096}
+    assert progress == [(4096, 10240), (8192, 10240), (10240, 10240)]
+
+
+def test_seekable_sources_are_replayed() -> None:
+    """Seekable files are read again from where they started."""
+    source = io.BytesIO(b"skipped" + CONTENT)
+    source.seek(7)
+    upload = Upload(source)
+
+    first = asyncio.run(collect(upload.chunks()))
+    second = asyncio.run(collect(upload.chunks()))
+
+    assert upload.size == len(CONTENT)
+    assert b"".join(first) == b"".join(second) == CONTENT
+
+
+def test_iterators_have_no_length_and_are_sent_once() -> None:
+    """An async iterator of unknown size is streamed without Content-Length."""
+
+    async def generate() -> AsyncIterator[bytes]:
+        yield CONTENT[:10]
+        yield CONTENT[10:]
+
+    upload = Upload(generate())
+    body = MultipartUpload({}, upload)
+
+    chunks = asyncio.run(collect(aiter(body)))
+
+    assert "Content-Length" not in body.headers
+    assert parse(body, chunks)[0].get_payload(decode=True) == CONTENT
+    with pytest.raises(httpx.StreamConsumed):
+        asyncio.run(collect(upload.chunks()))